@@ -0,0 +1,52 @@
+"""
+Save/load throughput of each NexusRepository storage codec.
+
+Usage:
+    python benchmarks/bench_codecs.py [--nodes 10000] [--repeat 3]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from synthetic import generate_chain
+from chimera_nexus.storage.codecs import CODECS
+from chimera_nexus.storage.repository import NexusRepository
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    chain = generate_chain(args.nodes, name=f"Codec Benchmark {args.nodes}")
+    print(f"Chain: {len(chain.nodes)} nodes, {len(chain.edges)} edges")
+    print(f"{'codec':<8} {'size (KiB)':>11} {'save (s)':>9} {'load (s)':>9} {'save nodes/s':>13} {'load nodes/s':>13}")
+
+    for name in CODECS:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = NexusRepository(data_dir=tmp, format=name)
+            save_times, load_times = [], []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                path = repo.save_chain(chain)
+                save_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                repo.load_chain(chain.id)
+                load_times.append(time.perf_counter() - start)
+
+            save_s = statistics.median(save_times)
+            load_s = statistics.median(load_times)
+            size_kib = path.stat().st_size / 1024
+            print(
+                f"{name:<8} {size_kib:>11.1f} {save_s:>9.3f} {load_s:>9.3f} "
+                f"{args.nodes / save_s:>13,.0f} {args.nodes / load_s:>13,.0f}"
+            )
+
+if __name__ == "__main__":
+    main()
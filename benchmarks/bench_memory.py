@@ -0,0 +1,92 @@
+"""
+Resident memory of a chain's signals: dict of HybridNode vs. CompactNodeStore.
+
+Usage:
+    python benchmarks/bench_memory.py [--nodes 1000000] [--density 0.0]
+
+Each layout is built in a fresh interpreter and measured as the growth in
+RSS over the interpreter's baseline. The default density of 0 leaves out
+links (still pydantic objects in both layouts) so the figure isolates node
+storage; pass --density 1.0 for a realistic linked chain. RSS is read from
+/proc, so this benchmark runs on Linux only.
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+# Sizes in pages; the second field is the resident set
+STATM_PATH = Path("/proc/self/statm")
+
+def current_rss_mib() -> float:
+    try:
+        with open(STATM_PATH) as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        raise RuntimeError(f"Cannot read {STATM_PATH}: measuring RSS needs Linux's /proc.")
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+def measure(nodes: int, density: float, compact: bool) -> dict:
+    from synthetic import generate_chain
+
+    gc.collect()
+    before = current_rss_mib()
+    start = time.perf_counter()
+    chain = generate_chain(nodes, edge_density=density, compact=compact)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    used = current_rss_mib() - before
+
+    start = time.perf_counter()
+    payload = chain.model_dump_json()
+    dump_seconds = time.perf_counter() - start
+    return {
+        "layout": "compact" if compact else "dict",
+        "nodes": len(chain.nodes),
+        "edges": len(chain.edges),
+        "rss_mib": round(used, 1),
+        "bytes_per_node": round(used * 2**20 / max(1, len(chain.nodes))),
+        "build_seconds": round(elapsed, 2),
+        "dump_json_seconds": round(dump_seconds, 2),
+        "json_bytes": len(payload)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--density", type=float, default=0.0, help="Links per signal")
+    parser.add_argument("--worker", choices=["dict", "compact"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if not STATM_PATH.exists():
+        parser.error(f"{STATM_PATH} is missing: this benchmark reads RSS from /proc and only runs on Linux.")
+
+    if args.worker:
+        print(json.dumps(measure(args.nodes, args.density, args.worker == "compact")))
+        return
+
+    results = []
+    for layout in ("dict", "compact"):
+        command = [sys.executable, __file__, "--worker", layout, "--nodes", str(args.nodes), "--density", str(args.density)]
+        proc = subprocess.run(command, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{layout}: failed ({(proc.stderr.strip().splitlines() or [proc.returncode])[-1]})")
+            continue
+        results.append(json.loads(proc.stdout))
+
+    print(f"{'layout':<8} {'nodes':>10} {'edges':>10} {'RSS (MiB)':>10} {'B/node':>8} {'build (s)':>10} {'dump (s)':>9}")
+    for r in results:
+        print(f"{r['layout']:<8} {r['nodes']:>10,} {r['edges']:>10,} {r['rss_mib']:>10.1f} "
+              f"{r['bytes_per_node']:>8,} {r['build_seconds']:>10.2f} {r['dump_json_seconds']:>9.2f}")
+    if len(results) == 2 and results[1]["rss_mib"] > 0:
+        same = results[0]["json_bytes"] == results[1]["json_bytes"]
+        print(f"\nReduction: {results[0]['rss_mib'] / results[1]['rss_mib']:.1f}x (serialized size identical: {same})")
+
+if __name__ == "__main__":
+    main()
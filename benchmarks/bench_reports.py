@@ -0,0 +1,82 @@
+"""
+Time and peak memory of string-building vs streaming report export.
+
+Usage:
+    python benchmarks/bench_reports.py [--nodes 100000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from synthetic import generate_chain
+from chimera_nexus.analysis.auditor import CognitiveAuditor
+from chimera_nexus.reporting.engine import ReportEngine
+
+def measure(func):
+    """
+    Returns (seconds, peak traced bytes). Timing runs without tracemalloc,
+    which would otherwise slow allocation-heavy code several-fold.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    chain = generate_chain(args.nodes)
+    findings = CognitiveAuditor().audit(chain)
+    engine = ReportEngine()
+    stamp = datetime(2024, 1, 1)
+    print(f"Chain: {len(chain.nodes)} nodes, {len(chain.edges)} edges")
+    print(f"{'artifact':<10} {'mode':<8} {'time (s)':>9} {'peak (MiB)':>11} {'size (MiB)':>11}")
+
+    artifacts = {
+        "markdown": (
+            lambda: engine.generate_markdown_report(chain, findings, stamp),
+            lambda fp: engine.write_markdown_report(chain, findings, fp, stamp)
+        ),
+        "dot": (
+            lambda: engine.generate_graphviz_dot(chain),
+            lambda fp: engine.write_graphviz_dot(chain, fp)
+        )
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (generate, write) in artifacts.items():
+            path = os.path.join(tmp, name)
+
+            def build_then_write():
+                content = generate()
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+
+            def stream():
+                with open(path, "w", encoding="utf-8") as f:
+                    write(f)
+
+            for mode, func in (("string", build_then_write), ("stream", stream)):
+                seconds, peak = measure(func)
+                size = os.path.getsize(path)
+                print(f"{name:<10} {mode:<8} {seconds:>9.3f} {peak / 2**20:>11.1f} {size / 2**20:>11.1f}")
+
+if __name__ == "__main__":
+    main()
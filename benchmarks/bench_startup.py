@@ -0,0 +1,60 @@
+"""
+Cold-start wall time of `nexus` commands, each in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 7] [--chains 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+CLI = [sys.executable, "-m", "chimera_nexus.cli.main"]
+
+def run(args, env) -> float:
+    start = time.perf_counter()
+    subprocess.run(CLI + args, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--chains", type=int, default=20, help="Scenario chains seeded into the registry")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, NEXUS_DATA_DIR=tmp, PYTHONPATH=str(ROOT), COLUMNS="120")
+        for _ in range(args.chains):
+            run(["simulate-scenario"], env)
+        chain_id = next(p.stem for p in (Path(tmp) / "chains").iterdir())
+
+        commands = [
+            ["--help"],
+            ["list", "--help"],
+            ["list"],
+            ["stats"],
+            ["inspect", chain_id],
+            ["audit", chain_id],
+            ["export", chain_id, "--format", "dot", "-o", os.path.join(tmp, "out.dot")],
+        ]
+        print(f"{'command':<24} {'min (ms)':>9} {'median (ms)':>12}")
+        # Bare interpreter start, for reference
+        baseline = [run_python(env) for _ in range(args.repeat)]
+        print(f"{'(python -c pass)':<24} {min(baseline) * 1000:>9.1f} {statistics.median(baseline) * 1000:>12.1f}")
+        for command in commands:
+            times = [run(command, env) for _ in range(args.repeat)]
+            label = " ".join(command[:2]) if command[0] != "export" else "export --format dot"
+            print(f"{label[:24]:<24} {min(times) * 1000:>9.1f} {statistics.median(times) * 1000:>12.1f}")
+
+def run_python(env) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], env=env, check=True)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    main()
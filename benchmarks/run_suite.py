@@ -0,0 +1,201 @@
+"""
+Benchmark suite: storage, audit and report timings at several chain sizes.
+
+Usage:
+    python benchmarks/run_suite.py [--scales 100,10000,1000000] [--format json]
+        [--density 1.0] [--seed 7] [--repeat 3]
+        [--save-baseline NAME] [--compare NAME] [--max-regression 0.25]
+
+Each scale runs in its own interpreter, so the reported peak RSS belongs to
+that scale alone and an out-of-memory failure at 10^6 does not abort the
+smaller ones. Timings are the best of --repeat runs (scales up to 10^4;
+larger scales run once). Baselines are stored as JSON under
+benchmarks/baselines/ and are only comparable on the same machine. Peak RSS
+needs the Unix `resource` module and is reported as n/a elsewhere.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows: timings still run, peak RSS is not reported
+    resource = None
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+BASELINE_DIR = BENCH_DIR / "baselines"
+
+sys.path.insert(0, str(ROOT))
+
+# Operations faster than this are dominated by noise and never flagged
+NOISE_FLOOR_SECONDS = 0.005
+REPEAT_LIMIT_SCALE = 10_000
+
+OPERATIONS = ["generate", "save_chain", "load_chain", "list_chains", "list_summaries", "audit", "markdown", "dot"]
+
+def peak_rss_mib() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+def run_scale(scale: int, fmt, density: float, seed: int, repeat: int, emit) -> None:
+    """
+    Runs every operation at one scale in this process, passing
+    (operation, {"seconds": best, "peak_rss_mib": high-water mark so far})
+    to `emit` as each one completes.
+    """
+    from synthetic import generate_chain
+    from chimera_nexus.analysis.auditor import CognitiveAuditor
+    from chimera_nexus.reporting.engine import ReportEngine
+    from chimera_nexus.storage.repository import NexusRepository
+
+    repeat = repeat if scale <= REPEAT_LIMIT_SCALE else 1
+
+    def measure(name, func):
+        best, value = None, None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        emit(name, {"seconds": best, "peak_rss_mib": peak_rss_mib()})
+        return value
+
+    chain = measure("generate", lambda: generate_chain(scale, seed=seed, edge_density=density))
+    emit("_chain", {"nodes": len(chain.nodes), "edges": len(chain.edges)})
+    engine = ReportEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = NexusRepository(data_dir=tmp, format=fmt)
+        measure("save_chain", lambda: repo.save_chain(chain))
+        measure("load_chain", lambda: repo.load_chain(chain.id))
+        measure("list_chains", repo.list_chains)
+        measure("list_summaries", repo.list_summaries)
+        findings = measure("audit", lambda: CognitiveAuditor().audit(chain))
+        with open(os.devnull, "w", encoding="utf-8") as sink:
+            measure("markdown", lambda: engine.write_markdown_report(chain, findings, sink))
+            measure("dot", lambda: engine.write_graphviz_dot(chain, sink))
+
+def emit_line(name: str, entry: dict) -> None:
+    # One JSON line per operation, flushed, so results survive a worker that is later killed
+    print(json.dumps({name: entry}), flush=True)
+
+def run_suite(args) -> dict:
+    suite = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "format": args.format or "default",
+            "density": args.density,
+            "seed": args.seed
+        },
+        "results": {}
+    }
+    for scale in args.scales:
+        command = [
+            sys.executable, __file__, "--worker", str(scale),
+            "--density", str(args.density), "--seed", str(args.seed), "--repeat", str(args.repeat)
+        ]
+        if args.format:
+            command += ["--format", args.format]
+        print(f"Running scale {scale:,} ...", file=sys.stderr, flush=True)
+        proc = subprocess.run(command, capture_output=True, text=True)
+        ops = {}
+        for line in proc.stdout.splitlines():
+            ops.update(json.loads(line))
+        if proc.returncode != 0:
+            ops["_error"] = (proc.stderr.strip().splitlines() or [f"exit code {proc.returncode}"])[-1]
+        suite["results"][str(scale)] = ops
+    return suite
+
+def print_results(suite: dict, baseline=None) -> list:
+    """
+    Prints one table per scale; returns the (scale, operation, ratio) regressions.
+    """
+    regressions = []
+    for scale, ops in suite["results"].items():
+        shape = ops.get("_chain", {"nodes": int(scale), "edges": 0})
+        print(f"\n== {shape['nodes']:,} nodes, {shape['edges']:,} edges")
+        if "_error" in ops:
+            print(f"FAILED after {sum(name in ops for name in OPERATIONS)} operation(s): {ops['_error']}")
+        header = f"{'operation':<16} {'time (s)':>10} {'nodes/s':>12} {'peak RSS (MiB)':>15}"
+        if baseline:
+            header += f" {'baseline (s)':>13} {'ratio':>7}"
+        print(header)
+
+        base_ops = (baseline or {}).get("results", {}).get(scale, {})
+        for name in OPERATIONS:
+            entry = ops.get(name)
+            if entry is None:
+                continue
+            seconds = entry["seconds"]
+            rate = shape["nodes"] / seconds if seconds > 0 else float("inf")
+            peak = "n/a" if entry["peak_rss_mib"] is None else f"{entry['peak_rss_mib']:.1f}"
+            line = f"{name:<16} {seconds:>10.4f} {rate:>12,.0f} {peak:>15}"
+            base = base_ops.get(name)
+            if baseline and base:
+                ratio = seconds / base["seconds"] if base["seconds"] > 0 else 1.0
+                flag = ""
+                if ratio > 1 + suite["max_regression"] and max(seconds, base["seconds"]) > NOISE_FLOOR_SECONDS:
+                    regressions.append((scale, name, ratio))
+                    flag = "  << REGRESSION"
+                line += f" {base['seconds']:>13.4f} {ratio:>6.2f}x{flag}"
+            print(line)
+    return regressions
+
+def parse_scales(text: str):
+    return [int(float(s)) for s in text.split(",") if s.strip()]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=parse_scales, default=[100, 10_000, 1_000_000])
+    parser.add_argument("--format", default=None, help="Storage codec (default: the repository default)")
+    parser.add_argument("--density", type=float, default=1.0, help="Links per signal")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="NAME")
+    parser.add_argument("--compare", metavar="NAME", help="Baseline to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed slowdown vs. baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        run_scale(args.worker, args.format, args.density, args.seed, args.repeat, emit_line)
+        return
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads((BASELINE_DIR / f"{args.compare}.json").read_text(encoding="utf-8"))
+
+    suite = run_suite(args)
+    suite["max_regression"] = args.max_regression
+    regressions = print_results(suite, baseline)
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        path = BASELINE_DIR / f"{args.save_baseline}.json"
+        stored = {k: v for k, v in suite.items() if k != "max_regression"}
+        path.write_text(json.dumps(stored, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline saved to {path}")
+
+    if regressions:
+        print(f"\n{len(regressions)} operation(s) regressed beyond {args.max_regression:.0%}:")
+        for scale, name, ratio in regressions:
+            print(f"  {name} @ {int(scale):,}: {ratio:.2f}x")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
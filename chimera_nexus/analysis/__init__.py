@@ -1,3 +1,30 @@
-from .auditor import CognitiveAuditor, AuditFinding, BiasType
+from .auditor import (
+    CognitiveAuditor,
+    AuditFinding,
+    BiasType,
+    AuditRule,
+    ChainStatistics,
+    EchoChamberRule,
+    register_rule
+)
+from .columnar import RegistrySnapshot, DomainDistribution, ChainColumns, chain_columns
+from .audit_cache import AuditCache, audit_with_digest
+from .graph import ChainGraph, CausalPath
 
-__all__ = ["CognitiveAuditor", "AuditFinding", "BiasType"]
\ No newline at end of file
+__all__ = [
+    "CognitiveAuditor",
+    "AuditFinding",
+    "BiasType",
+    "AuditRule",
+    "ChainStatistics",
+    "EchoChamberRule",
+    "register_rule",
+    "RegistrySnapshot",
+    "DomainDistribution",
+    "ChainColumns",
+    "chain_columns",
+    "AuditCache",
+    "audit_with_digest",
+    "ChainGraph",
+    "CausalPath"
+]
\ No newline at end of file
@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from chimera_nexus.core.domain import HybridThreatChain
+from chimera_nexus.analysis.auditor import AuditFinding, CognitiveAuditor
+
+def audit_with_digest(chain: HybridThreatChain) -> Tuple[str, List[AuditFinding]]:
+    """
+    Worker-side unit of a registry audit: returns the cache key material with the findings.
+    """
+    return chain.content_digest(), CognitiveAuditor().audit(chain)
+
+class AuditCache:
+    """
+    Persisted audit findings, one file per chain.
+    An entry is valid only for the exact node/edge content it was computed
+    from and the auditor rule-set version that produced it, so edits or rule
+    changes are never masked by stale findings.
+    """
+    def __init__(
+        self,
+        directory: Path,
+        auditor: Optional[CognitiveAuditor] = None,
+        ruleset_version: Optional[str] = None
+    ):
+        self.directory = directory
+        self.auditor = auditor or CognitiveAuditor()
+        self.ruleset_version = ruleset_version or self.auditor.ruleset_version
+
+    def _path(self, chain_id: UUID) -> Path:
+        return self.directory / f"{chain_id}.json"
+
+    def _key(self, digest: str) -> str:
+        return f"{self.ruleset_version}:{digest}"
+
+    def get(self, chain_id: UUID, digest: str) -> Optional[List[AuditFinding]]:
+        try:
+            with open(self._path(chain_id), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get("key") != self._key(digest):
+                return None
+            return [AuditFinding.model_validate(item) for item in entry["findings"]]
+        except (OSError, ValueError, KeyError, ValidationError):
+            return None # Missing or unreadable entries are plain cache misses
+
+    def put(self, chain_id: UUID, digest: str, findings: List[AuditFinding]) -> None:
+        path = self._path(chain_id)
+        temp_path = path.with_suffix('.tmp')
+        entry = {
+            "key": self._key(digest),
+            "findings": [f.model_dump(mode='json') for f in findings]
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            temp_path.replace(path)
+        except OSError:
+            # Caching is an optimization; a failed write only costs a future recompute
+            if temp_path.exists():
+                os.remove(temp_path)
+
+    def audit(self, chain: HybridThreatChain) -> List[AuditFinding]:
+        """
+        Cached findings for the chain's current content, computing them on a miss.
+        """
+        digest = chain.content_digest()
+        findings = self.get(chain.id, digest)
+        if findings is None:
+            findings = self.auditor.audit(chain)
+            self.put(chain.id, digest, findings)
+        return findings
@@ -1,7 +1,11 @@
+import time
+from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Tuple
 from pydantic import BaseModel, Field
 from chimera_nexus.core.domain import HybridThreatChain, ThreatDomain, ConfidenceLevel
+from chimera_nexus.analysis.graph import ChainGraph
+from chimera_nexus.core.instrumentation import span, traced
 
 class BiasType(str, Enum):
     MONO_DOMAIN_FIXATION = "mono_domain_fixation"  # Analyzing only Cyber, ignoring Info/Econ
@@ -18,57 +22,234 @@ class AuditFinding(BaseModel):
     description: str
     remediation_hint: str
 
-class CognitiveAuditor:
+# --- Shared Statistics Pass ---
+
+# Signals at or below this normalized cost are cheap for an actor to fabricate
+LOW_COST_THRESHOLD = 0.2
+
+class ChainStatistics(BaseModel):
     """
-    The 'Red Team' algorithm. 
-    It critiques the analyst's work to prevent bad decisions.
+    Everything the audit rules need, gathered in one pass over nodes and edges.
     """
-    
-    def audit(self, chain: HybridThreatChain) -> List[AuditFinding]:
-        findings = []
-        
-        # 1. Check for Mono-Domain Fixation (Tunnel Vision)
+    node_count: int
+    edge_count: int
+    domain_histogram: Dict[ThreatDomain, int]
+    confidence_mean: float
+    confidence_variance: float
+    confidence_min: float
+    confidence_max: float
+    cost_mean: float
+    cost_max: float
+    low_cost_count: int
+    linked_node_count: int
+    component_count: int
+
+    @classmethod
+    def from_chain(cls, chain: HybridThreatChain) -> "ChainStatistics":
+        n = len(chain.nodes)
+        conf_sum = conf_sq_sum = cost_sum = 0.0
+        conf_min, conf_max, cost_max = 1.0, 0.0, 0.0
+        low_cost = 0
+        for node in chain.nodes.values():
+            c = node.confidence
+            conf_sum += c
+            conf_sq_sum += c * c
+            conf_min = min(conf_min, c)
+            conf_max = max(conf_max, c)
+            cost_sum += node.cost_estimate
+            cost_max = max(cost_max, node.cost_estimate)
+            if node.cost_estimate <= LOW_COST_THRESHOLD:
+                low_cost += 1
+
+        linked = set()
+        for edge in chain.edges:
+            linked.add(edge.source_id)
+            linked.add(edge.target_id)
+        # Dangling endpoints (unvalidated hand edits) are not signals of this chain
+        linked.intersection_update(chain.nodes)
+
+        mean = conf_sum / n if n else 0.0
+        return cls(
+            node_count=n,
+            edge_count=len(chain.edges),
+            domain_histogram=chain.domain_counts,
+            confidence_mean=mean,
+            confidence_variance=max(0.0, conf_sq_sum / n - mean * mean) if n else 0.0,
+            confidence_min=conf_min if n else 0.0,
+            confidence_max=conf_max,
+            cost_mean=cost_sum / n if n else 0.0,
+            cost_max=cost_max,
+            low_cost_count=low_cost,
+            linked_node_count=len(linked),
+            component_count=ChainGraph.from_chain(chain).weak_component_count() if chain.edges else n
+        )
+
+    @property
+    def dominant_domain(self) -> Optional[Tuple[ThreatDomain, int]]:
+        if not self.domain_histogram:
+            return None
+        return max(self.domain_histogram.items(), key=lambda item: item[1])
+
+# --- Rules ---
+
+class AuditRule(ABC):
+    """
+    One bias check. Rules read the shared ChainStatistics rather than walking
+    the chain themselves; `chain` is passed for rules that need more detail.
+    Bump `version` whenever the rule's logic changes.
+    """
+    name = ""
+    version = "1"
+
+    @abstractmethod
+    def evaluate(self, stats: ChainStatistics, chain: HybridThreatChain) -> Optional[AuditFinding]:
+        ...
+
+class MonoDomainFixationRule(AuditRule):
+    name = "mono_domain_fixation"
+
+    def evaluate(self, stats: ChainStatistics, chain: HybridThreatChain) -> Optional[AuditFinding]:
         # If > 75% of nodes are in a single domain, the analyst might be missing the "Hybrid" aspect.
-        if chain.nodes:
-            domains = [n.domain for n in chain.nodes.values()]
-            most_common = max(set(domains), key=domains.count)
-            count = domains.count(most_common)
-            ratio = count / len(domains)
-            
-            if ratio > 0.75 and len(chain.nodes) > 3:
-                findings.append(AuditFinding(
-                    bias_type=BiasType.MONO_DOMAIN_FIXATION,
-                    severity=0.8 * ratio,
-                    description=f"Analysis is heavily skewed ({ratio:.0%}) towards {most_common.value.upper()}.",
-                    remediation_hint="Force-collect signals from at least one adjacent domain (e.g., Economic or Social)."
-                ))
-
-        # 2. Check for Premature Closure
+        dominant = stats.dominant_domain
+        if dominant is None:
+            return None
+        most_common, count = dominant
+        ratio = count / stats.node_count
+
+        if ratio > 0.75 and stats.node_count > 3:
+            return AuditFinding(
+                bias_type=BiasType.MONO_DOMAIN_FIXATION,
+                severity=0.8 * ratio,
+                description=f"Analysis is heavily skewed ({ratio:.0%}) towards {most_common.value.upper()}.",
+                remediation_hint="Force-collect signals from at least one adjacent domain (e.g., Economic or Social)."
+            )
+        return None
+
+class PrematureClosureRule(AuditRule):
+    name = "premature_closure"
+
+    def evaluate(self, stats: ChainStatistics, chain: HybridThreatChain) -> Optional[AuditFinding]:
         # High confidence claimed with very few nodes implies overconfidence.
-        avg_conf = 0.0
-        if chain.nodes:
-            avg_conf = sum(n.confidence for n in chain.nodes.values()) / len(chain.nodes)
-            
-        if avg_conf > 0.8 and len(chain.nodes) < 4:
-            findings.append(AuditFinding(
+        if stats.confidence_mean > 0.8 and stats.node_count < 4:
+            return AuditFinding(
                 bias_type=BiasType.PREMATURE_CLOSURE,
                 severity=0.7,
                 description="High aggregate confidence claimed with sparse data points.",
                 remediation_hint="Reduce confidence or corroborate with independent sources."
-            ))
+            )
+        return None
+
+class DisconnectedNarrativeRule(AuditRule):
+    name = "disconnected_narrative"
+    version = "2"
 
-        # 3. Disconnected Narrative
+    def evaluate(self, stats: ChainStatistics, chain: HybridThreatChain) -> Optional[AuditFinding]:
         # Nodes exist but aren't linked. This is a list, not a chain.
-        if len(chain.nodes) > 2:
-            # Simple check: do we have enough edges to connect most nodes?
-            # A fully connected linear chain of N nodes needs N-1 edges.
-            needed_edges = len(chain.nodes) - 1
-            if len(chain.edges) < needed_edges * 0.5:
-                findings.append(AuditFinding(
+        # A fully connected linear chain of N nodes needs N-1 edges.
+        if stats.node_count > 2:
+            needed_edges = stats.node_count - 1
+            if stats.edge_count < needed_edges * 0.5:
+                return AuditFinding(
                     bias_type=BiasType.DISCONNECTED_NARRATIVE,
                     severity=0.6,
                     description="Signals are isolated. Causal logic is missing.",
                     remediation_hint="Use the 'link' command to define how Signal A causes/relates to Signal B."
-                ))
+                )
+            # Enough edges overall, but they may all sit inside one cluster
+            if stats.component_count > 1:
+                return AuditFinding(
+                    bias_type=BiasType.DISCONNECTED_NARRATIVE,
+                    severity=0.4,
+                    description=f"Signals form {stats.component_count} disconnected fragments; "
+                                f"{stats.node_count - stats.linked_node_count} have no links at all.",
+                    remediation_hint="Link the fragments or split them into separate chains."
+                )
+        return None
+
+class EchoChamberRule(AuditRule):
+    """
+    Opt-in: only meaningful where analysts record `cost_estimate`, since
+    unrecorded costs default to 0.0 and would read as cheap signals.
+    """
+    name = "echo_chamber"
+
+    def evaluate(self, stats: ChainStatistics, chain: HybridThreatChain) -> Optional[AuditFinding]:
+        # Confidence resting entirely on signals that are cheap to fabricate.
+        if stats.node_count >= 3 and stats.confidence_mean > 0.75 and stats.low_cost_count == stats.node_count:
+            return AuditFinding(
+                bias_type=BiasType.ECHO_CHAMBER,
+                severity=round(min(1.0, stats.confidence_mean), 2),
+                description=f"Confidence averages {stats.confidence_mean:.0%} but every signal is low-cost (<= {LOW_COST_THRESHOLD}).",
+                remediation_hint="Seek at least one costly, hard-to-fake signal before relying on this assessment."
+            )
+        return None
+
+DEFAULT_RULES: List[AuditRule] = [
+    MonoDomainFixationRule(),
+    PrematureClosureRule(),
+    DisconnectedNarrativeRule()
+]
+
+def register_rule(rule: AuditRule) -> None:
+    """
+    Adds a rule to the defaults used by every CognitiveAuditor created afterwards.
+    Register at import time so worker processes of parallel audits see it too.
+    """
+    if any(r.name == rule.name for r in DEFAULT_RULES):
+        raise ValueError(f"An audit rule named '{rule.name}' is already registered.")
+    DEFAULT_RULES.append(rule)
+
+class RuleTiming(BaseModel):
+    calls: int = 0
+    total_seconds: float = 0.0
+
+class CognitiveAuditor:
+    """
+    The 'Red Team' algorithm.
+    It critiques the analyst's work to prevent bad decisions.
+
+    Runs a registry of AuditRule objects over one shared ChainStatistics pass
+    and records per-rule timing so slow rules are visible.
+    """
+    # Bump whenever the engine's shared logic changes so cached findings are recomputed
+    RULESET_VERSION = "2"
+
+    def __init__(self, rules: Optional[Sequence[AuditRule]] = None):
+        self.rules: List[AuditRule] = list(DEFAULT_RULES if rules is None else rules)
+        self.timings: Dict[str, RuleTiming] = {}
+
+    def register(self, rule: AuditRule) -> None:
+        if any(r.name == rule.name for r in self.rules):
+            raise ValueError(f"An audit rule named '{rule.name}' is already registered.")
+        self.rules.append(rule)
+
+    @property
+    def ruleset_version(self) -> str:
+        """
+        Identifies the engine version plus the exact rules (and their versions) in use.
+        """
+        rules = ",".join(f"{r.name}@{r.version}" for r in self.rules)
+        return f"{self.RULESET_VERSION}:{rules}"
+
+    def _record(self, name: str, started: float) -> None:
+        timing = self.timings.setdefault(name, RuleTiming())
+        timing.calls += 1
+        timing.total_seconds += time.perf_counter() - started
+
+    @traced("audit")
+    def audit(self, chain: HybridThreatChain) -> List[AuditFinding]:
+        started = time.perf_counter()
+        with span("audit.statistics"):
+            stats = ChainStatistics.from_chain(chain)
+        self._record("statistics", started)
+
+        findings = []
+        for rule in self.rules:
+            started = time.perf_counter()
+            with span("audit.rule." + rule.name):
+                finding = rule.evaluate(stats, chain)
+            self._record(rule.name, started)
+            if finding is not None:
+                findings.append(finding)
 
-        return findings
\ No newline at end of file
+        return findings
@@ -0,0 +1,246 @@
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+from chimera_nexus.core.domain import HybridThreatChain, ThreatDomain
+
+try:
+    import numpy as np
+except ImportError:  # Optional accelerator (`pip install chimera-nexus[analytics]`)
+    np = None
+
+DOMAINS: List[ThreatDomain] = list(ThreatDomain)
+_DOMAIN_CODES = {domain: code for code, domain in enumerate(DOMAINS)}
+_VALUE_CODES = {domain.value: code for code, domain in enumerate(DOMAINS)}
+
+# (node counts, confidence sums, edge counts, weight sums), indexed by chain row
+ChainTotals = Tuple[Sequence[float], Sequence[float], Sequence[float], Sequence[float]]
+
+class ChainColumns(NamedTuple):
+    """
+    One chain's contribution to a RegistrySnapshot, compact enough to send
+    back from a loader worker.
+    """
+    chain_id: UUID
+    name: str
+    node_domain: array
+    node_confidence: array
+    edge_weight: array
+
+def chain_columns(data: Dict[str, Any]) -> ChainColumns:
+    """
+    Columns straight from a chain's JSON-mode dict (see
+    NexusRepository.map_chains with `payload`), without building models.
+    Module-level so loader workers can run it.
+    """
+    nodes = data["nodes"].values()
+    codes = _VALUE_CODES
+    return ChainColumns(
+        UUID(data["id"]),
+        data["name"],
+        array('B', [codes[n["domain"]] for n in nodes]),
+        array('d', [n["confidence"] for n in nodes]),
+        array('d', [e["weight"] for e in data["edges"]])
+    )
+
+class DomainDistribution(NamedTuple):
+    """
+    Confidence distribution of every signal in one domain across the registry.
+    `histogram` counts confidences in equal-width bins over [0, 1].
+    """
+    domain: ThreatDomain
+    count: int
+    mean_confidence: float
+    min_confidence: float
+    max_confidence: float
+    histogram: List[int]
+
+class RegistrySnapshot:
+    """
+    Columnar (structure-of-arrays) view of a set of chains.
+
+    Nodes and edges of all chains are flattened into typed arrays tagged with
+    their chain's row number, so registry-wide metrics are computed in a
+    single pass over contiguous memory instead of per pydantic object.
+    The columns are `array.array` buffers: with NumPy installed they are
+    viewed zero-copy via `np.frombuffer` and reduced with `bincount`;
+    otherwise a pure-Python pass over the same arrays is used.
+    Figures match HybridThreatChain's formulas but are left unrounded.
+    """
+    def __init__(self):
+        self.chain_ids: List[UUID] = []
+        self.chain_names: List[str] = []
+        self.node_chain = array('q')
+        self.node_confidence = array('d')
+        self.node_domain = array('B')
+        self.edge_chain = array('q')
+        self.edge_weight = array('d')
+        self._totals: Optional[ChainTotals] = None
+
+    @classmethod
+    def from_chains(cls, chains: Iterable[HybridThreatChain]) -> "RegistrySnapshot":
+        snapshot = cls()
+        for chain in chains:
+            snapshot.append(chain)
+        return snapshot
+
+    @classmethod
+    def from_columns(cls, columns: Iterable[ChainColumns]) -> "RegistrySnapshot":
+        snapshot = cls()
+        for chain_columns in columns:
+            snapshot.append_columns(chain_columns)
+        return snapshot
+
+    def append_columns(self, columns: ChainColumns) -> None:
+        row = len(self.chain_ids)
+        self._totals = None
+        self.chain_ids.append(columns.chain_id)
+        self.chain_names.append(columns.name)
+        self.node_chain.extend([row] * len(columns.node_confidence))
+        self.node_confidence.extend(columns.node_confidence)
+        self.node_domain.extend(columns.node_domain)
+        self.edge_chain.extend([row] * len(columns.edge_weight))
+        self.edge_weight.extend(columns.edge_weight)
+
+    def append(self, chain: HybridThreatChain) -> None:
+        row = len(self.chain_ids)
+        self._totals = None
+        self.chain_ids.append(chain.id)
+        self.chain_names.append(chain.name)
+
+        nodes = chain.nodes.values()
+        self.node_chain.extend([row] * len(nodes))
+        self.node_confidence.extend(n.confidence for n in nodes)
+        self.node_domain.extend(_DOMAIN_CODES[n.domain] for n in nodes)
+
+        self.edge_chain.extend([row] * len(chain.edges))
+        self.edge_weight.extend(e.weight for e in chain.edges)
+
+    @property
+    def chain_count(self) -> int:
+        return len(self.chain_ids)
+
+    # --- Per-chain reductions ---
+
+    def _chain_totals(self) -> ChainTotals:
+        """
+        Single pass over the node and edge columns, shared by every per-chain metric.
+        """
+        if self._totals is None:
+            self._totals = self._compute_totals()
+        return self._totals
+
+    def _compute_totals(self) -> ChainTotals:
+        rows = self.chain_count
+        if np is not None:
+            node_chain = np.frombuffer(self.node_chain, dtype=np.int64)
+            edge_chain = np.frombuffer(self.edge_chain, dtype=np.int64)
+            return (
+                np.bincount(node_chain, minlength=rows),
+                np.bincount(node_chain, weights=np.frombuffer(self.node_confidence), minlength=rows),
+                np.bincount(edge_chain, minlength=rows),
+                np.bincount(edge_chain, weights=np.frombuffer(self.edge_weight), minlength=rows)
+            )
+
+        node_counts, conf_sums = [0] * rows, [0.0] * rows
+        for row, conf in zip(self.node_chain, self.node_confidence):
+            node_counts[row] += 1
+            conf_sums[row] += conf
+        edge_counts, weight_sums = [0] * rows, [0.0] * rows
+        for row, weight in zip(self.edge_chain, self.edge_weight):
+            edge_counts[row] += 1
+            weight_sums[row] += weight
+        return node_counts, conf_sums, edge_counts, weight_sums
+
+    def node_counts(self) -> List[int]:
+        counts = self._chain_totals()[0]
+        return [int(c) for c in counts]
+
+    def iap_grid(self, urgencies: Sequence[float]) -> List[List[float]]:
+        """
+        IAP of every chain at every urgency: one row per chain, one column per urgency.
+        """
+        node_counts, conf_sums, _, _ = self._chain_totals()
+        if np is not None:
+            counts = np.asarray(node_counts, dtype=np.float64)
+            avg = np.divide(conf_sums, counts, out=np.zeros_like(counts), where=counts > 0)
+            grid = np.asarray(urgencies, dtype=np.float64)[None, :] / np.maximum(0.1, avg)[:, None]
+            grid[counts == 0, :] = 0.0
+            return grid.tolist()
+
+        grid = []
+        for count, conf_sum in zip(node_counts, conf_sums):
+            if count == 0:
+                grid.append([0.0] * len(urgencies))
+                continue
+            safe_conf = max(0.1, conf_sum / count)
+            grid.append([u / safe_conf for u in urgencies])
+        return grid
+
+    def coherence(self) -> List[float]:
+        """
+        Chain Coherence Score of every chain.
+        """
+        node_counts, _, edge_counts, weight_sums = self._chain_totals()
+        if np is not None:
+            nodes = np.asarray(node_counts, dtype=np.float64)
+            edges = np.asarray(edge_counts, dtype=np.float64)
+            valid = (edges > 0) & (nodes >= 2)
+            avg_weight = np.divide(weight_sums, edges, out=np.zeros_like(edges), where=valid)
+            density = np.divide(edges, nodes - 1, out=np.zeros_like(edges), where=valid)
+            return (avg_weight * np.minimum(1.0, density)).tolist()
+
+        scores = []
+        for nodes, edges, weight_sum in zip(node_counts, edge_counts, weight_sums):
+            if edges == 0 or nodes < 2:
+                scores.append(0.0)
+                continue
+            scores.append((weight_sum / edges) * min(1.0, edges / (nodes - 1)))
+        return scores
+
+    # --- Per-domain reductions ---
+
+    def domain_distributions(self, bins: int = 10) -> List[DomainDistribution]:
+        """
+        Confidence statistics per domain, over every signal in the snapshot.
+        Domains without signals are omitted.
+        """
+        domain_count = len(DOMAINS)
+        if np is not None:
+            codes = np.frombuffer(self.node_domain, dtype=np.uint8).astype(np.int64)
+            conf = np.frombuffer(self.node_confidence)
+            counts = np.bincount(codes, minlength=domain_count)
+            sums = np.bincount(codes, weights=conf, minlength=domain_count)
+            bin_idx = np.minimum((conf * bins).astype(np.int64), bins - 1)
+            hist = np.bincount(codes * bins + bin_idx, minlength=domain_count * bins).reshape(domain_count, bins)
+            mins = np.full(domain_count, np.inf)
+            maxs = np.full(domain_count, -np.inf)
+            np.minimum.at(mins, codes, conf)
+            np.maximum.at(maxs, codes, conf)
+            stats = zip(counts.tolist(), sums.tolist(), mins.tolist(), maxs.tolist(), hist.tolist())
+        else:
+            counts_l = [0] * domain_count
+            sums_l = [0.0] * domain_count
+            mins_l = [float("inf")] * domain_count
+            maxs_l = [float("-inf")] * domain_count
+            hist_l = [[0] * bins for _ in range(domain_count)]
+            for code, conf_value in zip(self.node_domain, self.node_confidence):
+                counts_l[code] += 1
+                sums_l[code] += conf_value
+                mins_l[code] = min(mins_l[code], conf_value)
+                maxs_l[code] = max(maxs_l[code], conf_value)
+                hist_l[code][min(int(conf_value * bins), bins - 1)] += 1
+            stats = zip(counts_l, sums_l, mins_l, maxs_l, hist_l)
+
+        distributions = []
+        for domain, (count, total, low, high, histogram) in zip(DOMAINS, stats):
+            if count == 0:
+                continue
+            distributions.append(DomainDistribution(
+                domain=domain,
+                count=int(count),
+                mean_confidence=total / count,
+                min_confidence=low,
+                max_confidence=high,
+                histogram=[int(h) for h in histogram]
+            ))
+        return distributions
@@ -0,0 +1,363 @@
+from array import array
+from typing import Dict, List, NamedTuple, Optional
+from uuid import UUID
+from chimera_nexus.core.domain import HybridThreatChain
+
+try:
+    import numpy as np
+except ImportError:  # Optional accelerator for PageRank; the pure-Python path is exact
+    np = None
+
+class CausalPath(NamedTuple):
+    """
+    Heaviest chain of cause → effect links, by summed edge weight.
+    """
+    nodes: List[UUID]
+    total_weight: float
+
+class ChainGraph:
+    """
+    Compact, integer-indexed (CSR) view of a threat chain's topology.
+
+    Node UUIDs are mapped to dense row numbers once; outgoing and incoming
+    links are stored as offset/target arrays, so every algorithm below is an
+    iterative pass over flat arrays in O(nodes + edges) (PageRank: per
+    iteration). Nothing recurses, so 100k-node chains cannot hit the
+    interpreter's recursion limit.
+    """
+    def __init__(self, node_ids: List[UUID], sources: List[int], targets: List[int], weights: List[float]):
+        self.node_ids = node_ids
+        self.index: Dict[UUID, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+        self.out_offsets, self.out_targets, self.out_weights = self._csr(n, sources, targets, weights)
+        self.in_offsets, self.in_sources, self.in_weights = self._csr(n, targets, sources, weights)
+
+    @classmethod
+    def from_chain(cls, chain: HybridThreatChain) -> "ChainGraph":
+        """
+        Edges whose endpoints are not in the chain (possible in hand-edited
+        files loaded unvalidated) are left out rather than failing the build.
+        """
+        node_ids = list(chain.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        sources, targets, weights = [], [], []
+        for edge in chain.edges:
+            source = index.get(edge.source_id)
+            target = index.get(edge.target_id)
+            if source is None or target is None:
+                continue
+            sources.append(source)
+            targets.append(target)
+            weights.append(edge.weight)
+        return cls(node_ids, sources, targets, weights)
+
+    @staticmethod
+    def _csr(n: int, rows: List[int], cols: List[int], weights: List[float]):
+        # Counting sort by row keeps construction linear
+        offsets = array('q', [0] * (n + 1))
+        for r in rows:
+            offsets[r + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        cursor = array('q', offsets[:n])
+        targets = array('q', [0] * len(rows))
+        out_weights = array('d', [0.0] * len(rows))
+        for r, c, w in zip(rows, cols, weights):
+            slot = cursor[r]
+            targets[slot] = c
+            out_weights[slot] = w
+            cursor[r] = slot + 1
+        return offsets, targets, out_weights
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.out_targets)
+
+    def _out(self, v: int):
+        return self.out_targets[self.out_offsets[v]:self.out_offsets[v + 1]]
+
+    def _in(self, v: int):
+        return self.in_sources[self.in_offsets[v]:self.in_offsets[v + 1]]
+
+    # --- Connectivity ---
+
+    def weak_component_labels(self) -> List[int]:
+        """
+        Component number per node row, ignoring link direction.
+        """
+        labels = [-1] * self.node_count
+        current = 0
+        for start in range(self.node_count):
+            if labels[start] != -1:
+                continue
+            labels[start] = current
+            stack = [start]
+            while stack:
+                v = stack.pop()
+                for w in self._out(v):
+                    if labels[w] == -1:
+                        labels[w] = current
+                        stack.append(w)
+                for w in self._in(v):
+                    if labels[w] == -1:
+                        labels[w] = current
+                        stack.append(w)
+            current += 1
+        return labels
+
+    def weak_component_count(self) -> int:
+        labels = self.weak_component_labels()
+        return max(labels) + 1 if labels else 0
+
+    def weak_components(self) -> List[List[UUID]]:
+        """
+        Weakly connected components, largest first.
+        """
+        return self._group(self.weak_component_labels())
+
+    def strong_component_labels(self) -> List[int]:
+        """
+        Iterative Tarjan: component number per node row, in reverse topological order.
+        """
+        n = self.node_count
+        index_of = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        labels = [-1] * n
+        stack: List[int] = []
+        counter = 0
+        component = 0
+
+        for root in range(n):
+            if index_of[root] != -1:
+                continue
+            # Each frame: (node, next out-edge slot)
+            work = [(root, self.out_offsets[root])]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+
+            while work:
+                v, slot = work[-1]
+                end = self.out_offsets[v + 1]
+                if slot < end:
+                    work[-1] = (v, slot + 1)
+                    w = self.out_targets[slot]
+                    if index_of[w] == -1:
+                        index_of[w] = lowlink[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, self.out_offsets[w]))
+                    elif on_stack[w]:
+                        lowlink[v] = min(lowlink[v], index_of[w])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[v])
+                if lowlink[v] == index_of[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        labels[w] = component
+                        if w == v:
+                            break
+                    component += 1
+        return labels
+
+    def strong_components(self) -> List[List[UUID]]:
+        """
+        Strongly connected components (mutually reachable signals), largest first.
+        """
+        return self._group(self.strong_component_labels())
+
+    def _group(self, labels: List[int]) -> List[List[UUID]]:
+        groups: Dict[int, List[UUID]] = {}
+        for row, label in enumerate(labels):
+            groups.setdefault(label, []).append(self.node_ids[row])
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def feedback_loops(self) -> List[List[UUID]]:
+        """
+        Groups of signals that reinforce each other through a directed cycle.
+        """
+        labels = self.strong_component_labels()
+        sizes: Dict[int, int] = {}
+        for label in labels:
+            sizes[label] = sizes.get(label, 0) + 1
+        loops = [c for c in self._group(labels) if len(c) > 1]
+        # A self-loop is a loop of its own only when no larger cycle already contains it
+        for v in range(self.node_count):
+            if sizes[labels[v]] == 1 and v in self._out(v):
+                loops.append([self.node_ids[v]])
+        return loops
+
+    def has_cycle(self) -> bool:
+        # Kahn's algorithm: a cycle exists iff some node is never freed
+        indegree = [self.in_offsets[v + 1] - self.in_offsets[v] for v in range(self.node_count)]
+        ready = [v for v, d in enumerate(indegree) if d == 0]
+        visited = 0
+        while ready:
+            v = ready.pop()
+            visited += 1
+            for w in self._out(v):
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    ready.append(w)
+        return visited < self.node_count
+
+    # --- Reachability ---
+
+    def reachable_from(self, node_id: UUID, reverse: bool = False) -> List[UUID]:
+        """
+        Signals reachable by following links from `node_id` (its downstream
+        effects), or against them with reverse=True (its upstream causes).
+        The start node is excluded. Breadth-first order.
+        """
+        start = self.index[node_id]
+        neighbours = self._in if reverse else self._out
+        seen = bytearray(self.node_count)
+        seen[start] = 1
+        frontier = [start]
+        order: List[UUID] = []
+        while frontier:
+            next_frontier = []
+            for v in frontier:
+                for w in neighbours(v):
+                    if not seen[w]:
+                        seen[w] = 1
+                        order.append(self.node_ids[w])
+                        next_frontier.append(w)
+            frontier = next_frontier
+        return order
+
+    # --- Paths ---
+
+    def longest_causal_path(self) -> Optional[CausalPath]:
+        """
+        Heaviest path by summed link weight. Links inside feedback loops
+        (strongly connected components) are excluded, since a path around a
+        cycle has no finite maximum; every remaining link runs forward in
+        the component order, so the search is a linear DAG dynamic program.
+        Returns None for a chain without links between components.
+        """
+        n = self.node_count
+        if n == 0:
+            return None
+        component = self.strong_component_labels()
+
+        indegree = [0] * n
+        for v in range(n):
+            for w in self._out(v):
+                if component[w] != component[v]:
+                    indegree[w] += 1
+
+        best = [0.0] * n
+        previous = [-1] * n
+        ready = [v for v in range(n) if indegree[v] == 0]
+        while ready:
+            v = ready.pop()
+            start, end = self.out_offsets[v], self.out_offsets[v + 1]
+            for slot in range(start, end):
+                w = self.out_targets[slot]
+                if component[w] == component[v]:
+                    continue
+                candidate = best[v] + self.out_weights[slot]
+                if previous[w] == -1 or candidate > best[w]:
+                    best[w] = candidate
+                    previous[w] = v
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    ready.append(w)
+
+        end_node = max(range(n), key=lambda v: (previous[v] != -1, best[v]))
+        if previous[end_node] == -1:
+            return None
+        path = [end_node]
+        while previous[path[-1]] != -1:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return CausalPath([self.node_ids[v] for v in path], round(best[end_node], 6))
+
+    # --- Centrality ---
+
+    def degree_centrality(self) -> Dict[UUID, float]:
+        """
+        (in-degree + out-degree) / (nodes - 1).
+        """
+        n = self.node_count
+        scale = 1.0 / (n - 1) if n > 1 else 0.0
+        return {
+            self.node_ids[v]: (
+                (self.out_offsets[v + 1] - self.out_offsets[v]) + (self.in_offsets[v + 1] - self.in_offsets[v])
+            ) * scale
+            for v in range(n)
+        }
+
+    def pagerank(self, damping: float = 0.85, tolerance: float = 1e-8, max_iterations: int = 100) -> Dict[UUID, float]:
+        """
+        Weighted PageRank: influence flows along links in proportion to their
+        weight; signals without outgoing weight spread theirs uniformly.
+        """
+        n = self.node_count
+        if n == 0:
+            return {}
+
+        out_strength = [0.0] * n
+        for v in range(n):
+            for slot in range(self.out_offsets[v], self.out_offsets[v + 1]):
+                out_strength[v] += self.out_weights[slot]
+
+        if np is not None:
+            ranks = self._pagerank_numpy(out_strength, damping, tolerance, max_iterations)
+        else:
+            ranks = self._pagerank_python(out_strength, damping, tolerance, max_iterations)
+        return {self.node_ids[v]: ranks[v] for v in range(n)}
+
+    def _pagerank_python(self, out_strength: List[float], damping: float, tolerance: float, max_iterations: int) -> List[float]:
+        n = self.node_count
+        rank = [1.0 / n] * n
+        for _ in range(max_iterations):
+            dangling = sum(rank[v] for v in range(n) if out_strength[v] == 0.0)
+            base = (1.0 - damping) / n + damping * dangling / n
+            incoming = [0.0] * n
+            for v in range(n):
+                if out_strength[v] == 0.0:
+                    continue
+                share = damping * rank[v] / out_strength[v]
+                for slot in range(self.out_offsets[v], self.out_offsets[v + 1]):
+                    incoming[self.out_targets[slot]] += share * self.out_weights[slot]
+            new_rank = [base + incoming[v] for v in range(n)]
+            delta = sum(abs(a - b) for a, b in zip(new_rank, rank))
+            rank = new_rank
+            if delta < tolerance:
+                break
+        return rank
+
+    def _pagerank_numpy(self, out_strength: List[float], damping: float, tolerance: float, max_iterations: int) -> List[float]:
+        n = self.node_count
+        offsets = np.frombuffer(self.out_offsets, dtype=np.int64)
+        sources = np.repeat(np.arange(n), np.diff(offsets))
+        targets = np.frombuffer(self.out_targets, dtype=np.int64)
+        weights = np.frombuffer(self.out_weights)
+        strength = np.asarray(out_strength)
+        dangling = strength == 0.0
+        safe_strength = np.where(dangling, 1.0, strength)
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            base = (1.0 - damping) / n + damping * rank[dangling].sum() / n
+            flow = damping * rank[sources] / safe_strength[sources] * weights
+            new_rank = base + np.bincount(targets, weights=flow, minlength=n)
+            delta = np.abs(new_rank - rank).sum()
+            rank = new_rank
+            if delta < tolerance:
+                break
+        return rank.tolist()
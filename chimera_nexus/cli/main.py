@@ -1,25 +1,19 @@
+import os
+import sys
 import typer
 import uuid
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, FloatPrompt, IntPrompt
-
-# Import Core Domain Entities
-from chimera_nexus.core.domain import (
-    HybridThreatChain, 
-    HybridNode, 
-    HybridEdge,
-    ThreatDomain, 
-    RelationType
-)
 
-# Import Infrastructure Layers
-from chimera_nexus.storage.repository import NexusRepository, StorageError
-from chimera_nexus.analysis.auditor import CognitiveAuditor
-from chimera_nexus.reporting.engine import ReportEngine
+# Everything beyond typer is imported inside the commands that use it: the
+# domain models, storage engines, rich and the analysis stack together cost
+# several hundred milliseconds, which `nexus --help` and simple commands
+# should not pay on every invocation.
+if TYPE_CHECKING:
+    from chimera_nexus.core.domain import HybridThreatChain, HybridNode
+    from chimera_nexus.storage.repository import NexusRepository
+    from chimera_nexus.analysis.audit_cache import AuditCache
+    from chimera_nexus.service.client import NexusClient
 
 # Initialize System
 app = typer.Typer(
@@ -27,15 +21,165 @@ app = typer.Typer(
     help="Contextual Hybrid Intelligence for Monitoring, Evaluation & Risk Assessment",
     add_completion=False
 )
-console = Console()
-repo = NexusRepository()
+
+DEFAULT_DATA_DIR = "./nexus_data"
+DATA_DIR_ENV = "NEXUS_DATA_DIR"
+
+# Graphviz layout time grows quickly beyond this many signals
+LARGE_DOT_NODES = 2000
+
+class _LazyConsole:
+    """
+    Stands in for rich's Console and creates it on first use.
+    """
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+console = _LazyConsole()
+
+_data_dir: Optional[str] = None
+_repo: Optional["NexusRepository"] = None
+_use_daemon = True
+# False until looked up; then the client, or None when no daemon is running
+_daemon = False
+
+@app.callback()
+def configure(
+    ctx: typer.Context,
+    data_dir: Optional[str] = typer.Option(
+        None, "--data-dir", envvar=DATA_DIR_ENV,
+        help=f"Registry directory (default: {DEFAULT_DATA_DIR})"
+    ),
+    profile: bool = typer.Option(False, "--profile", help="Print a per-phase timing breakdown to stderr"),
+    profile_out: Optional[str] = typer.Option(
+        None, "--profile-out",
+        help="Also save the profile: '*.prof' for a cProfile dump, anything else for JSON-lines spans"
+    ),
+    no_daemon: bool = typer.Option(False, "--no-daemon", help="Work on the files directly even if 'nexus serve' is running")
+):
+    global _data_dir, _repo, _use_daemon, _daemon
+    _data_dir = data_dir
+    _repo = None
+    _use_daemon = not no_daemon
+    _daemon = False
+    if profile or profile_out:
+        _start_profiling(ctx, profile, profile_out)
+
+def _start_profiling(ctx: typer.Context, show: bool, out_path: Optional[str]):
+    import time
+    from chimera_nexus.core import instrumentation
+
+    profiler = None
+    if out_path and out_path.endswith(".prof"):
+        import cProfile
+        profiler = cProfile.Profile()
+
+    instrumentation.enable()
+    started = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+
+    def finish():
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(out_path)
+        instrumentation.disable()
+        if out_path and profiler is None:
+            instrumentation.write_jsonl(out_path)
+        if show:
+            _print_profile(instrumentation.summarize(), time.perf_counter() - started)
+
+    ctx.call_on_close(finish)
+
+def _print_profile(phases, wall_seconds: float):
+    """
+    Breakdown by span name. Self time excludes nested spans, so the self
+    column sums to the instrumented total; the rest is imports, CLI and
+    other uninstrumented work.
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Profile ({wall_seconds * 1000:.1f} ms wall)")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Self %", justify="right")
+    instrumented = 0.0
+    for phase in phases:
+        instrumented += phase.self_seconds
+        table.add_row(
+            phase.name,
+            str(phase.calls),
+            f"{phase.total_seconds * 1000:.2f}",
+            f"{phase.self_seconds * 1000:.2f}",
+            f"{phase.self_seconds / wall_seconds:.0%}" if wall_seconds else "-"
+        )
+    other = max(0.0, wall_seconds - instrumented)
+    table.add_row("[dim](imports, CLI, uninstrumented)[/dim]", "", "", f"{other * 1000:.2f}", f"{other / wall_seconds:.0%}" if wall_seconds else "-")
+    Console(stderr=True).print(table)
+
+def get_repo() -> "NexusRepository":
+    """
+    The registry, opened on first use so commands that never touch it
+    (and --help) skip the storage imports and filesystem access.
+    """
+    global _repo
+    if _repo is None:
+        from chimera_nexus.storage.repository import NexusRepository
+        _repo = NexusRepository(data_dir=_resolve_data_dir())
+    return _repo
+
+def _resolve_data_dir() -> str:
+    return _data_dir or os.environ.get(DATA_DIR_ENV) or DEFAULT_DATA_DIR
+
+def get_daemon() -> Optional["NexusClient"]:
+    """
+    Client for a 'nexus serve' daemon on this registry, or None if none is
+    running. Commands that support it go through the daemon, which already
+    holds the chains in memory, instead of parsing the files themselves.
+    """
+    global _daemon
+    if _daemon is False:
+        _daemon = None
+        if _use_daemon:
+            from chimera_nexus.service.client import NexusClient
+            _daemon = NexusClient.discover(Path(_resolve_data_dir()))
+    return _daemon
+
+def _load_chain(chain_uuid: uuid.UUID) -> "HybridThreatChain":
+    daemon = get_daemon()
+    if daemon is None:
+        return get_repo().load_chain(chain_uuid)
+    from chimera_nexus.storage.integrity import construct_chain
+    # The daemon serializes its validated in-memory chain, so no re-validation
+    return construct_chain(daemon.call("load", chain_id=str(chain_uuid)))
+
+def _append_mutations(chain: "HybridThreatChain", nodes=(), edges=()) -> None:
+    daemon = get_daemon()
+    if daemon is None:
+        get_repo().append_mutations(chain, nodes=nodes, edges=edges)
+        return
+    for node in nodes:
+        daemon.call("add_signal", chain_id=str(chain.id), node=node.model_dump(mode='json'))
+    for edge in edges:
+        daemon.call("link", chain_id=str(chain.id), edge=edge.model_dump(mode='json'))
 
 # --- Helper Functions (UI Logic) ---
 
-def _render_chain_details(chain: HybridThreatChain):
+def _render_chain_details(chain: "HybridThreatChain"):
     """
     Renders a comprehensive situational report to the terminal.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
     iap = chain.calculate_iap(urgency=5.0)  # Default urgency baseline
     ccs = chain.coherence_score
     
@@ -57,8 +201,8 @@ def _render_chain_details(chain: HybridThreatChain):
         table.add_column("Conf.", justify="right")
         table.add_column("Description", style="dim")
         
-        # Sort by timestamp for chronological view
-        sorted_nodes = sorted(chain.nodes.values(), key=lambda x: x.timestamp)
+        # Chronological view (the chain keeps its nodes in timestamp order)
+        sorted_nodes = chain.chronological_nodes()
         
         for idx, n in enumerate(sorted_nodes):
             conf_style = "green" if n.confidence > 0.7 else "yellow" if n.confidence > 0.4 else "red"
@@ -83,13 +227,14 @@ def _render_chain_details(chain: HybridThreatChain):
             if src and tgt:
                 console.print(f"  └─ [cyan]{src.signal_type}[/] ==({edge.relation_type.value})==> [cyan]{tgt.signal_type}[/]")
 
-def _select_node_interactive(chain: HybridThreatChain, prompt_text: str) -> Optional[HybridNode]:
+def _select_node_interactive(chain: "HybridThreatChain", prompt_text: str) -> Optional["HybridNode"]:
     """
     Helper to pick a node from a list using a simple index number.
     """
-    nodes = list(chain.nodes.values())
-    # Sort for consistent indexing
-    nodes.sort(key=lambda x: x.timestamp)
+    from rich.prompt import IntPrompt
+
+    # Chronological, for consistent indexing
+    nodes = chain.chronological_nodes()
     
     if not nodes:
         return None
@@ -108,21 +253,36 @@ def init(name: str):
     """
     Initialize a new Hybrid Threat Chain (HTC) context.
     """
+    from chimera_nexus.core.domain import HybridThreatChain
+
     try:
         chain = HybridThreatChain(name=name)
-        path = repo.save_chain(chain)
+        path = get_repo().save_chain(chain)
         console.print(f"[bold green]SUCCESS:[/bold green] Initialized Nexus chain '[white]{name}[/]'")
         console.print(f"Storage: {path}")
     except Exception as e:
         console.print(f"[bold red]FAILURE:[/bold red] {e}")
 
 @app.command("list")
-def list_chains():
+def list_chains(workers: int = typer.Option(1, help="Parallel parsers for changed chain files (0 = one per core)")):
     """
     List all active threat contexts in the registry.
     """
-    chains = repo.list_chains()
-    if not chains:
+    from rich.table import Table
+
+    daemon = get_daemon()
+    if daemon is not None:
+        listing = daemon.call("list", urgency=5.0)
+        skipped = listing["failures"]
+        rows = [(c["id"], c["name"], c["domain_mix"], c["node_count"], c["iap"]) for c in listing["chains"]]
+    else:
+        failures = []
+        chains = get_repo().list_summaries(workers=workers or None, failures=failures)
+        skipped = [(f.path.name, f.error) for f in failures]
+        rows = [(str(c.id), c.name, [d.value for d in c.domain_mix], c.node_count, c.calculate_iap(urgency=5.0)) for c in chains]
+    for name, error in skipped:
+        console.print(f"[yellow]Skipped malformed file {name}:[/yellow] {error}")
+    if not rows:
         console.print("[yellow]No active chains found.[/yellow]")
         return
 
@@ -133,22 +293,241 @@ def list_chains():
     table.add_column("Nodes", justify="right")
     table.add_column("Pressure (IAP)", justify="right")
 
-    for c in chains:
-        domains = ", ".join([d.value[:3] for d in c.domain_mix])
-        iap = c.calculate_iap(urgency=5.0)
-        table.add_row(str(c.id)[:8], c.name, domains, str(len(c.nodes)), f"{iap:.2f}")
+    for chain_uuid, name, domain_mix, node_count, iap in rows:
+        domains = ", ".join([d[:3] for d in domain_mix])
+        table.add_row(chain_uuid[:8], name, domains, str(node_count), f"{iap:.2f}")
     
     console.print(table)
 
+@app.command()
+def stats(
+    urgency: List[float] = typer.Option([1.0, 5.0, 9.0], help="Urgency level(s) to evaluate IAP at (repeatable)"),
+    top: int = typer.Option(20, help="Show the N chains under most pressure at the highest urgency"),
+    workers: int = typer.Option(1, help="Parallel chain loaders (0 = one per core)")
+):
+    """
+    Registry-wide IAP, coherence and confidence statistics, computed column-wise.
+    """
+    from rich.table import Table
+    from chimera_nexus.analysis.columnar import RegistrySnapshot, chain_columns
+
+    # Workers extract the columns from the decoded files; no chain models are built
+    snapshot = RegistrySnapshot()
+    for path, columns, error in get_repo().map_chains(chain_columns, workers=workers or None, payload=True):
+        if error is not None:
+            console.print(f"[yellow]Skipped malformed file {path.name}:[/yellow] {error}")
+            continue
+        snapshot.append_columns(columns)
+    if snapshot.chain_count == 0:
+        console.print("[yellow]No active chains found.[/yellow]")
+        return
+
+    urgencies = sorted(urgency)
+    grid = snapshot.iap_grid(urgencies)
+    coherence = snapshot.coherence()
+    node_counts = snapshot.node_counts()
+
+    table = Table(title=f"Decision Pressure Across {snapshot.chain_count} Chains")
+    table.add_column("ID (Short)", style="cyan")
+    table.add_column("Name", style="white")
+    table.add_column("Nodes", justify="right")
+    table.add_column("Coherence", justify="right")
+    for u in urgencies:
+        table.add_column(f"IAP @ {u:g}", justify="right")
+
+    ranked = sorted(range(snapshot.chain_count), key=lambda row: grid[row][-1], reverse=True)
+    for row in ranked[:top]:
+        table.add_row(
+            str(snapshot.chain_ids[row])[:8],
+            snapshot.chain_names[row],
+            str(node_counts[row]),
+            f"{coherence[row]:.2f}",
+            *[f"{value:.2f}" for value in grid[row]]
+        )
+    console.print(table)
+
+    bars = " ▁▂▃▄▅▆▇█"
+    domains = Table(title="Confidence Distribution by Domain")
+    domains.add_column("Domain", style="magenta")
+    domains.add_column("Signals", justify="right")
+    domains.add_column("Mean", justify="right")
+    domains.add_column("Min", justify="right")
+    domains.add_column("Max", justify="right")
+    domains.add_column("Histogram (0 → 1)")
+    for dist in snapshot.domain_distributions():
+        peak = max(dist.histogram)
+        sparkline = "".join(bars[round(h / peak * (len(bars) - 1))] for h in dist.histogram)
+        domains.add_row(
+            dist.domain.value,
+            str(dist.count),
+            f"{dist.mean_confidence:.2f}",
+            f"{dist.min_confidence:.2f}",
+            f"{dist.max_confidence:.2f}",
+            sparkline
+        )
+    console.print(domains)
+
+@app.command()
+def search(
+    query: List[str] = typer.Argument(None, help="Terms that must all match a signal's type or description"),
+    prefix: bool = typer.Option(False, "--prefix", help="Also match terms that start with each query term"),
+    domain: List[str] = typer.Option([], "--domain", help="Only signals in this domain (repeatable)"),
+    limit: int = typer.Option(50, help="Show at most N hits"),
+    workers: int = typer.Option(1, help="Parallel parsers for changed chain files (0 = one per core)")
+):
+    """
+    Find signals across every chain, ranked by confidence.
+    """
+    from rich.table import Table
+    from chimera_nexus.core.domain import ThreatDomain
+
+    try:
+        domains = [ThreatDomain(d.lower()) for d in domain] or None
+    except ValueError as e:
+        console.print(f"[bold red]Invalid domain:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    text = " ".join(query or [])
+    failures = []
+    hits = get_repo().search_signals(text, prefix=prefix, domains=domains, workers=workers or None, failures=failures)
+    for failure in failures:
+        console.print(f"[yellow]Skipped malformed file {failure.path.name}:[/yellow] {failure.error}")
+    if not hits:
+        console.print("[yellow]No matching signals.[/yellow]")
+        return
+
+    table = Table(title=f"Signals matching '{text}'" if text else "Signals")
+    table.add_column("Chain", style="cyan")
+    table.add_column("Signal", style="cyan")
+    table.add_column("Domain", style="magenta")
+    table.add_column("Type")
+    table.add_column("Conf", justify="right")
+    table.add_column("Description")
+    for hit in hits[:limit]:
+        table.add_row(
+            str(hit.chain_id)[:8],
+            str(hit.node_id)[:8],
+            hit.domain.value,
+            hit.signal_type,
+            f"{hit.confidence:.2f}",
+            hit.description
+        )
+    console.print(table)
+
+    chain_count = len({hit.chain_id for hit in hits})
+    shown = f", showing top {limit}" if len(hits) > limit else ""
+    console.print(f"{len(hits)} signal(s) in {chain_count} chain(s){shown}.")
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+def _parse_duration(text: str):
+    """
+    '90s', '15m', '6h', '2d', '1w' -> timedelta.
+    """
+    from datetime import timedelta
+
+    unit = _DURATION_UNITS.get(text[-1:].lower())
+    try:
+        amount = float(text[:-1])
+    except ValueError:
+        amount = None
+    if unit is None or amount is None or amount <= 0:
+        raise typer.BadParameter(f"'{text}' is not a duration like 30m, 6h or 2d.")
+    return timedelta(seconds=amount * unit)
+
+def _parse_moment(text: Optional[str]):
+    """
+    An ISO-8601 time (naive = UTC) or a duration meaning that long ago.
+    """
+    from datetime import datetime, timezone
+
+    if text is None:
+        return None
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        return datetime.now(timezone.utc) - _parse_duration(text)
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+@app.command()
+def timeline(
+    since: Optional[str] = typer.Option(None, "--since", help="Start: ISO time (UTC if no offset) or an age such as 6h"),
+    until: Optional[str] = typer.Option(None, "--until", help="End (exclusive), same forms as --since"),
+    domain: List[str] = typer.Option([], "--domain", help="Only signals in this domain (repeatable)"),
+    window: Optional[str] = typer.Option(None, "--window", help="Instead of listing signals, count them per domain in windows of this width"),
+    step: Optional[str] = typer.Option(None, "--step", help="Advance between windows (default: the window width)"),
+    workers: int = typer.Option(1, help="Parallel parsers for changed chain files (0 = one per core)")
+):
+    """
+    Signals from every chain in time order, or per-domain counts over sliding windows.
+    """
+    from chimera_nexus.core.domain import ThreatDomain
+
+    try:
+        domains = [ThreatDomain(d.lower()) for d in domain] or None
+    except ValueError as e:
+        console.print(f"[bold red]Invalid domain:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    start, end = _parse_moment(since), _parse_moment(until)
+
+    failures = []
+    repo = get_repo()
+    if window is not None:
+        from rich.table import Table
+
+        windows = repo.signal_window_counts(
+            _parse_duration(window), start, end,
+            _parse_duration(step) if step else None,
+            workers=workers or None, failures=failures
+        )
+        for failure in failures:
+            console.print(f"[yellow]Skipped malformed file {failure.path.name}:[/yellow] {failure.error}")
+        if not windows:
+            console.print("[yellow]No signals in range.[/yellow]")
+            return
+        shown = domains or [d for d in ThreatDomain if any(d in w.counts for w in windows)]
+        table = Table(title=f"Signals per {window} Window (UTC)")
+        table.add_column("Window Start", style="cyan")
+        for d in shown:
+            table.add_column(d.value[:3], justify="right")
+        table.add_column("Total", justify="right", style="bold")
+        for w in windows:
+            counts = [w.counts.get(d, 0) for d in shown]
+            table.add_row(w.start.strftime("%Y-%m-%d %H:%M:%S"), *[str(c) for c in counts], str(sum(counts)))
+        console.print(table)
+        return
+
+    hits = repo.signals_between(start, end, domains, workers=workers or None, failures=failures)
+    for failure in failures:
+        console.print(f"[yellow]Skipped malformed file {failure.path.name}:[/yellow] {failure.error}")
+    count = 0
+    # Printed as they are read so long ranges start showing immediately
+    for hit in hits:
+        count += 1
+        console.print(
+            f"{hit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}  [cyan]{str(hit.chain_id)[:8]}[/cyan]  "
+            f"[magenta]{hit.domain.value:<13}[/magenta] {hit.signal_type} ({hit.confidence}) {hit.description}",
+            highlight=False
+        )
+    if count == 0:
+        console.print("[yellow]No signals in range.[/yellow]")
+        return
+    console.print(f"[dim]{count} signal(s).[/dim]")
+
 @app.command()
 def add_signal(chain_id: str):
     """
     Add a minimal viable signal (Node) to a chain.
     """
+    from rich.prompt import Prompt, FloatPrompt
+    from chimera_nexus.core.domain import HybridNode, ThreatDomain
+    from chimera_nexus.service.client import DaemonError
+    from chimera_nexus.storage.repository import StorageError
+
     try:
         # 1. Load Chain
         full_uuid = uuid.UUID(chain_id)
-        chain = repo.load_chain(full_uuid)
+        chain = _load_chain(full_uuid)
         
         console.print(f"[bold]Adding Signal to:[/bold] {chain.name}")
         
@@ -166,23 +545,68 @@ def add_signal(chain_id: str):
             confidence=conf
         )
         
-        # 4. Update & Save
-        chain.add_node(node)
-        repo.save_chain(chain)
+        # 4. Update & Save (journaled: only the new node is written)
+        _append_mutations(chain, nodes=[node])
         console.print("[green]Signal Integrated.[/green]")
         
-    except (ValueError, StorageError) as e:
+    except (ValueError, StorageError, DaemonError) as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
 
+@app.command()
+def ingest(
+    chain_id: str,
+    source: str = typer.Argument(..., help="NDJSON or CSV file of nodes/edges, or '-' for stdin"),
+    format: Optional[str] = typer.Option(None, help="'ndjson' or 'csv' (default: from file extension, ndjson for stdin)"),
+    batch_size: int = typer.Option(500, help="Records validated and committed per batch")
+):
+    """
+    Bulk-load signals and links from a stream, one commit per batch.
+    """
+    from rich.table import Table
+    from chimera_nexus.ingestion.stream import SignalIngestor, detect_format, iter_records
+    from chimera_nexus.storage.repository import StorageError
+
+    try:
+        full_uuid = uuid.UUID(chain_id)
+        chain = get_repo().load_chain(full_uuid)
+        fmt = (format or ("ndjson" if source == "-" else detect_format(source))).lower()
+
+        ingestor = SignalIngestor(get_repo(), batch_size=batch_size)
+        if source == "-":
+            report = ingestor.ingest(chain, iter_records(sys.stdin, fmt))
+        else:
+            with open(source, "r", encoding="utf-8", newline="") as stream:
+                report = ingestor.ingest(chain, iter_records(stream, fmt))
+
+        console.print(
+            f"[green]✓[/green] Ingested {report.nodes_added} signal(s) and {report.edges_added} link(s) "
+            f"into '{chain.name}' in {report.batches} batch(es)."
+        )
+        if report.rejects:
+            table = Table(title=f"Rejected Records ({len(report.rejects)})")
+            table.add_column("Line", justify="right", style="dim")
+            table.add_column("Reason", style="red")
+            for reject in report.rejects:
+                table.add_row(str(reject.line), reject.error)
+            console.print(table)
+
+    except (ValueError, OSError, StorageError) as e:
+        console.print(f"[bold red]Ingest Failed:[/bold red] {e}")
+
 @app.command()
 def link(chain_id: str):
     """
     Create a causal link (Edge) between two signals. 
     Turns a list of events into a 'Chain'.
     """
+    from rich.prompt import Prompt, FloatPrompt
+    from chimera_nexus.core.domain import HybridEdge, RelationType
+    from chimera_nexus.service.client import DaemonError
+    from chimera_nexus.storage.repository import StorageError
+
     try:
         full_uuid = uuid.UUID(chain_id)
-        chain = repo.load_chain(full_uuid)
+        chain = _load_chain(full_uuid)
         
         if len(chain.nodes) < 2:
             console.print("[yellow]Need at least 2 signals to create a link.[/yellow]")
@@ -196,6 +620,10 @@ def link(chain_id: str):
             return
 
         rel_type = Prompt.ask("Relationship Type", choices=[r.value for r in RelationType])
+        if chain.has_edge(source.id, target.id, RelationType(rel_type)):
+            console.print("[yellow]These signals are already linked with that relationship.[/yellow]")
+            return
+
         weight = FloatPrompt.ask("Connection Strength (0.0 - 1.0)", default=1.0)
         justification = Prompt.ask("Justification (Why linked?)")
 
@@ -207,11 +635,10 @@ def link(chain_id: str):
             justification=justification
         )
         
-        chain.add_edge(edge)
-        repo.save_chain(chain)
+        _append_mutations(chain, edges=[edge])
         console.print(f"[green]✓[/green] Linked: [cyan]{source.signal_type}[/] -> [cyan]{target.signal_type}[/]")
 
-    except (ValueError, StorageError) as e:
+    except (ValueError, StorageError, DaemonError) as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
 
 @app.command()
@@ -221,25 +648,155 @@ def inspect(chain_id: str):
     """
     try:
         full_uuid = uuid.UUID(chain_id)
-        chain = repo.load_chain(full_uuid)
+        chain = _load_chain(full_uuid)
         _render_chain_details(chain)
     except Exception as e:
         console.print(f"[bold red]Lookup Failed:[/bold red] {e}")
 
+def _flush_daemon() -> None:
+    # History is read from disk, so a daemon's accepted writes must land first
+    daemon = get_daemon()
+    if daemon is not None:
+        daemon.call("flush")
+
+@app.command()
+def history(chain_id: str):
+    """
+    List the committed versions of a chain.
+    """
+    from rich.table import Table
+    from chimera_nexus.storage.repository import StorageError
+    from chimera_nexus.service.client import DaemonError
+
+    try:
+        full_uuid = uuid.UUID(chain_id)
+        _flush_daemon()
+        versions = get_repo().history(full_uuid)
+    except (ValueError, StorageError, DaemonError) as e:
+        console.print(f"[bold red]Lookup Failed:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    if not versions:
+        console.print("[yellow]No recorded history for this chain yet; it starts with the next save.[/yellow]")
+        return
+
+    table = Table(title=f"History of {full_uuid}")
+    table.add_column("Version", justify="right", style="cyan")
+    table.add_column("Committed")
+    table.add_column("Signals", justify="right")
+    table.add_column("Links", justify="right")
+    table.add_column("Kind", style="dim")
+    for v in versions:
+        table.add_row(
+            str(v.version),
+            v.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
+            str(v.node_count),
+            str(v.edge_count),
+            v.kind
+        )
+    console.print(table)
+
+@app.command()
+def diff(
+    chain_id: str,
+    old: int = typer.Argument(..., help="Version to compare from"),
+    new: Optional[int] = typer.Argument(None, help="Version to compare to (default: the latest)")
+):
+    """
+    Show what changed in a chain between two versions.
+    """
+    from chimera_nexus.storage.repository import StorageError
+    from chimera_nexus.service.client import DaemonError
+
+    try:
+        full_uuid = uuid.UUID(chain_id)
+        repo = get_repo()
+        if new is None:
+            _flush_daemon()
+            versions = repo.history(full_uuid)
+            if not versions:
+                raise StorageError(f"Chain {full_uuid} has no recorded history.")
+            new = versions[-1].version
+        changes = repo.diff_versions(full_uuid, old, new)
+    except (ValueError, StorageError, DaemonError) as e:
+        console.print(f"[bold red]Diff Failed:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold]Chain {full_uuid}: version {old} → {new}[/bold]")
+    if changes.empty:
+        console.print("[dim]No changes.[/dim]")
+        return
+    for field, (before, after) in changes.header.items():
+        console.print(f"  [yellow]~[/yellow] {field}: {before} → {after}")
+    for n in changes.added_nodes:
+        console.print(f"  [green]+[/green] {n.domain.value} [cyan]{n.signal_type}[/] ({n.confidence}) {n.description}")
+    for n in changes.removed_nodes:
+        console.print(f"  [red]-[/red] {n.domain.value} [cyan]{n.signal_type}[/] ({n.confidence}) {n.description}")
+    for before, after in changes.changed_nodes:
+        console.print(f"  [yellow]~[/yellow] {before.signal_type} → {after.signal_type} ({after.confidence}) {after.description}")
+
+    names = {n.id: n.signal_type for n in changes.removed_nodes}
+    names.update((n.id, n.signal_type) for n in changes.added_nodes)
+    if changes.added_edges or changes.removed_edges:
+        # Unchanged endpoints are named from the current chain rather than by rebuilding a version
+        current = _load_chain(full_uuid).nodes
+        for e in changes.added_edges + changes.removed_edges:
+            for node_id in (e.source_id, e.target_id):
+                if node_id not in names and node_id in current:
+                    names[node_id] = current[node_id].signal_type
+    for sign, edges in (("[green]+[/green]", changes.added_edges), ("[red]-[/red]", changes.removed_edges)):
+        for e in edges:
+            src = names.get(e.source_id, str(e.source_id)[:8])
+            tgt = names.get(e.target_id, str(e.target_id)[:8])
+            console.print(f"  {sign} [cyan]{src}[/] ==({e.relation_type.value})==> [cyan]{tgt}[/]")
+    console.print(
+        f"[dim]{len(changes.added_nodes)} signal(s) added, {len(changes.removed_nodes)} removed, "
+        f"{len(changes.changed_nodes)} changed; {len(changes.added_edges)} link(s) added, "
+        f"{len(changes.removed_edges)} removed.[/dim]"
+    )
+
 @app.command()
-def audit(chain_id: str):
+def audit(
+    chain_id: Optional[str] = typer.Argument(None, help="Chain to audit (omit with --all)"),
+    all_chains: bool = typer.Option(False, "--all", help="Audit the whole registry and rank chains by worst finding"),
+    workers: int = typer.Option(0, help="Parallel auditors for --all (0 = one per core)"),
+    top: int = typer.Option(25, help="Rows to show in the --all ranking"),
+    timings: bool = typer.Option(False, "--timings", help="Re-run every rule and show per-rule timing")
+):
     """
     Run the Cognitive Auditor (Red Team) on the chain.
     Detects bias, logical gaps, and overconfidence.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    if all_chains:
+        _audit_registry(workers or None, top)
+        return
+    if chain_id is None:
+        console.print("[red]Provide a CHAIN_ID or use --all.[/red]")
+        return
+
     try:
         full_uuid = uuid.UUID(chain_id)
-        chain = repo.load_chain(full_uuid)
-        
-        auditor = CognitiveAuditor()
-        findings = auditor.audit(chain)
+        daemon = get_daemon() if not timings else None
+        if daemon is not None:
+            from chimera_nexus.analysis.auditor import AuditFinding
+            result = daemon.call("audit", chain_id=str(full_uuid))
+            chain_name = result["name"]
+            findings = [AuditFinding.model_validate(f) for f in result["findings"]]
+        else:
+            chain = get_repo().load_chain(full_uuid)
+            chain_name = chain.name
+
+            cache = _audit_cache()
+            if timings:
+                # Bypass the cache so every rule actually runs and is measured
+                findings = cache.auditor.audit(chain)
+                cache.put(chain.id, chain.content_digest(), findings)
+            else:
+                findings = cache.audit(chain)
         
-        console.print(Panel(f"[bold]Cognitive Audit Report: {chain.name}[/bold]", style="white on blue"))
+        console.print(Panel(f"[bold]Cognitive Audit Report: {chain_name}[/bold]", style="white on blue"))
         
         if not findings:
             console.print("\n[bold green]✓ No structural biases detected.[/bold green]")
@@ -257,52 +814,312 @@ def audit(chain_id: str):
                     f"{f.description}\n[italic]Fix: {f.remediation_hint}[/italic]"
                 )
             console.print(table)
+
+        if timings:
+            timing_table = Table(title="Rule Timing")
+            timing_table.add_column("Phase", style="cyan")
+            timing_table.add_column("Time (ms)", justify="right")
+            for name, timing in cache.auditor.timings.items():
+                timing_table.add_row(name, f"{timing.total_seconds * 1000:.3f}")
+            console.print(timing_table)
             
     except Exception as e:
         console.print(f"[bold red]Audit Failed:[/bold red] {e}")
 
+def _audit_cache() -> "AuditCache":
+    from chimera_nexus.analysis.audit_cache import AuditCache
+    return AuditCache(get_repo().base_path / "audit_cache")
+
+def _audit_registry(workers: Optional[int], top: int):
+    """
+    Audits every chain, skipping those whose content digest and rule-set
+    version match a cached result, and ranks chains by worst severity.
+    """
+    from rich.table import Table
+    from chimera_nexus.analysis.audit_cache import audit_with_digest
+
+    cache = _audit_cache()
+    failures = []
+    summaries = get_repo().list_summaries(workers=workers, failures=failures)
+
+    results = {}
+    pending = []
+    for summary in summaries:
+        cached = cache.get(summary.id, summary.content_digest) if summary.content_digest else None
+        if cached is None:
+            pending.append(summary.id)
+        else:
+            results[summary.id] = cached
+
+    for path, outcome, error in get_repo().map_chains(audit_with_digest, pending, workers=workers):
+        if outcome is None:
+            console.print(f"[yellow]Skipped {path.name}:[/yellow] {error}")
+            continue
+        digest, findings = outcome
+        chain_uuid = uuid.UUID(path.stem)
+        cache.put(chain_uuid, digest, findings)
+        results[chain_uuid] = findings
+
+    for failure in failures:
+        console.print(f"[yellow]Skipped malformed file {failure.path.name}:[/yellow] {failure.error}")
+    if not results:
+        console.print("[yellow]No active chains found.[/yellow]")
+        return
+
+    names = {s.id: s.name for s in summaries}
+    ranked = sorted(
+        results.items(),
+        key=lambda item: max((f.severity for f in item[1]), default=0.0),
+        reverse=True
+    )
+
+    table = Table(title=f"Registry Audit ({len(results)} chains, {len(pending)} re-audited)")
+    table.add_column("ID (Short)", style="cyan")
+    table.add_column("Name", style="white")
+    table.add_column("Findings", justify="right")
+    table.add_column("Worst Bias", style="red")
+    table.add_column("Severity", justify="right")
+    for chain_uuid, findings in ranked[:top]:
+        worst = max(findings, key=lambda f: f.severity, default=None)
+        if worst is None:
+            table.add_row(str(chain_uuid)[:8], names.get(chain_uuid, ""), "0", "[green]—[/green]", "0.00")
+            continue
+        sev_style = "bold red" if worst.severity > 0.7 else "yellow"
+        table.add_row(
+            str(chain_uuid)[:8],
+            names.get(chain_uuid, ""),
+            str(len(findings)),
+            worst.bias_type.value.upper(),
+            f"[{sev_style}]{worst.severity:.2f}[/]"
+        )
+    console.print(table)
+
 @app.command()
-def export(chain_id: str, format: str = typer.Option("md", help="Format: 'md' for Markdown, 'dot' for Graphviz")):
+def export(
+    chain_id: str,
+    format: str = typer.Option("md", help="Format: 'md' for Markdown, 'dot' for Graphviz"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output path, or '-' for stdout (default: derived from the chain name)"),
+    cluster: bool = typer.Option(False, "--cluster", help="DOT: group signals into per-domain clusters"),
+    aggregate_edges: bool = typer.Option(False, "--aggregate-edges", help="DOT: merge parallel links of the same relation"),
+    min_confidence: float = typer.Option(0.0, "--min-confidence", help="DOT: omit signals below this confidence"),
+    min_weight: float = typer.Option(0.0, "--min-weight", help="DOT: omit links below this weight"),
+    top_k: Optional[int] = typer.Option(None, "--top-k", help="DOT: keep only the K most central signals")
+):
     """
     Generate decision-support artifacts (Reports/Graphs).
     """
+    from chimera_nexus.reporting.engine import ReportEngine, DotOptions
+
     try:
         full_uuid = uuid.UUID(chain_id)
-        chain = repo.load_chain(full_uuid)
-        
-        # Always Audit before Exporting
-        auditor = CognitiveAuditor()
-        findings = auditor.audit(chain)
-        
-        engine = ReportEngine()
-        filename = f"{chain.name.replace(' ', '_').lower()}_{str(chain.id)[:8]}"
-        
-        if format.lower() == "md":
-            content = engine.generate_markdown_report(chain, findings)
-            out_path = f"{filename}.md"
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(content)
+        fmt = format.lower()
+        if fmt not in ("md", "dot"):
+            console.print(f"[red]Unknown format: {format}[/red]")
+            return
+        dot_options = DotOptions(
+            cluster_domains=cluster,
+            aggregate_edges=aggregate_edges,
+            min_confidence=min_confidence,
+            min_weight=min_weight,
+            top_k=top_k
+        )
+
+        daemon = get_daemon()
+        if daemon is not None:
+            # Rendered by the daemon from its in-memory chain
+            result = daemon.call("export", chain_id=str(full_uuid), format=fmt, dot=dot_options.model_dump())
+            chain_name, node_count = result["name"], result["node_count"]
+            write = lambda fp: fp.write(result["content"])
+        else:
+            chain = get_repo().load_chain(full_uuid)
+            chain_name, node_count = chain.name, len(chain.nodes)
+            # Always Audit before Exporting (reuses cached findings for unchanged content)
+            findings = _audit_cache().audit(chain)
+
+            engine = ReportEngine()
+            if fmt == "md":
+                write = lambda fp: engine.write_markdown_report(chain, findings, fp)
+            else:
+                write = lambda fp: engine.write_graphviz_dot(chain, fp, dot_options)
+
+        filename = f"{chain_name.replace(' ', '_').lower()}_{str(full_uuid)[:8]}"
+
+        # Stream straight to the destination instead of building the artifact in memory
+        if output == "-":
+            write(sys.stdout)
+            sys.stdout.flush()
+            return
+
+        out_path = output or f"{filename}.{fmt}"
+        with open(out_path, "w", encoding="utf-8") as f:
+            write(f)
+
+        if fmt == "md":
             console.print(f"[green]✓[/green] Executive Report generated: [bold]{out_path}[/bold]")
-            
-        elif format.lower() == "dot":
-            content = engine.generate_graphviz_dot(chain)
-            out_path = f"{filename}.dot"
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(content)
+        else:
             console.print(f"[green]✓[/green] Graphviz definition generated: [bold]{out_path}[/bold]")
             console.print("[dim]Tip: Use 'dot -Tpng input.dot -o output.png' to render image.[/dim]")
-            
-        else:
-            console.print(f"[red]Unknown format: {format}[/red]")
+            if node_count > LARGE_DOT_NODES and not dot_options.reduces:
+                console.print(
+                    f"[yellow]Note:[/yellow] {node_count} signals may be slow to lay out; "
+                    "consider --top-k, --min-confidence or --cluster."
+                )
 
     except Exception as e:
         console.print(f"[bold red]Export Failed:[/bold red] {e}")
 
+@app.command()
+def migrate(format: str = typer.Option(..., "--format", help="Target format: 'yaml', 'json' or 'binary'")):
+    """
+    Convert every chain in the registry to another storage format.
+    """
+    from chimera_nexus.storage.repository import StorageError
+
+    try:
+        converted = get_repo().migrate(format)
+        console.print(f"[green]✓[/green] Converted {converted} chain(s). Registry format is now [bold]{format.lower()}[/bold].")
+    except StorageError as e:
+        console.print(f"[bold red]Migration Failed:[/bold red] {e}")
+
+@app.command()
+def verify(
+    workers: int = typer.Option(1, help="Parallel validators (0 = one per core)"),
+    reseal: bool = typer.Option(False, "--reseal", help="Record fresh checksums for files that validate but are unsealed or edited")
+):
+    """
+    Fully revalidate every chain file, bypassing the trusted fast-load path.
+    """
+    from rich.table import Table
+    from chimera_nexus.storage.integrity import VALID
+    from chimera_nexus.storage.repository import StorageError
+
+    try:
+        results = get_repo().verify(workers=workers or None, reseal=reseal)
+    except StorageError as e:
+        console.print(f"[bold red]Verification Failed:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    if not results:
+        console.print("[yellow]No active chains found.[/yellow]")
+        return
+
+    flagged = [r for r in results if not r.ok or r.checksum != VALID]
+    if flagged:
+        table = Table(title="Chain File Verification")
+        table.add_column("File", style="cyan", no_wrap=True)
+        table.add_column("Checksum")
+        table.add_column("Result")
+        for r in flagged:
+            if not r.ok:
+                outcome = f"[red]invalid:[/red] {r.error.splitlines()[0]}"
+            elif r.resealed:
+                outcome = "[green]valid, resealed[/green]"
+            else:
+                outcome = "[yellow]valid, loads without fast path[/yellow]"
+            table.add_row(r.path.name, r.checksum, outcome)
+        console.print(table)
+
+    invalid = sum(not r.ok for r in results)
+    unsealed = sum(r.ok and r.checksum != VALID and not r.resealed for r in results)
+    console.print(
+        f"Verified {len(results)} chain file(s): [green]{len(results) - invalid} valid[/green], "
+        f"[red]{invalid} invalid[/red]."
+    )
+    if unsealed:
+        console.print(f"[dim]{unsealed} valid file(s) have no matching checksum; run with --reseal to enable fast loading.[/dim]")
+    if invalid:
+        raise typer.Exit(code=1)
+
+@app.command()
+def serve(
+    port: Optional[int] = typer.Option(None, help="Listen on this localhost TCP port instead of a Unix socket (0 = any free port)"),
+    flush_interval: float = typer.Option(0.5, help="Seconds between background flushes of accepted writes"),
+    max_memory: int = typer.Option(512, help="MiB of loaded chains to keep; the least recently used ones are dropped beyond it"),
+    stop: bool = typer.Option(False, "--stop", help="Ask the running daemon to flush and exit"),
+    status: bool = typer.Option(False, "--status", help="Show whether a daemon is serving this registry")
+):
+    """
+    Keep the registry loaded in a background daemon that other commands use.
+    """
+    from chimera_nexus.service.client import DaemonError
+
+    if stop or status:
+        daemon = get_daemon()
+        if daemon is None:
+            console.print("[yellow]No daemon is serving this registry.[/yellow]")
+            return
+        try:
+            info = daemon.call("ping")
+            if stop:
+                daemon.call("shutdown")
+                console.print(f"[green]✓[/green] Daemon (pid {info['pid']}) is flushing and stopping.")
+            else:
+                console.print(
+                    f"Daemon pid {info['pid']} at [bold]{daemon.address}[/bold]: "
+                    f"{info['chains']} chain(s) loaded, {info['dirty']} with unflushed writes."
+                )
+        except DaemonError as e:
+            console.print(f"[bold red]Daemon Error:[/bold red] {e}")
+        return
+
+    from chimera_nexus.service.daemon import NexusDaemon
+    from chimera_nexus.storage.repository import StorageError
+
+    server = NexusDaemon(get_repo(), flush_interval=flush_interval, max_bytes=max_memory * 1024 * 1024)
+    try:
+        address = server.start(port=port)
+    except (StorageError, OSError) as e:
+        console.print(f"[bold red]Cannot Start Daemon:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    console.print(f"[green]✓[/green] Serving [bold]{server.repo.base_path}[/bold] at {address} (Ctrl+C to stop).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        console.print("[dim]Daemon stopped; pending writes flushed.[/dim]")
+
+@app.command("sqlite-export")
+def sqlite_export(db_path: str):
+    """
+    Copy the file registry into a SQLite database.
+    """
+    from chimera_nexus.storage.repository import StorageError
+    from chimera_nexus.storage.sqlite import SQLiteNexusRepository
+
+    try:
+        db = SQLiteNexusRepository(db_path)
+        count = db.import_from(get_repo())
+        db.close()
+        console.print(f"[green]✓[/green] Copied {count} chain(s) into [bold]{db_path}[/bold].")
+    except StorageError as e:
+        console.print(f"[bold red]Export Failed:[/bold red] {e}")
+
+@app.command("sqlite-import")
+def sqlite_import(db_path: str):
+    """
+    Restore chains from a SQLite database into the file registry.
+    """
+    from chimera_nexus.storage.repository import StorageError
+    from chimera_nexus.storage.sqlite import SQLiteNexusRepository
+
+    try:
+        if not Path(db_path).exists():
+            raise StorageError(f"Database {db_path} not found.")
+        db = SQLiteNexusRepository(db_path)
+        count = db.export_to(get_repo())
+        db.close()
+        console.print(f"[green]✓[/green] Restored {count} chain(s) from [bold]{db_path}[/bold].")
+    except StorageError as e:
+        console.print(f"[bold red]Import Failed:[/bold red] {e}")
+
 @app.command()
 def simulate_scenario():
     """
     Generates a realistic 'Mock' Hybrid Threat Chain for training purposes.
     """
+    from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge, ThreatDomain, RelationType
+
     try:
         scenario_name = f"Exercise_Blue_Sky_{uuid.uuid4().hex[:4]}"
         chain = HybridThreatChain(name=scenario_name)
@@ -348,7 +1165,7 @@ def simulate_scenario():
             justification="Service outage validates the fake documents."
         ))
 
-        path = repo.save_chain(chain)
+        path = get_repo().save_chain(chain)
         console.print(f"[green]✓[/green] Scenario created at: {path}")
         console.print(f"Use [bold]python -m chimera_nexus.cli.main inspect {chain.id}[/bold] to view.")
 
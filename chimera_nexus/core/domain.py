@@ -1,8 +1,10 @@
+import hashlib
 import uuid
-from datetime import datetime, timedelta
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Any, Iterable, List, Optional, Dict, Set, Tuple
+from pydantic import BaseModel, Field, field_validator, field_serializer, ConfigDict, PrivateAttr
 
 # --- Enumerations (Strict Vocabulary) ---
 
@@ -22,8 +24,51 @@ class RelationType(str, Enum):
     TRIGGERING = "triggering"
     CORRELATION = "correlation"
 
+class ConfidenceLevel(str, Enum):
+    LOW = "low"
+    MODERATE = "moderate"
+    HIGH = "high"
+
+# --- Metric Formulas ---
+
+def information_asymmetry_pressure(urgency: float, avg_confidence: float) -> float:
+    """
+    IAP = Urgency / Average_Confidence
+    Shared by live chains and persisted registry summaries so both agree.
+    """
+    # Avoid division by zero and extreme outliers
+    safe_conf = max(0.1, avg_confidence)
+    return round(urgency / safe_conf, 2)
+
+def chain_coherence(node_count: int, edge_count: int, weight_sum: float) -> float:
+    """
+    CCS = Average_Edge_Weight * min(1, Edges / (Nodes - 1))
+    """
+    if edge_count == 0:
+        return 0.0
+    
+    avg_weight = weight_sum / edge_count
+    # Density calculation: Edges / Possible Edges (Nodes - 1 for a simple line)
+    if node_count < 2:
+        return 0.0
+        
+    density = edge_count / (node_count - 1)
+    return round(avg_weight * min(1.0, density), 2)
+
+def epoch_seconds(moment: datetime) -> float:
+    # Node timestamps default to naive UTC (datetime.utcnow)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
 # --- Domain Entities ---
 
+_DIGEST_MODULUS = 1 << 256
+
+def _item_digest(tag: bytes, item: BaseModel) -> int:
+    payload = tag + item.model_dump_json().encode('utf-8')
+    return int.from_bytes(hashlib.sha256(payload).digest(), 'big')
+
 class HybridNode(BaseModel):
     """
     Represents a discrete signal or event within a hybrid environment.
@@ -65,20 +110,240 @@ class HybridThreatChain(BaseModel):
     edges: List[HybridEdge] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Count of committed writes, maintained by the repository for compare-and-swap
+    version: int = Field(0, ge=0)
+
+    # Derived state over `nodes`/`edges`; never persisted, rebuilt on construction/load.
+    # Mutations must go through add_node/add_edge to keep it consistent.
+    _outgoing: Dict[uuid.UUID, List[HybridEdge]] = PrivateAttr(default_factory=dict)
+    _incoming: Dict[uuid.UUID, List[HybridEdge]] = PrivateAttr(default_factory=dict)
+    _edge_keys: Set[Tuple[uuid.UUID, uuid.UUID, RelationType]] = PrivateAttr(default_factory=set)
+    # Running aggregates behind the O(1) metrics
+    _confidence_sum: float = PrivateAttr(default=0.0)
+    _weight_sum: float = PrivateAttr(default=0.0)
+    _domain_counts: Dict[ThreatDomain, int] = PrivateAttr(default_factory=dict)
+    # Multiset hash of nodes/edges; computed lazily, then maintained incrementally
+    _content_sum: Optional[int] = PrivateAttr(default=None)
+    # (epoch seconds, insertion seq, node id) in time order; built lazily, then maintained.
+    # Keyed on epoch seconds so naive (UTC) and aware timestamps compare.
+    _chronology: Optional[List[Tuple[float, int, uuid.UUID]]] = PrivateAttr(default=None)
+    _chronology_seq: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: object) -> None:
+        self._rebuild_indexes()
+
+    @field_serializer("nodes", mode="wrap")
+    def _serialize_nodes(self, nodes, handler, info):
+        if isinstance(nodes, dict):
+            return handler(nodes)
+        # Compact store: same output, built from its columns without materializing nodes
+        return nodes.dump(json_mode=info.mode_is_json())
+
+    @property
+    def is_compact(self) -> bool:
+        return not isinstance(self.nodes, dict)
+
+    def use_compact_nodes(self, records: Optional[Iterable[Any]] = None) -> None:
+        """
+        Switches `nodes` to a CompactNodeStore, which holds signals in typed
+        columns and builds HybridNode objects only on access (about a third
+        of the memory on large chains; see benchmarks/bench_memory.py). `records`, if given, are raw node
+        mappings to validate into the store instead of the current nodes;
+        loading that way never holds more than one HybridNode at a time.
+        The public API and serialized form are unchanged.
+        """
+        from chimera_nexus.core.node_store import CompactNodeStore
+
+        if records is not None:
+            store = CompactNodeStore.from_records(records)
+        elif self.is_compact:
+            return
+        else:
+            store = CompactNodeStore(self.nodes.values())
+        self.nodes = store
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        self._outgoing = {}
+        self._incoming = {}
+        self._edge_keys = set()
+        self._confidence_sum = 0.0
+        self._weight_sum = 0.0
+        self._domain_counts = {}
+        self._content_sum = None
+        self._chronology = None
+        if self.is_compact:
+            # Aggregate straight from the columns instead of materializing every node
+            self._confidence_sum = self.nodes.confidence_sum()
+            self._domain_counts = self.nodes.domain_counts()
+        else:
+            for node in self.nodes.values():
+                self._count_node(node, 1)
+        for edge in self.edges:
+            self._index_edge(edge)
+
+    def _count_node(self, node: HybridNode, sign: int) -> None:
+        self._confidence_sum += sign * node.confidence
+        if self._content_sum is not None:
+            self._content_sum = (self._content_sum + sign * _item_digest(b"N", node)) % _DIGEST_MODULUS
+        remaining = self._domain_counts.get(node.domain, 0) + sign
+        if remaining:
+            self._domain_counts[node.domain] = remaining
+        else:
+            del self._domain_counts[node.domain]
+
+    def _index_edge(self, edge: HybridEdge) -> None:
+        self._outgoing.setdefault(edge.source_id, []).append(edge)
+        self._incoming.setdefault(edge.target_id, []).append(edge)
+        self._edge_keys.add((edge.source_id, edge.target_id, edge.relation_type))
+        self._weight_sum += edge.weight
+        if self._content_sum is not None:
+            self._content_sum = (self._content_sum + _item_digest(b"E", edge)) % _DIGEST_MODULUS
+
+    def content_digest(self) -> str:
+        """
+        Hash of the chain's nodes and edges (not its name or timestamps).
+        A sum of per-item SHA-256 digests, so additions update it in O(1)
+        once it has been computed; the first call is O(nodes + edges).
+        """
+        if self._content_sum is None:
+            total = 0
+            for node in self.nodes.values():
+                total += _item_digest(b"N", node)
+            for edge in self.edges:
+                total += _item_digest(b"E", edge)
+            self._content_sum = total % _DIGEST_MODULUS
+        return f"{self._content_sum:064x}"
+
+    def seed_content_digest(self, digest: str) -> None:
+        """
+        Adopts `digest`, known to match the current nodes and edges (e.g. a
+        registry entry for the unchanged file), so the first content_digest
+        call after additions costs O(additions). No-op once it is known.
+        """
+        if self._content_sum is None:
+            self._content_sum = int(digest, 16)
+
+    def detached_copy(self) -> "HybridThreatChain":
+        """
+        Copy that shares the immutable nodes but owns its containers and indexes,
+        so mutating it never affects the original.
+        """
+        copy = self.model_copy(update={"nodes": self.nodes.copy(), "edges": list(self.edges)})
+        copy._rebuild_indexes()
+        copy._content_sum = self._content_sum
+        if self._chronology is not None:
+            copy._chronology = list(self._chronology)
+            copy._chronology_seq = self._chronology_seq
+        return copy
+
+    def adopt(self, other: "HybridThreatChain") -> None:
+        """
+        Takes over `other`'s nodes, edges, version and timestamps in place.
+        The repository uses this to hand callers the merged chain after a
+        write that raced with another writer.
+        """
+        self.nodes = other.nodes
+        self.edges = other.edges
+        self.version = other.version
+        self.updated_at = other.updated_at
+        self._rebuild_indexes()
+
+    def chronological_nodes(self) -> List[HybridNode]:
+        """
+        Nodes ordered by timestamp, ties in insertion order (as a stable sort
+        of `nodes.values()` would give). The order is sorted once on first
+        use and then kept up to date by add_node in O(log n) per addition.
+        """
+        if self._chronology is None:
+            chronology = [(epoch_seconds(node.timestamp), seq, node_id) for seq, (node_id, node) in enumerate(self.nodes.items())]
+            chronology.sort()
+            self._chronology = chronology
+            self._chronology_seq = len(chronology)
+        nodes = self.nodes
+        return [nodes[node_id] for _, _, node_id in self._chronology]
+
+    def _place_chronologically(self, node: HybridNode, key: float, previous: Optional[HybridNode]) -> None:
+        chronology = self._chronology
+        seq = None
+        if previous is not None:
+            # A replaced node keeps its dict position, so it keeps its tie-break rank
+            i = bisect_left(chronology, (epoch_seconds(previous.timestamp),))
+            while chronology[i][2] != previous.id:
+                i += 1
+            seq = chronology.pop(i)[1]
+        if seq is None:
+            seq = self._chronology_seq
+            self._chronology_seq = seq + 1
+        insort(chronology, (key, seq, node.id))
 
     def add_node(self, node: HybridNode) -> None:
+        # Computed before any state changes, so a bad timestamp leaves the chain untouched
+        key = epoch_seconds(node.timestamp)
+        previous = self.nodes.get(node.id)
+        if previous is not None:
+            self._count_node(previous, -1)
         self.nodes[node.id] = node
+        self._count_node(node, 1)
+        if self._chronology is not None:
+            self._place_chronologically(node, key, previous)
         self.updated_at = datetime.utcnow()
 
-    def add_edge(self, edge: HybridEdge) -> None:
+    def add_edge(self, edge: HybridEdge, reject_duplicates: bool = False) -> None:
         if edge.source_id not in self.nodes or edge.target_id not in self.nodes:
             raise ValueError("Edge references non-existent nodes in this chain.")
+        if reject_duplicates and self.has_edge(edge.source_id, edge.target_id, edge.relation_type):
+            raise ValueError("An identical link already exists between these signals.")
         self.edges.append(edge)
+        self._index_edge(edge)
         self.updated_at = datetime.utcnow()
 
+    # --- Adjacency Queries (O(1) lookup, O(degree) results) ---
+
+    def out_edges(self, node_id: uuid.UUID) -> List[HybridEdge]:
+        return list(self._outgoing.get(node_id, ()))
+
+    def in_edges(self, node_id: uuid.UUID) -> List[HybridEdge]:
+        return list(self._incoming.get(node_id, ()))
+
+    def successors(self, node_id: uuid.UUID) -> List[uuid.UUID]:
+        """
+        Distinct targets of links leaving `node_id`, in insertion order.
+        """
+        return list(dict.fromkeys(e.target_id for e in self._outgoing.get(node_id, ())))
+
+    def predecessors(self, node_id: uuid.UUID) -> List[uuid.UUID]:
+        """
+        Distinct sources of links entering `node_id`, in insertion order.
+        """
+        return list(dict.fromkeys(e.source_id for e in self._incoming.get(node_id, ())))
+
+    def has_edge(
+        self,
+        source_id: uuid.UUID,
+        target_id: uuid.UUID,
+        relation_type: Optional[RelationType] = None
+    ) -> bool:
+        """
+        True if a link exists from source to target (of the given relation, if set).
+        """
+        if relation_type is not None:
+            return (source_id, target_id, relation_type) in self._edge_keys
+        return any(e.target_id == target_id for e in self._outgoing.get(source_id, ()))
+
     @property
     def domain_mix(self) -> List[ThreatDomain]:
-        return list({n.domain for n in self.nodes.values()})
+        return list(self._domain_counts)
+
+    @property
+    def domain_counts(self) -> Dict[ThreatDomain, int]:
+        return dict(self._domain_counts)
+
+    @property
+    def average_confidence(self) -> float:
+        if not self.nodes:
+            return 0.0
+        return self._confidence_sum / len(self.nodes)
 
     @property
     def coherence_score(self) -> float:
@@ -86,17 +351,7 @@ class HybridThreatChain(BaseModel):
         Calculates Chain Coherence Score (CCS).
         Higher score = Logic is sound and data is interconnected.
         """
-        if not self.edges:
-            return 0.0
-        
-        avg_weight = sum(e.weight for e in self.edges) / len(self.edges)
-        # Density calculation: Edges / Possible Edges (Nodes - 1 for a simple line)
-        node_count = len(self.nodes)
-        if node_count < 2:
-            return 0.0
-            
-        density = len(self.edges) / (node_count - 1)
-        return round(avg_weight * min(1.0, density), 2)
+        return chain_coherence(len(self.nodes), len(self.edges), self._weight_sum)
 
     def calculate_iap(self, urgency: float) -> float:
         """
@@ -106,8 +361,28 @@ class HybridThreatChain(BaseModel):
         if not self.nodes:
             return 0.0
         
-        avg_conf = sum(n.confidence for n in self.nodes.values()) / len(self.nodes)
-        # Avoid division by zero and extreme outliers
-        safe_conf = max(0.1, avg_conf)
-        
-        return round(urgency / safe_conf, 2)
\ No newline at end of file
+        return information_asymmetry_pressure(urgency, self.average_confidence)
+
+    def verify_metrics(self, tolerance: float = 1e-9) -> None:
+        """
+        Debug check: compares the running aggregates with a full recompute.
+        Raises ValueError describing the first inconsistency found.
+        """
+        confidence_sum = sum(n.confidence for n in self.nodes.values())
+        if abs(confidence_sum - self._confidence_sum) > tolerance:
+            raise ValueError(f"Confidence aggregate drifted: {self._confidence_sum} != {confidence_sum}")
+
+        weight_sum = sum(e.weight for e in self.edges)
+        if abs(weight_sum - self._weight_sum) > tolerance:
+            raise ValueError(f"Edge weight aggregate drifted: {self._weight_sum} != {weight_sum}")
+
+        domain_counts: Dict[ThreatDomain, int] = {}
+        for node in self.nodes.values():
+            domain_counts[node.domain] = domain_counts.get(node.domain, 0) + 1
+        if domain_counts != self._domain_counts:
+            raise ValueError(f"Domain histogram drifted: {self._domain_counts} != {domain_counts}")
+
+        if self._chronology is not None:
+            order = [n.id for n in sorted(self.nodes.values(), key=lambda n: epoch_seconds(n.timestamp))]
+            if order != [node_id for _, _, node_id in self._chronology]:
+                raise ValueError("Chronological node order drifted from the node timestamps")
\ No newline at end of file
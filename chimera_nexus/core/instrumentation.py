@@ -0,0 +1,149 @@
+"""
+Lightweight timing spans for locating where a command spends its time.
+
+Disabled by default. While disabled, `span()` returns a shared no-op
+context manager and `traced` functions cost one global check, so the
+instrumented code paths run at full speed. Spans are per-process: work done
+inside worker processes (parallel loading/auditing) is not recorded.
+"""
+import functools
+import json
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+class SpanRecord(NamedTuple):
+    """
+    One completed span. `start` is seconds since recording was enabled;
+    `self_seconds` excludes time spent in nested spans.
+    """
+    name: str
+    start: float
+    duration: float
+    self_seconds: float
+    depth: int
+    attrs: Dict[str, Any]
+
+class PhaseStats(NamedTuple):
+    name: str
+    calls: int
+    total_seconds: float
+    self_seconds: float
+
+_enabled = False
+_origin = 0.0
+_records: List[SpanRecord] = []
+_stack: List["_Span"] = []
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+_NOOP = _NoopSpan()
+
+class _Span:
+    __slots__ = ("name", "attrs", "started", "child_seconds")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self.child_seconds = 0.0
+
+    def __enter__(self):
+        _stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.started
+        _stack.pop()
+        if _stack:
+            _stack[-1].child_seconds += duration
+        _records.append(SpanRecord(
+            self.name, self.started - _origin, duration,
+            duration - self.child_seconds, len(_stack), self.attrs
+        ))
+        return False
+
+    def set(self, **attrs) -> None:
+        """
+        Attaches details discovered inside the span (sizes, counts).
+        """
+        self.attrs.update(attrs)
+
+def span(name: str, **attrs):
+    """
+    Times the enclosed block: `with span("codec.decode", path=p): ...`
+    """
+    if not _enabled:
+        return _NOOP
+    return _Span(name, attrs)
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    Decorator form of `span` for whole functions and methods.
+    """
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+# --- Control ---
+
+def enable() -> None:
+    global _enabled, _origin
+    reset()
+    _origin = time.perf_counter()
+    _enabled = True
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+def is_enabled() -> bool:
+    return _enabled
+
+def reset() -> None:
+    _records.clear()
+    _stack.clear()
+
+def records() -> List[SpanRecord]:
+    return list(_records)
+
+# --- Reporting ---
+
+def summarize(spans: Optional[List[SpanRecord]] = None) -> List[PhaseStats]:
+    """
+    Aggregates spans by name, slowest self time first.
+    """
+    totals: Dict[str, List[float]] = {}
+    for record in _records if spans is None else spans:
+        entry = totals.setdefault(record.name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += record.duration
+        entry[2] += record.self_seconds
+    stats = [PhaseStats(name, int(calls), total, own) for name, (calls, total, own) in totals.items()]
+    return sorted(stats, key=lambda s: s.self_seconds, reverse=True)
+
+def write_jsonl(path: str) -> int:
+    """
+    Writes one JSON object per span, in completion order. Returns the span count.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for record in _records:
+            f.write(json.dumps(record._asdict(), default=str) + "\n")
+    return len(_records)
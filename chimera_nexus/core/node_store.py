@@ -0,0 +1,229 @@
+from array import array
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Dict, Iterable, Iterator, List
+from uuid import UUID
+from chimera_nexus.core.domain import HybridNode, ThreatDomain
+
+_DOMAINS: List[ThreatDomain] = list(ThreatDomain)
+_DOMAIN_CODES = {domain: code for code, domain in enumerate(_DOMAINS)}
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+class _NodeValues(ValuesView):
+    # Sized and re-iterable like dict.values(); rows are read straight from the columns
+    def __iter__(self) -> Iterator[HybridNode]:
+        store = self._mapping
+        return (store._node(row) for row in store._live_rows())
+
+class _NodeItems(ItemsView):
+    def __iter__(self) -> Iterator:
+        store = self._mapping
+        for row in store._live_rows():
+            node = store._node(row)
+            yield node.id, node
+
+class CompactNodeStore(MutableMapping):
+    """
+    Column-oriented `Dict[UUID, HybridNode]` replacement for very large chains.
+
+    Each signal occupies one row: its id in a bytearray, numeric fields in
+    typed arrays and its strings as codes into a shared, de-duplicated string
+    table, with a `uuid.int -> row` index for lookups. `HybridNode` objects are
+    only built (without re-validation) when a value is accessed and are not
+    retained, so callers must not rely on identity between two accesses.
+    Replacing an id overwrites its row in place, keeping dict ordering.
+    """
+    def __init__(self, nodes: Iterable[HybridNode] = ()):
+        self._ids = bytearray()
+        self._rows: Dict[int, int] = {}
+        self._timestamps = array('q')
+        self._confidence = array('d')
+        self._cost = array('d')
+        self._domain = array('B')
+        self._signal_type = array('I')
+        self._description = array('I')
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        # Sparse: only timezone-aware timestamps carry a tzinfo
+        self._tz: Dict[int, tzinfo] = {}
+        self._deleted: set = set()
+        for node in nodes:
+            self[node.id] = node
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "CompactNodeStore":
+        """
+        Validates raw node mappings one at a time, so no more than one
+        HybridNode is alive while a large chain is being loaded.
+        """
+        store = cls()
+        for record in records:
+            node = HybridNode.model_validate(record)
+            store[node.id] = node
+        return store
+
+    # --- Encoding ---
+
+    def _intern(self, text: str) -> int:
+        code = self._string_codes.get(text)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(text)
+            self._string_codes[text] = code
+        return code
+
+    def _write_row(self, row: int, node: HybridNode) -> None:
+        stamp = node.timestamp
+        if stamp.tzinfo is not None:
+            self._tz[row] = stamp.tzinfo
+            stamp = stamp.replace(tzinfo=None)
+        else:
+            self._tz.pop(row, None)
+        self._timestamps[row] = (stamp - _EPOCH) // _MICROSECOND
+        self._confidence[row] = node.confidence
+        self._cost[row] = node.cost_estimate
+        self._domain[row] = _DOMAIN_CODES[node.domain]
+        self._signal_type[row] = self._intern(node.signal_type)
+        self._description[row] = self._intern(node.description)
+
+    def _timestamp(self, row: int) -> datetime:
+        stamp = _EPOCH + timedelta(microseconds=self._timestamps[row])
+        tz = self._tz.get(row)
+        return stamp if tz is None else stamp.replace(tzinfo=tz)
+
+    def _node(self, row: int) -> HybridNode:
+        return HybridNode.model_construct(
+            id=UUID(bytes=bytes(self._ids[row * 16:row * 16 + 16])),
+            timestamp=self._timestamp(row),
+            domain=_DOMAINS[self._domain[row]],
+            signal_type=self._strings[self._signal_type[row]],
+            confidence=self._confidence[row],
+            cost_estimate=self._cost[row],
+            description=self._strings[self._description[row]]
+        )
+
+    def _live_rows(self) -> Iterator[int]:
+        if not self._deleted:
+            return iter(range(len(self._confidence)))
+        return (row for row in range(len(self._confidence)) if row not in self._deleted)
+
+    # --- Mapping API ---
+
+    def __getitem__(self, key: UUID) -> HybridNode:
+        return self._node(self._rows[key.int])
+
+    def __setitem__(self, key: UUID, node: HybridNode) -> None:
+        if key != node.id:
+            raise ValueError("CompactNodeStore keys must equal the node id.")
+        row = self._rows.get(key.int)
+        if row is None:
+            row = len(self._confidence)
+            self._rows[key.int] = row
+            self._ids += key.bytes
+            self._timestamps.append(0)
+            self._confidence.append(0.0)
+            self._cost.append(0.0)
+            self._domain.append(0)
+            self._signal_type.append(0)
+            self._description.append(0)
+        self._write_row(row, node)
+
+    def __delitem__(self, key: UUID) -> None:
+        row = self._rows.pop(key.int)
+        self._deleted.add(row)
+        self._tz.pop(row, None)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, UUID) and key.int in self._rows
+
+    def __iter__(self) -> Iterator[UUID]:
+        ids = self._ids
+        for row in self._live_rows():
+            yield UUID(bytes=bytes(ids[row * 16:row * 16 + 16]))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def values(self) -> ValuesView:
+        return _NodeValues(self)
+
+    def items(self) -> ItemsView:
+        return _NodeItems(self)
+
+    def __repr__(self) -> str:
+        return f"CompactNodeStore({len(self)} nodes, {len(self._strings)} distinct strings)"
+
+    def copy(self) -> "CompactNodeStore":
+        clone = CompactNodeStore()
+        clone._ids = bytearray(self._ids)
+        clone._rows = dict(self._rows)
+        for name in ("_timestamps", "_confidence", "_cost", "_domain", "_signal_type", "_description"):
+            setattr(clone, name, getattr(self, name)[:])
+        clone._strings = list(self._strings)
+        clone._string_codes = dict(self._string_codes)
+        clone._tz = dict(self._tz)
+        clone._deleted = set(self._deleted)
+        return clone
+
+    # --- Column Aggregates (no materialization) ---
+
+    def confidence_sum(self) -> float:
+        if not self._deleted:
+            return sum(self._confidence)
+        return sum(self._confidence[row] for row in self._live_rows())
+
+    def domain_counts(self) -> Dict[ThreatDomain, int]:
+        """
+        Signals per domain, in order of first appearance (like the dict-backed chain).
+        """
+        counts: Dict[int, int] = {}
+        for row in self._live_rows():
+            code = self._domain[row]
+            counts[code] = counts.get(code, 0) + 1
+        return {_DOMAINS[code]: count for code, count in counts.items()}
+
+    # --- Serialization ---
+
+    def dump(self, json_mode: bool) -> Dict[Any, Dict[str, Any]]:
+        """
+        The same structure pydantic produces for `Dict[UUID, HybridNode]`,
+        built straight from the columns.
+        """
+        dumped: Dict[Any, Dict[str, Any]] = {}
+        ids, strings = self._ids, self._strings
+        for row in self._live_rows():
+            node_id = UUID(bytes=bytes(ids[row * 16:row * 16 + 16]))
+            stamp = self._timestamp(row)
+            domain = _DOMAINS[self._domain[row]]
+            if json_mode:
+                node_id = str(node_id)
+                stamp = _isoformat(stamp)
+                domain = domain.value
+            dumped[node_id] = {
+                "id": node_id,
+                "timestamp": stamp,
+                "domain": domain,
+                "signal_type": strings[self._signal_type[row]],
+                "confidence": self._confidence[row],
+                "cost_estimate": self._cost[row],
+                "description": strings[self._description[row]]
+            }
+        return dumped
+
+    def approximate_bytes(self) -> int:
+        """
+        Resident size of the columns, index and string table.
+        """
+        arrays = (self._timestamps, self._confidence, self._cost, self._domain, self._signal_type, self._description)
+        size = len(self._ids) + sum(a.itemsize * len(a) for a in arrays)
+        size += len(self._rows) * 112  # int key + int row + hash table slot
+        size += sum(49 + len(s) for s in self._strings)
+        return size
+
+def _isoformat(stamp: datetime) -> str:
+    # Matches pydantic's JSON rendering, which writes UTC as 'Z'
+    text = stamp.isoformat()
+    if stamp.tzinfo is not None and stamp.utcoffset() == timedelta(0) and text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return text
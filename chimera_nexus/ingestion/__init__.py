@@ -0,0 +1,3 @@
+from .stream import SignalIngestor, IngestReport, IngestReject, iter_records, detect_format
+
+__all__ = ["SignalIngestor", "IngestReport", "IngestReject", "iter_records", "detect_format"]
\ No newline at end of file
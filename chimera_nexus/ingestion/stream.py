@@ -0,0 +1,140 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Union
+from pydantic import BaseModel, Field, ValidationError
+from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge
+from chimera_nexus.storage.repository import NexusRepository
+
+FORMATS = ("ndjson", "csv")
+
+class IngestReject(BaseModel):
+    """
+    A record that could not be ingested, with its 1-based source line.
+    """
+    line: int
+    error: str
+
+class IngestReport(BaseModel):
+    nodes_added: int = 0
+    edges_added: int = 0
+    batches: int = 0
+    rejects: List[IngestReject] = Field(default_factory=list)
+
+class RawRecord(NamedTuple):
+    line: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+def detect_format(source: str) -> str:
+    return "csv" if source.lower().endswith(".csv") else "ndjson"
+
+def iter_records(stream: TextIO, format: str) -> Iterator[RawRecord]:
+    """
+    Yields one raw record per input row without holding the input in memory.
+    Unparseable rows are yielded with an error instead of raising.
+    """
+    if format == "ndjson":
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                yield RawRecord(line_no, None, f"Invalid JSON: {e}")
+                continue
+            if not isinstance(data, dict):
+                yield RawRecord(line_no, None, "Record is not a JSON object.")
+                continue
+            yield RawRecord(line_no, data, None)
+
+    elif format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Empty cells fall back to model defaults rather than failing validation
+            data = {k: v for k, v in row.items() if k and v not in (None, "")}
+            if None in row:
+                yield RawRecord(reader.line_num, None, "Row has more cells than the header.")
+                continue
+            yield RawRecord(reader.line_num, data, None)
+
+    else:
+        raise ValueError(f"Unknown ingest format '{format}'. Choose from: {', '.join(FORMATS)}.")
+
+def _parse(data: Dict[str, Any]) -> Union[HybridNode, HybridEdge]:
+    """
+    Records are nodes unless they say `kind: edge` or carry a source_id.
+    """
+    fields = dict(data)
+    kind = str(fields.pop("kind", "edge" if "source_id" in fields else "node")).lower()
+    if kind == "node":
+        return HybridNode.model_validate(fields)
+    if kind == "edge":
+        return HybridEdge.model_validate(fields)
+    raise ValueError(f"Unknown record kind '{kind}' (expected 'node' or 'edge').")
+
+class SignalIngestor:
+    """
+    Streams node/edge records into a chain in batches.
+    Each batch is validated record by record; invalid records are reported
+    with their line number and skipped, and the valid remainder is committed
+    with a single journal append. Nodes must appear before edges that use them.
+    """
+    def __init__(self, repo: NexusRepository, batch_size: int = 500, reject_duplicate_edges: bool = True):
+        self.repo = repo
+        self.batch_size = max(1, batch_size)
+        self.reject_duplicate_edges = reject_duplicate_edges
+
+    def ingest(self, chain: HybridThreatChain, records: Iterable[RawRecord]) -> IngestReport:
+        report = IngestReport()
+        batch: List[RawRecord] = []
+        for record in records:
+            if record.error is not None:
+                report.rejects.append(IngestReject(line=record.line, error=record.error))
+                continue
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                self._commit(chain, batch, report)
+                batch = []
+        if batch:
+            self._commit(chain, batch, report)
+        return report
+
+    def _commit(self, chain: HybridThreatChain, batch: List[RawRecord], report: IngestReport) -> None:
+        nodes: List[HybridNode] = []
+        edges: List[HybridEdge] = []
+        known_ids = set()
+        edge_keys = set()
+
+        for record in batch:
+            try:
+                item = _parse(record.data or {})
+            except (ValidationError, ValueError) as e:
+                report.rejects.append(IngestReject(line=record.line, error=str(e)))
+                continue
+
+            if isinstance(item, HybridNode):
+                nodes.append(item)
+                known_ids.add(item.id)
+                continue
+
+            # Edges are checked here so the batch commit itself cannot fail halfway
+            for endpoint in (item.source_id, item.target_id):
+                if endpoint not in chain.nodes and endpoint not in known_ids:
+                    report.rejects.append(IngestReject(
+                        line=record.line,
+                        error=f"Edge references unknown signal {endpoint}."
+                    ))
+                    break
+            else:
+                key = (item.source_id, item.target_id, item.relation_type)
+                if self.reject_duplicate_edges and (key in edge_keys or chain.has_edge(*key)):
+                    report.rejects.append(IngestReject(line=record.line, error="Duplicate link."))
+                    continue
+                edge_keys.add(key)
+                edges.append(item)
+
+        if nodes or edges:
+            self.repo.append_mutations(chain, nodes=nodes, edges=edges)
+            report.nodes_added += len(nodes)
+            report.edges_added += len(edges)
+            report.batches += 1
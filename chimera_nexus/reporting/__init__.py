@@ -1,3 +1,3 @@
-from .engine import ReportEngine
+from .engine import ReportEngine, DotOptions
 
-__all__ = ["ReportEngine"]
\ No newline at end of file
+__all__ = ["ReportEngine", "DotOptions"]
\ No newline at end of file
@@ -1,83 +1,203 @@
 import textwrap
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 from pathlib import Path
+from uuid import UUID
+from pydantic import BaseModel, Field
 
 from chimera_nexus.core.domain import HybridThreatChain, HybridNode, RelationType, ThreatDomain
 from chimera_nexus.analysis.auditor import AuditFinding
+from chimera_nexus.analysis.graph import ChainGraph
+from chimera_nexus.core.instrumentation import span, traced
+
+# Domain Colors (Muted, professional palette)
+DOMAIN_COLORS = {
+    ThreatDomain.CYBER: "#d1e7dd",       # Light Green
+    ThreatDomain.INFORMATION: "#fff3cd", # Light Yellow
+    ThreatDomain.ECONOMIC: "#f8d7da",    # Light Red
+    ThreatDomain.POLITICAL: "#e2e3e5",   # Grey
+    ThreatDomain.SOCIAL: "#d1ecf1",      # Light Cyan
+    ThreatDomain.PHYSICAL: "#cff4fc",
+    ThreatDomain.PSYCHOLOGICAL: "#f1d1f1"
+}
+
+class DotOptions(BaseModel):
+    """
+    Level-of-detail controls for DOT export, keeping large chains renderable.
+    The defaults reproduce the full, unreduced graph.
+    """
+    cluster_domains: bool = Field(False, description="Group signals into one subgraph cluster per domain")
+    aggregate_edges: bool = Field(False, description="Merge parallel links of the same relation, summing weights")
+    min_confidence: float = Field(0.0, ge=0.0, le=1.0, description="Drop signals below this confidence")
+    min_weight: float = Field(0.0, ge=0.0, le=1.0, description="Drop links below this weight")
+    top_k: Optional[int] = Field(None, ge=1, description="Keep only the K most central signals (PageRank)")
+
+    @property
+    def reduces(self) -> bool:
+        return self.min_confidence > 0.0 or self.min_weight > 0.0 or self.top_k is not None
 
 class ReportEngine:
     """
     Generates decision-support artifacts.
     Adheres to the principle: 'Explainable over Powerful'.
+
+    Every artifact is produced by an `iter_*` generator that yields it piece
+    by piece (header, one line per node/edge, ...); `write_*` streams those
+    pieces to an open text file and `generate_*` joins them into a string,
+    so all three produce identical output.
     """
+    # Pieces are gathered into blocks of this many before each fp.write()
+    WRITE_BATCH = 512
+
+    @classmethod
+    def _write(cls, pieces: Iterable[str], fp: TextIO) -> None:
+        batch = []
+        for piece in pieces:
+            batch.append(piece)
+            if len(batch) >= cls.WRITE_BATCH:
+                fp.write("".join(batch))
+                batch.clear()
+        if batch:
+            fp.write("".join(batch))
 
-    def generate_graphviz_dot(self, chain: HybridThreatChain) -> str:
+    @traced("report.dot")
+    def generate_graphviz_dot(self, chain: HybridThreatChain, options: Optional[DotOptions] = None) -> str:
         """
         Generates a standard Graphviz DOT string.
         Visualizes the topology of the threat chain.
         """
-        lines = ["digraph HybridThreatChain {"]
-        lines.append('  rankdir="LR";') # Left-to-Right flow
-        lines.append('  node [fontname="Helvetica", shape="box", style="filled"];')
-        lines.append('  edge [fontname="Helvetica", fontsize=10];')
-        
-        # Domain Colors (Muted, professional palette)
-        domain_colors = {
-            ThreatDomain.CYBER: "#d1e7dd",       # Light Green
-            ThreatDomain.INFORMATION: "#fff3cd", # Light Yellow
-            ThreatDomain.ECONOMIC: "#f8d7da",    # Light Red
-            ThreatDomain.POLITICAL: "#e2e3e5",   # Grey
-            ThreatDomain.SOCIAL: "#d1ecf1",      # Light Cyan
-            ThreatDomain.PHYSICAL: "#cff4fc",
-            ThreatDomain.PSYCHOLOGICAL: "#f1d1f1"
-        }
+        return "".join(self.iter_graphviz_dot(chain, options))
+
+    @traced("report.dot")
+    def write_graphviz_dot(self, chain: HybridThreatChain, fp: TextIO, options: Optional[DotOptions] = None) -> None:
+        self._write(self.iter_graphviz_dot(chain, options), fp)
+
+    def iter_graphviz_dot(self, chain: HybridThreatChain, options: Optional[DotOptions] = None) -> Iterator[str]:
+        options = options or DotOptions()
+        yield "digraph HybridThreatChain {"
+        yield '\n  rankdir="LR";' # Left-to-Right flow
+        yield '\n  node [fontname="Helvetica", shape="box", style="filled"];'
+        yield '\n  edge [fontname="Helvetica", fontsize=10];'
+
+        if not options.reduces:
+            nodes = chain.nodes.values()
+            edges = chain.edges
+        else:
+            nodes = self._select_nodes(chain, options)
+            kept = {node.id for node in nodes}
+            edges = [
+                e for e in chain.edges
+                if e.source_id in kept and e.target_id in kept and e.weight >= options.min_weight
+            ]
+            yield f"\n  // Showing {len(nodes)} of {len(chain.nodes)} signals and {len(edges)} of {len(chain.edges)} links"
 
         # 1. Nodes
-        for node in chain.nodes.values():
-            color = domain_colors.get(node.domain, "#ffffff")
-            # Visual cue for confidence: Line width
-            penwidth = "3.0" if node.confidence > 0.8 else "1.0"
-            
-            # Label formatting
-            label = f"<{node.signal_type.upper()}<BR/>" \
-                    f"<FONT POINT-SIZE='10'>{node.domain.value}</FONT><BR/>" \
-                    f"<FONT POINT-SIZE='9'>Conf: {node.confidence}</FONT>>"
-            
-            lines.append(
-                f'  "{node.id}" [label={label}, fillcolor="{color}", penwidth="{penwidth}"];'
-            )
+        if options.cluster_domains:
+            by_domain: Dict[ThreatDomain, List[HybridNode]] = {}
+            for node in nodes:
+                by_domain.setdefault(node.domain, []).append(node)
+            for domain, members in by_domain.items():
+                yield f'\n  subgraph cluster_{domain.value} {{'
+                yield f'\n    label="{domain.value.upper()}"; style="rounded"; color="#6c757d";'
+                for node in members:
+                    yield "\n  " + self._dot_node(node)
+                yield "\n  }"
+        else:
+            for node in nodes:
+                yield "\n" + self._dot_node(node)
 
         # 2. Edges
-        for edge in chain.edges:
-            style = "solid"
-            if edge.relation_type == RelationType.CORRELATION:
-                style = "dashed"
-            
-            # Label edges with justification if weight is high
-            label = edge.relation_type.value
-            if edge.weight > 0.8:
-                label += f"\\n(High Conf)"
-            
-            lines.append(
-                f'  "{edge.source_id}" -> "{edge.target_id}" [label="{label}", style="{style}"];'
-            )
+        if options.aggregate_edges:
+            groups: Dict[Tuple[UUID, UUID, RelationType], List[float]] = {}
+            for edge in edges:
+                groups.setdefault((edge.source_id, edge.target_id, edge.relation_type), []).append(edge.weight)
+            for (source_id, target_id, relation), weights in groups.items():
+                if len(weights) == 1:
+                    yield "\n" + self._dot_edge(source_id, target_id, relation, weights[0])
+                    continue
+                # Parallel links of one relation collapse into a single, thicker arrow
+                total = sum(weights)
+                label = f"{relation.value}\\n(x{len(weights)}, sum {total:.2f})"
+                yield (
+                    f'\n  "{source_id}" -> "{target_id}" [label="{label}", '
+                    f'style="{self._dot_edge_style(relation)}", penwidth="{min(1.0 + total, 6.0):.1f}"];'
+                )
+        else:
+            for edge in edges:
+                yield "\n" + self._dot_edge(edge.source_id, edge.target_id, edge.relation_type, edge.weight)
+
+        yield "\n}"
+
+    @staticmethod
+    def _select_nodes(chain: HybridThreatChain, options: DotOptions) -> List[HybridNode]:
+        nodes = [n for n in chain.nodes.values() if n.confidence >= options.min_confidence]
+        if options.top_k is not None and len(nodes) > options.top_k:
+            ranks = ChainGraph.from_chain(chain).pagerank()
+            top = set(sorted((n.id for n in nodes), key=ranks.__getitem__, reverse=True)[:options.top_k])
+            nodes = [n for n in nodes if n.id in top]
+        return nodes
+
+    @staticmethod
+    def _dot_node(node: HybridNode) -> str:
+        color = DOMAIN_COLORS.get(node.domain, "#ffffff")
+        # Visual cue for confidence: Line width
+        penwidth = "3.0" if node.confidence > 0.8 else "1.0"
+        
+        # Label formatting
+        label = f"<{node.signal_type.upper()}<BR/>" \
+                f"<FONT POINT-SIZE='10'>{node.domain.value}</FONT><BR/>" \
+                f"<FONT POINT-SIZE='9'>Conf: {node.confidence}</FONT>>"
+        
+        return f'  "{node.id}" [label={label}, fillcolor="{color}", penwidth="{penwidth}"];'
 
-        lines.append("}")
-        return "\n".join(lines)
+    @staticmethod
+    def _dot_edge_style(relation: RelationType) -> str:
+        return "dashed" if relation == RelationType.CORRELATION else "solid"
 
-    def generate_markdown_report(self, chain: HybridThreatChain, findings: List[AuditFinding]) -> str:
+    def _dot_edge(self, source_id: UUID, target_id: UUID, relation: RelationType, weight: float) -> str:
+        # Label edges with justification if weight is high
+        label = relation.value
+        if weight > 0.8:
+            label += f"\\n(High Conf)"
+        
+        return f'  "{source_id}" -> "{target_id}" [label="{label}", style="{self._dot_edge_style(relation)}"];'
+
+    @traced("report.markdown")
+    def generate_markdown_report(
+        self, chain: HybridThreatChain, findings: List[AuditFinding], generated_at: Optional[datetime] = None
+    ) -> str:
         """
         Generates a read-only Executive Briefing.
         """
+        return "".join(self.iter_markdown_report(chain, findings, generated_at))
+
+    @traced("report.markdown")
+    def write_markdown_report(
+        self, chain: HybridThreatChain, findings: List[AuditFinding], fp: TextIO, generated_at: Optional[datetime] = None
+    ) -> None:
+        self._write(self.iter_markdown_report(chain, findings, generated_at), fp)
+
+    def iter_markdown_report(
+        self, chain: HybridThreatChain, findings: List[AuditFinding], generated_at: Optional[datetime] = None
+    ) -> Iterator[str]:
         iap = chain.calculate_iap(urgency=5.0)
         ccs = chain.coherence_score
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with span("report.graph_analysis"):
+            graph = ChainGraph.from_chain(chain)
+            fragments = graph.weak_component_count()
+            critical = graph.longest_causal_path()
+        if critical is None:
+            critical_score, critical_text = "`0.00`", "No causal links"
+        else:
+            first, last = chain.nodes[critical.nodes[0]], chain.nodes[critical.nodes[-1]]
+            critical_score = f"`{critical.total_weight:.2f}`"
+            critical_text = f"{len(critical.nodes)} signals: {first.signal_type} → {last.signal_type}"
+        timestamp = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
 
         # Color-coded risk text for Markdown
         risk_label = "**CRITICAL**" if iap > 7.0 else "**HIGH**" if iap > 4.0 else "MODERATE"
 
-        md = f"""# CHIMERA NEXUS: THREAT ASSESSMENT
+        yield f"""# CHIMERA NEXUS: THREAT ASSESSMENT
 **Ref ID:** `{chain.id}`
 **Date:** {timestamp}
 **Operation Name:** {chain.name}
@@ -90,6 +210,8 @@ class ReportEngine:
 | **IAP (Decision Pressure)** | `{iap:.2f}` | {risk_label} |
 | **Coherence Score** | `{ccs:.2f}` | Structural Integrity |
 | **Node Count** | {len(chain.nodes)} | Signals Collected |
+| **Fragments** | {fragments} | Disconnected Sub-Narratives |
+| **Critical Path** | {critical_score} | {critical_text} |
 | **Domain Mix** | {len(chain.domain_mix)} | {', '.join([d.value for d in chain.domain_mix])} |
 
 ## 2. AUDIT & BIAS CHECK
@@ -97,22 +219,25 @@ class ReportEngine:
 """
         
         if not findings:
-            md += "\n> ✅ **No structural cognitive biases detected.** The chain appears logically sound.\n"
+            yield "\n> ✅ **No structural cognitive biases detected.** The chain appears logically sound.\n"
         else:
             for f in findings:
-                md += f"- ⚠️ **{f.bias_type.value.upper()}** (Severity: {f.severity})\n"
-                md += f"  - *Issue:* {f.description}\n"
-                md += f"  - *Fix:* {f.remediation_hint}\n"
+                yield (
+                    f"- ⚠️ **{f.bias_type.value.upper()}** (Severity: {f.severity})\n"
+                    f"  - *Issue:* {f.description}\n"
+                    f"  - *Fix:* {f.remediation_hint}\n"
+                )
 
-        md += "\n## 3. SIGNAL CHAIN (CHRONOLOGICAL)\n"
+        yield "\n## 3. SIGNAL CHAIN (CHRONOLOGICAL)\n"
         
-        # Sort nodes by timestamp (simulated order of addition for now)
-        sorted_nodes = sorted(chain.nodes.values(), key=lambda x: x.timestamp)
+        # Nodes in timestamp order, maintained by the chain
+        sorted_nodes = chain.chronological_nodes()
         
         for n in sorted_nodes:
-            md += f"### {n.timestamp.strftime('%H:%M')} | [{n.domain.value.upper()}] {n.signal_type}\n"
-            md += f"- **Confidence:** {n.confidence}\n"
-            md += f"- **Description:** {n.description}\n\n"
+            yield (
+                f"### {n.timestamp.strftime('%H:%M')} | [{n.domain.value.upper()}] {n.signal_type}\n"
+                f"- **Confidence:** {n.confidence}\n"
+                f"- **Description:** {n.description}\n\n"
+            )
 
-        md += "---\n*Generated by CHIMERA Nexus Protocol*"
-        return md
\ No newline at end of file
+        yield "---\n*Generated by CHIMERA Nexus Protocol*"
\ No newline at end of file
@@ -0,0 +1,5 @@
+# Only the stdlib client is re-exported: the CLI imports this package on every
+# command, while the daemon (chimera_nexus.service.daemon) loads the full stack.
+from .client import NexusClient, DaemonError
+
+__all__ = ["NexusClient", "DaemonError"]
@@ -0,0 +1,96 @@
+import json
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Standard library only: the CLI imports this on every command to find a
+# running daemon, so it must not pull in pydantic or the storage stack.
+
+DAEMON_FILE = "daemon.json"
+SOCKET_FILE = "nexus.sock"
+
+class DaemonError(Exception):
+    """
+    The daemon rejected a request, or the connection to it failed.
+    """
+
+def daemon_file_for(data_dir: Path) -> Path:
+    return Path(data_dir) / DAEMON_FILE
+
+def open_socket(address: str, timeout: Optional[float] = None) -> socket.socket:
+    """
+    Connects to 'unix:<path>' or 'tcp:<host>:<port>'.
+    """
+    kind, _, target = address.partition(":")
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(target)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    if kind == "tcp":
+        host, _, port = target.rpartition(":")
+        sock = socket.create_connection((host, int(port)), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+    raise ValueError(f"Unknown daemon address '{address}'.")
+
+class NexusClient:
+    """
+    Connection to a running `nexus serve` daemon.
+
+    Requests and responses are single JSON lines, so one connection can
+    carry any number of calls; automation should keep a client open
+    rather than reconnecting per command. A TCP daemon only answers
+    requests carrying the `token` from its daemon file.
+    """
+    def __init__(self, address: str, timeout: Optional[float] = None, token: Optional[str] = None):
+        self.address = address
+        self.token = token
+        self._sock = open_socket(address, timeout)
+        self._reader = self._sock.makefile('rb')
+
+    @classmethod
+    def discover(cls, data_dir: Path, timeout: Optional[float] = 5.0) -> Optional["NexusClient"]:
+        """
+        Client for the daemon serving `data_dir`, or None if none is running.
+        """
+        try:
+            with open(daemon_file_for(data_dir), 'r', encoding='utf-8') as f:
+                info = json.load(f)
+            return cls(info["address"], timeout, token=info.get("token"))
+        except (OSError, ValueError, KeyError, TypeError):
+            # No daemon file, or a stale one left behind by a killed daemon
+            return None
+
+    def call(self, op: str, **args: Any) -> Any:
+        request: Dict[str, Any] = {"op": op, "args": args}
+        if self.token is not None:
+            request["token"] = self.token
+        payload = json.dumps(request, separators=(',', ':')) + "\n"
+        try:
+            self._sock.sendall(payload.encode('utf-8'))
+            line = self._reader.readline()
+        except OSError as e:
+            raise DaemonError(f"Lost connection to daemon: {e}")
+        if not line:
+            raise DaemonError("Daemon closed the connection.")
+        response: Dict[str, Any] = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "unknown error"))
+        return response.get("result")
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+    def __enter__(self) -> "NexusClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,384 @@
+import hmac
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from pydantic import ValidationError
+from chimera_nexus.core.domain import HybridEdge, HybridNode, HybridThreatChain
+from chimera_nexus.analysis.audit_cache import AuditCache
+from chimera_nexus.reporting.engine import DotOptions, ReportEngine
+from chimera_nexus.storage.cache import FileSignature, estimate_chain_bytes, estimate_edge_bytes, estimate_node_bytes
+from chimera_nexus.storage.repository import NexusRepository, StorageError
+from chimera_nexus.service.client import SOCKET_FILE, NexusClient, daemon_file_for
+
+class _HotChain:
+    """
+    A chain held in daemon memory, with the additions not yet on disk.
+    """
+    def __init__(self):
+        self.chain: Optional[HybridThreatChain] = None
+        self.signature: Optional[FileSignature] = None
+        self.lock = threading.Lock()
+        self.pending_nodes: List[HybridNode] = []
+        self.pending_edges: List[HybridEdge] = []
+        self.size = 0
+        # Set under `lock` once dropped from the hot set; a holder must look the chain up again
+        self.evicted = False
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.pending_nodes or self.pending_edges)
+
+class NexusDaemon:
+    """
+    Keeps a NexusRepository's chains loaded and serves requests for them.
+
+    Writes are applied to the in-memory chain under that chain's lock, so
+    writers to one chain are serialized while different chains proceed in
+    parallel, and are acknowledged before touching disk. A background thread
+    journals the pending additions every `flush_interval` seconds (and on
+    shutdown) through the repository, keeping the on-disk layout unchanged.
+    A chain with nothing pending is reloaded if its files changed on disk.
+    Loaded chains are kept within `max_bytes` (estimated as for ChainCache)
+    by dropping the least recently used ones with nothing pending.
+    """
+    def __init__(self, repo: NexusRepository, flush_interval: float = 0.5, max_bytes: int = 512 * 1024 * 1024):
+        self.repo = repo
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.audit_cache = AuditCache(repo.base_path / "audit_cache")
+        self.engine = ReportEngine()
+        self._hot: "OrderedDict[uuid.UUID, _HotChain]" = OrderedDict()
+        self._hot_lock = threading.Lock()
+        # The repository's indexes are not thread-safe: disk access goes through this
+        self._repo_lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._server: Optional[socketserver.BaseServer] = None
+        self.address: Optional[str] = None
+        # Required on every request over TCP, where any local user can connect
+        self.token: Optional[str] = None
+        self._handlers: Dict[str, Callable[..., Any]] = {
+            "ping": self._ping,
+            "list": self._list,
+            "describe": self._describe,
+            "load": self._load,
+            "add_signal": self._add_signal,
+            "link": self._link,
+            "audit": self._audit,
+            "export": self._export,
+            "flush": self.flush,
+            "shutdown": self._shutdown
+        }
+
+    # --- Request Dispatch ---
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs one request ({"op": ..., "args": {...}}) and returns the response.
+        """
+        if self.token is not None and not hmac.compare_digest(
+            str(request.get("token", "")).encode('utf-8'), self.token.encode('utf-8')
+        ):
+            return {"ok": False, "error": "Missing or invalid daemon token."}
+        try:
+            handler = self._handlers.get(request.get("op"))
+            if handler is None:
+                return {"ok": False, "error": f"Unknown operation '{request.get('op')}'."}
+            return {"ok": True, "result": handler(**request.get("args", {}))}
+        except ValidationError as e:
+            return {"ok": False, "error": f"Invalid data: {e}"}
+        except (ValueError, TypeError, KeyError, StorageError) as e:
+            return {"ok": False, "error": str(e)}
+
+    @contextmanager
+    def _checked_out(self, chain_id: str) -> Iterator[_HotChain]:
+        """
+        Holds the chain's lock for the duration, loading it on first use.
+        A chain with nothing pending is reloaded in place if its files changed.
+        """
+        chain_uuid = uuid.UUID(chain_id)
+        while True:
+            with self._hot_lock:
+                entry = self._hot.get(chain_uuid)
+                if entry is None:
+                    entry = self._hot[chain_uuid] = _HotChain()
+                self._hot.move_to_end(chain_uuid)
+            with entry.lock:
+                if entry.evicted:
+                    continue # Dropped between the lookup and the lock
+                if not entry.dirty:
+                    with self._repo_lock:
+                        signature = self.repo.chain_signature(chain_uuid)
+                        if signature is None:
+                            with self._hot_lock:
+                                self._hot.pop(chain_uuid, None)
+                            entry.evicted = True
+                            raise StorageError(f"Chain {chain_uuid} not found.")
+                        if entry.chain is None or signature != entry.signature:
+                            entry.chain = self.repo.load_chain(chain_uuid)
+                            entry.signature = signature
+                            entry.size = estimate_chain_bytes(entry.chain)
+                yield entry
+            break
+        self._trim()
+
+    def _trim(self) -> None:
+        """
+        Drops least recently used chains with nothing pending until the
+        loaded ones fit `max_bytes`. Chains in use or with pending additions stay.
+        """
+        with self._hot_lock:
+            total = sum(entry.size for entry in self._hot.values())
+            for chain_uuid, entry in list(self._hot.items()):
+                if total <= self.max_bytes:
+                    break
+                if entry.dirty or not entry.lock.acquire(blocking=False):
+                    continue
+                try:
+                    if not entry.dirty:
+                        entry.evicted = True
+                        del self._hot[chain_uuid]
+                        total -= entry.size
+                finally:
+                    entry.lock.release()
+
+    # --- Operations ---
+
+    def _ping(self) -> Dict[str, Any]:
+        with self._hot_lock:
+            entries = list(self._hot.values())
+        return {"pid": os.getpid(), "chains": len(entries), "dirty": sum(e.dirty for e in entries)}
+
+    def _list(self, urgency: float = 5.0) -> Dict[str, Any]:
+        failures = []
+        with self._repo_lock:
+            summaries = self.repo.list_summaries(failures=failures)
+        with self._hot_lock:
+            hot = dict(self._hot)
+
+        rows = []
+        for summary in summaries:
+            row = {
+                "id": str(summary.id),
+                "name": summary.name,
+                "domain_mix": [d.value for d in summary.domain_mix],
+                "node_count": summary.node_count,
+                "iap": summary.calculate_iap(urgency)
+            }
+            entry = hot.get(summary.id)
+            if entry is not None and entry.dirty:
+                # Unflushed additions are not in the registry index yet
+                with entry.lock:
+                    chain = entry.chain
+                    row.update(
+                        domain_mix=[d.value for d in chain.domain_mix],
+                        node_count=len(chain.nodes),
+                        iap=chain.calculate_iap(urgency)
+                    )
+            rows.append(row)
+        return {
+            "chains": rows,
+            "failures": [[f.path.name, f.error] for f in failures]
+        }
+
+    def _describe(self, chain_id: str) -> Dict[str, Any]:
+        with self._checked_out(chain_id) as entry:
+            return {
+                "id": str(entry.chain.id),
+                "name": entry.chain.name,
+                "node_count": len(entry.chain.nodes),
+                "edge_count": len(entry.chain.edges)
+            }
+
+    def _load(self, chain_id: str) -> Dict[str, Any]:
+        with self._checked_out(chain_id) as entry:
+            return entry.chain.model_dump(mode='json')
+
+    def _add_signal(self, chain_id: str, node: Dict[str, Any]) -> Dict[str, Any]:
+        signal = HybridNode.model_validate(node)
+        with self._checked_out(chain_id) as entry:
+            entry.chain.add_node(signal)
+            entry.pending_nodes.append(signal)
+            entry.size += estimate_node_bytes(signal)
+        self._dirty.set()
+        return {"node_id": str(signal.id)}
+
+    def _link(self, chain_id: str, edge: Dict[str, Any], reject_duplicates: bool = True) -> Dict[str, Any]:
+        link = HybridEdge.model_validate(edge)
+        with self._checked_out(chain_id) as entry:
+            entry.chain.add_edge(link, reject_duplicates=reject_duplicates)
+            entry.pending_edges.append(link)
+            entry.size += estimate_edge_bytes(link)
+            edge_count = len(entry.chain.edges)
+        self._dirty.set()
+        return {"edge_count": edge_count}
+
+    def _audit(self, chain_id: str) -> Dict[str, Any]:
+        with self._checked_out(chain_id) as entry:
+            findings = self.audit_cache.audit(entry.chain)
+            return {
+                "name": entry.chain.name,
+                "findings": [f.model_dump(mode='json') for f in findings]
+            }
+
+    def _export(self, chain_id: str, format: str = "md", dot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        fmt = format.lower()
+        with self._checked_out(chain_id) as entry:
+            chain = entry.chain
+            if fmt == "md":
+                content = self.engine.generate_markdown_report(chain, self.audit_cache.audit(chain))
+            elif fmt == "dot":
+                content = self.engine.generate_graphviz_dot(chain, DotOptions.model_validate(dot or {}))
+            else:
+                raise ValueError(f"Unknown format: {format}")
+            return {"name": chain.name, "content": content, "node_count": len(chain.nodes)}
+
+    def _shutdown(self) -> Dict[str, Any]:
+        if self._server is not None:
+            # shutdown() waits for serve_forever to return, so not from a handler thread
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+        return {"stopping": True}
+
+    # --- Background Flushing ---
+
+    def flush(self) -> int:
+        """
+        Journals every chain's pending additions. Returns the chains written.
+        A chain that fails to persist keeps its additions pending for the next attempt.
+        """
+        with self._hot_lock:
+            entries = [e for e in self._hot.values() if e.dirty]
+
+        written = 0
+        for entry in entries:
+            with entry.lock:
+                if not entry.dirty:
+                    continue
+                try:
+                    with self._repo_lock:
+                        self.repo.append_mutations(
+                            entry.chain, entry.pending_nodes, entry.pending_edges, applied=True
+                        )
+                        entry.signature = self.repo.chain_signature(entry.chain.id)
+                except StorageError as e:
+                    print(f"nexus serve: flush of {entry.chain.id} failed, will retry: {e}", file=sys.stderr)
+                    self._dirty.set()
+                    continue
+                entry.pending_nodes = []
+                entry.pending_edges = []
+                written += 1
+        return written
+
+    def _flush_loop(self) -> None:
+        while not self._stopping.is_set():
+            self._dirty.wait()
+            self._dirty.clear()
+            self.flush()
+            # Coalesce bursts of writes into one journal append per chain
+            self._stopping.wait(self.flush_interval)
+
+    # --- Serving ---
+
+    def start(self, port: Optional[int] = None, socket_path: Optional[Path] = None) -> str:
+        """
+        Binds the server and starts the flusher. Listens on an owner-only
+        Unix socket in the registry directory, or on localhost `port` (0 =
+        any free port, and the default where Unix sockets are unavailable)
+        with a random token every request must carry. The address and token
+        are recorded in an owner-only file in the registry so CLI commands
+        can find the daemon.
+        """
+        daemon_file = daemon_file_for(self.repo.base_path)
+        existing = NexusClient.discover(self.repo.base_path, timeout=1.0)
+        if existing is not None:
+            existing.close()
+            raise StorageError(f"A daemon is already serving {self.repo.base_path} at {existing.address}.")
+
+        if port is None and not hasattr(socket, "AF_UNIX"):
+            port = 0
+        if port is None:
+            path = socket_path or (self.repo.base_path / SOCKET_FILE)
+            if path.exists():
+                path.unlink() # Left behind by a daemon that was killed
+            self._server = _UnixServer(str(path), _RequestHandler)
+            self.address = f"unix:{path}"
+        else:
+            self._server = _TCPServer(("127.0.0.1", port), _RequestHandler)
+            self.address = f"tcp:127.0.0.1:{self._server.server_address[1]}"
+            self.token = secrets.token_urlsafe(32)
+        self._server.nexus = self
+
+        info: Dict[str, Any] = {"address": self.address, "pid": os.getpid()}
+        if self.token is not None:
+            info["token"] = self.token
+        temp_path = daemon_file.with_suffix('.tmp')
+        temp_path.unlink(missing_ok=True)
+        # Created 0600 rather than chmod-ed afterwards, so the token is never readable by others
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(info, f)
+        temp_path.replace(daemon_file)
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="nexus-flush", daemon=True)
+        self._flusher.start()
+        return self.address
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever(poll_interval=0.2)
+
+    def close(self) -> None:
+        """
+        Stops the flusher, writes everything still pending and removes the
+        registry's daemon record and socket.
+        """
+        self._stopping.set()
+        self._dirty.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        if self._server is not None:
+            self._server.server_close()
+            if self.address and self.address.startswith("unix:"):
+                Path(self.address[len("unix:"):]).unlink(missing_ok=True)
+        daemon_file_for(self.repo.base_path).unlink(missing_ok=True)
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: NexusDaemon = self.server.nexus
+        for line in self.rfile:
+            try:
+                response = daemon.handle(json.loads(line))
+            except ValueError as e:
+                response = {"ok": False, "error": f"Malformed request: {e}"}
+            self.wfile.write(json.dumps(response, separators=(',', ':')).encode('utf-8') + b"\n")
+            self.wfile.flush()
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def server_bind(self) -> None:
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().server_bind()
+
+if hasattr(socket, "AF_UNIX"):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def server_bind(self) -> None:
+            # Owner-only from the moment it exists: whoever can connect can edit every chain
+            previous = os.umask(0o177)
+            try:
+                super().server_bind()
+            finally:
+                os.umask(previous)
@@ -1,3 +1,23 @@
-from .repository import NexusRepository, StorageError
+from .repository import NexusRepository, StorageError, ConflictError
+from .index import ChainSummary, RegistryIndex
+from .sqlite import SQLiteNexusRepository
+from .cache import ChainCache, CacheStats
+from .search import SignalIndex, SignalHit, WindowCount
+from .history import ChainHistory, ChainVersion, ChainDiff
 
-__all__ = ["NexusRepository", "StorageError"]
\ No newline at end of file
+__all__ = [
+    "NexusRepository",
+    "StorageError",
+    "ConflictError",
+    "ChainSummary",
+    "RegistryIndex",
+    "SQLiteNexusRepository",
+    "ChainCache",
+    "CacheStats",
+    "SignalIndex",
+    "SignalHit",
+    "WindowCount",
+    "ChainHistory",
+    "ChainVersion",
+    "ChainDiff"
+]
\ No newline at end of file
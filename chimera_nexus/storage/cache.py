@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+from uuid import UUID
+from chimera_nexus.core.domain import HybridEdge, HybridNode, HybridThreatChain
+
+# (snapshot mtime_ns, snapshot size, journal size): identifies the persisted state
+FileSignature = Tuple[int, int, int]
+
+# Measured resident cost of a loaded pydantic node/edge, excluding string payloads
+_NODE_OVERHEAD_BYTES = 1600
+_EDGE_OVERHEAD_BYTES = 1100
+
+def estimate_node_bytes(node: HybridNode) -> int:
+    return _NODE_OVERHEAD_BYTES + len(node.signal_type) + len(node.description)
+
+def estimate_edge_bytes(edge: HybridEdge) -> int:
+    return _EDGE_OVERHEAD_BYTES + len(edge.justification)
+
+def estimate_chain_bytes(chain: HybridThreatChain) -> int:
+    """
+    Approximate in-memory footprint of a loaded chain, used for the eviction budget.
+    """
+    size = 1024 + len(chain.name)
+    if chain.is_compact:
+        size += chain.nodes.approximate_bytes()
+    else:
+        size += sum(estimate_node_bytes(node) for node in chain.nodes.values())
+    size += sum(estimate_edge_bytes(edge) for edge in chain.edges)
+    return size
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+class _CacheEntry(NamedTuple):
+    chain: HybridThreatChain
+    signature: FileSignature
+    size: int
+
+class ChainCache:
+    """
+    Bounded LRU of loaded chains keyed by chain id.
+    An entry is only served while the file signature it was loaded from still
+    matches disk, so out-of-process edits are never masked. Callers receive a
+    copy with their own node/edge containers, so mutating a loaded chain
+    without saving it cannot leak into later loads.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[UUID, _CacheEntry]" = OrderedDict()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, chain_id: UUID, signature: FileSignature) -> Optional[HybridThreatChain]:
+        entry = self._entries.get(chain_id)
+        if entry is None or entry.signature != signature:
+            if entry is not None:
+                self._drop(chain_id)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(chain_id)
+        self.hits += 1
+        return entry.chain.detached_copy()
+
+    def put(self, chain: HybridThreatChain, signature: FileSignature) -> None:
+        self._drop(chain.id)
+        size = estimate_chain_bytes(chain)
+        if size > self.max_bytes:
+            return # Larger than the whole budget: never cacheable
+
+        self._entries[chain.id] = _CacheEntry(chain.detached_copy(), signature, size)
+        self._current_bytes += size
+        while self._current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._current_bytes -= evicted.size
+            self.evictions += 1
+
+    def invalidate(self, chain_id: UUID) -> None:
+        self._drop(chain_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._current_bytes = 0
+
+    def _drop(self, chain_id: UUID) -> None:
+        entry = self._entries.pop(chain_id, None)
+        if entry is not None:
+            self._current_bytes -= entry.size
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            current_bytes=self._current_bytes,
+            max_bytes=self.max_bytes
+        )
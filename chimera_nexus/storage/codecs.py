@@ -0,0 +1,132 @@
+import json
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import yaml
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; the stdlib json module is the fallback
+    orjson = None
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+ChainPayload = Dict[str, Any]
+
+class CodecError(ValueError):
+    """
+    Raised when raw bytes cannot be decoded into a chain payload.
+    """
+
+class ChainCodec(ABC):
+    """
+    Translates the JSON-mode dump of a chain to bytes and back.
+    Each codec owns a file extension, which is how files are detected on load.
+    """
+    name = ""
+    extension = ""
+
+    @abstractmethod
+    def encode(self, data: ChainPayload) -> bytes:
+        ...
+
+    @abstractmethod
+    def decode(self, raw: bytes) -> ChainPayload:
+        ...
+
+class YamlCodec(ChainCodec):
+    """
+    Human-readable default. Uses libyaml when available.
+    """
+    name = "yaml"
+    extension = ".yaml"
+
+    def encode(self, data: ChainPayload) -> bytes:
+        text = yaml.dump(data, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
+        return text.encode('utf-8')
+
+    def decode(self, raw: bytes) -> ChainPayload:
+        try:
+            data = yaml.load(raw, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise CodecError(f"Invalid YAML: {e}")
+        if not isinstance(data, dict):
+            raise CodecError("YAML document is not a mapping.")
+        return data
+
+class JsonCodec(ChainCodec):
+    """
+    Compact JSON. Uses orjson when installed.
+    """
+    name = "json"
+    extension = ".json"
+
+    def encode(self, data: ChainPayload) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def decode(self, raw: bytes) -> ChainPayload:
+        try:
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError as e:
+            raise CodecError(f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise CodecError("JSON document is not an object.")
+        return data
+
+class BinaryCodec(ChainCodec):
+    """
+    Length-prefixed, zlib-compressed JSON frame:
+    4-byte magic | 4-byte big-endian payload length | compressed payload.
+    The length prefix lets truncated files be rejected before decompression.
+    """
+    name = "binary"
+    extension = ".nxb"
+    MAGIC = b"NXB1"
+    _HEADER = struct.Struct(">4sI")
+
+    def __init__(self, level: int = 1):
+        self.level = level
+        self._json = JsonCodec()
+
+    def encode(self, data: ChainPayload) -> bytes:
+        body = zlib.compress(self._json.encode(data), self.level)
+        return self._HEADER.pack(self.MAGIC, len(body)) + body
+
+    def decode(self, raw: bytes) -> ChainPayload:
+        if len(raw) < self._HEADER.size:
+            raise CodecError("Binary frame is shorter than its header.")
+        magic, length = self._HEADER.unpack_from(raw)
+        if magic != self.MAGIC:
+            raise CodecError("Binary frame has an unknown magic number.")
+        body = raw[self._HEADER.size:]
+        if len(body) != length:
+            raise CodecError(f"Binary frame is truncated ({len(body)} of {length} bytes).")
+        try:
+            return self._json.decode(zlib.decompress(body))
+        except zlib.error as e:
+            raise CodecError(f"Corrupt binary frame: {e}")
+
+CODECS: Dict[str, ChainCodec] = {
+    codec.name: codec for codec in (YamlCodec(), JsonCodec(), BinaryCodec())
+}
+
+def get_codec(name: str) -> ChainCodec:
+    try:
+        return CODECS[name.lower()]
+    except KeyError:
+        raise CodecError(f"Unknown storage format '{name}'. Choose from: {', '.join(CODECS)}.")
+
+def codec_for_path(path: Path) -> Optional[ChainCodec]:
+    for codec in CODECS.values():
+        if path.suffix == codec.extension:
+            return codec
+    return None
+
+def chain_extensions() -> List[str]:
+    return [codec.extension for codec in CODECS.values()]
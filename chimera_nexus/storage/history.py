@@ -0,0 +1,411 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge
+from chimera_nexus.storage.integrity import construct_chain, construct_edge, construct_node
+from chimera_nexus.storage.locking import file_lock
+
+class HistoryError(ValueError):
+    """
+    Raised when a chain version or one of its objects is missing or corrupt.
+    """
+
+class ChainVersion(NamedTuple):
+    version: int
+    updated_at: datetime
+    node_count: int
+    edge_count: int
+    # 'save' for a whole-chain save, 'append' for journaled additions
+    kind: str
+
+class ChainDiff(NamedTuple):
+    """
+    What changed between two versions of a chain. `changed_nodes` pairs the
+    old and new content of nodes whose id is in both (only hand edits do that);
+    `header` maps chain fields such as 'name' to their (old, new) values.
+    """
+    from_version: int
+    to_version: int
+    added_nodes: List[HybridNode]
+    removed_nodes: List[HybridNode]
+    changed_nodes: List[Tuple[HybridNode, HybridNode]]
+    added_edges: List[HybridEdge]
+    removed_edges: List[HybridEdge]
+    header: Dict[str, Tuple[Any, Any]]
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added_nodes or self.removed_nodes or self.changed_nodes
+                    or self.added_edges or self.removed_edges or self.header)
+
+def _canonical(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def _digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=32).hexdigest()
+
+def _write_atomic(path: Path, raw: bytes) -> None:
+    # Unique temp name, so a writer never reuses one left behind by another
+    fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+# objects.idx entry: raw digest, offset into objects.pack, length
+_ENTRY = struct.Struct(">32sQI")
+
+class _ObjectPack:
+    """
+    Append-only store of content-addressed objects. `objects.pack` holds
+    their bytes back to back and `objects.idx` one fixed-size entry per
+    object; each batch is appended to both with one write apiece, under
+    `objects.lock`. The index is also the persistent set of stored
+    digests: a process reads it once, then only the entries appended since.
+    """
+    def __init__(self, path: Path):
+        self.pack_path = path / "objects.pack"
+        self.index_path = path / "objects.idx"
+        self.lock_path = path / "objects.lock"
+        # digest -> (offset, length) of every object in the pack
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        # Bytes of objects.idx folded into _offsets; always whole entries
+        self._index_size = 0
+        self._loaded = False
+        # Objects added since the last flush, digest -> canonical bytes
+        self._pending: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._offsets)
+
+    def _refresh(self) -> None:
+        # A trailing entry torn by a crashed writer is left out until a writer truncates it
+        try:
+            with open(self.index_path, 'rb') as f:
+                f.seek(self._index_size)
+                raw = f.read()
+        except FileNotFoundError:
+            raw = b""
+        whole = len(raw) - len(raw) % _ENTRY.size
+        for digest, offset, length in _ENTRY.iter_unpack(raw[:whole]):
+            self._offsets[digest.hex()] = (offset, length)
+        self._index_size += whole
+        self._loaded = True
+
+    def add(self, raw: bytes) -> str:
+        if not self._loaded:
+            self._refresh()
+        digest = _digest(raw)
+        if digest not in self._offsets:
+            self._pending[digest] = raw
+        return digest
+
+    def flush(self) -> None:
+        """
+        Appends the objects added since the last flush as one batch.
+        """
+        if not self._pending:
+            return
+        self.pack_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_path):
+            # Another process may have stored some of them meanwhile
+            self._refresh()
+            batch = [(digest, raw) for digest, raw in self._pending.items() if digest not in self._offsets]
+            if batch:
+                entries = []
+                with open(self.pack_path, 'ab') as pack:
+                    # Bytes left by a writer that crashed before indexing them are skipped
+                    offset = pack.seek(0, os.SEEK_END)
+                    for digest, raw in batch:
+                        entries.append((digest, offset, len(raw)))
+                        offset += len(raw)
+                    pack.write(b"".join(raw for _, raw in batch))
+                with open(self.index_path, 'ab') as index:
+                    index.truncate(self._index_size)
+                    index.write(b"".join(_ENTRY.pack(bytes.fromhex(d), o, n) for d, o, n in entries))
+                for digest, offset, length in entries:
+                    self._offsets[digest] = (offset, length)
+                self._index_size += len(entries) * _ENTRY.size
+        self._pending.clear()
+
+    def _locate(self, digest: str) -> Tuple[int, int]:
+        location = self._offsets.get(digest)
+        if location is None:
+            # Possibly stored by another process since the index was read
+            self._refresh()
+            location = self._offsets.get(digest)
+            if location is None:
+                raise HistoryError(f"History object {digest} is missing.")
+        return location
+
+    def read(self, digests: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        The objects with the given digests, in order, read through one handle.
+        """
+        if not self._loaded:
+            self._refresh()
+        digests = list(digests)
+        if not digests:
+            return
+        try:
+            pack = open(self.pack_path, 'rb')
+        except FileNotFoundError:
+            raise HistoryError(f"History object {digests[0]} is missing.")
+        with pack:
+            for digest in digests:
+                offset, length = self._locate(digest)
+                pack.seek(offset)
+                raw = pack.read(length)
+                # Content addressing doubles as a checksum: verified objects need no validation
+                if _digest(raw) != digest:
+                    raise HistoryError(f"History object {digest} is corrupt.")
+                yield json.loads(raw)
+
+class _Resolved(NamedTuple):
+    """
+    A version's chain fields (minus updated_at and version), its node and
+    edge references, and how many delta manifests lead back to a full one.
+    """
+    header: Dict[str, Any]
+    nodes: List[str]
+    edges: List[str]
+    updated_at: str
+    depth: int
+
+class ChainHistory:
+    """
+    Every committed version of every chain, with nodes and edges stored once.
+
+    Nodes and edges are immutable, so each is kept once as a content-addressed
+    object (keyed by the hash of its canonical JSON) in the append-only
+    `history/objects.pack`, and shared by every version and chain that
+    contains it; the objects a commit adds are appended in one batch. A version
+    is a manifest under `history/<chain id>/<version>.json`. When a version
+    only adds to the previous one, as journaled appends and most saves do,
+    the manifest lists just the added references and points at its parent;
+    otherwise, and every MAX_DEPTH versions to bound how far a read has to
+    walk, it lists all of them. Storage therefore grows with new signals
+    rather than with the number of saves.
+
+    Manifests are written before the commit they describe, under the
+    chain's lock; one left behind by a failed commit is overwritten by the
+    next commit of that version, and readers ignore versions past the
+    committed one.
+    """
+    DIRNAME = "history"
+    MAX_DEPTH = 64
+
+    def __init__(self, base_path: Path):
+        self.path = base_path / self.DIRNAME
+        self.objects = _ObjectPack(self.path)
+        # chain id -> (version, references) of the last version recorded, the usual parent of the next
+        self._tips: Dict[UUID, Tuple[int, _Resolved]] = {}
+
+    def _put(self, data: Dict[str, Any]) -> str:
+        return self.objects.add(_canonical(data))
+
+    # --- Recording ---
+
+    def _manifest_path(self, chain_id: UUID, version: int) -> Path:
+        return self.path / str(chain_id) / f"{version}.json"
+
+    def _known(self, chain_id: UUID, version: int) -> Optional[_Resolved]:
+        try:
+            return self._resolve(chain_id, version)
+        except HistoryError:
+            return None
+
+    def _record(
+        self,
+        chain: HybridThreatChain,
+        kind: str,
+        header: Dict[str, Any],
+        nodes: List[str],
+        edges: List[str],
+        parent: Optional[_Resolved]
+    ) -> None:
+        updated_at = chain.updated_at.isoformat()
+        manifest: Dict[str, Any] = {
+            "version": chain.version,
+            "kind": kind,
+            "updated_at": updated_at,
+            "node_count": len(nodes),
+            "edge_count": len(edges)
+        }
+        if (parent is not None and parent.depth < self.MAX_DEPTH and parent.header == header
+                and nodes[:len(parent.nodes)] == parent.nodes and edges[:len(parent.edges)] == parent.edges):
+            depth = parent.depth + 1
+            manifest.update(
+                parent=chain.version - 1,
+                depth=depth,
+                nodes=nodes[len(parent.nodes):],
+                edges=edges[len(parent.edges):]
+            )
+        else:
+            depth = 0
+            manifest.update(chain=header, nodes=nodes, edges=edges)
+
+        # Objects first: a manifest must never reference an unstored object
+        self.objects.flush()
+        path = self._manifest_path(chain.id, chain.version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, json.dumps(manifest, separators=(',', ':')).encode('utf-8'))
+        self._tips[chain.id] = (chain.version, _Resolved(header, nodes, edges, updated_at, depth))
+
+    def record_snapshot(
+        self,
+        chain: HybridThreatChain,
+        data: Optional[Dict[str, Any]] = None,
+        kind: str = "save"
+    ) -> None:
+        """
+        Records the whole chain; `data` is its JSON-mode dump if already made.
+        """
+        if data is None:
+            data = chain.model_dump(mode='json')
+        header = {k: v for k, v in data.items() if k not in ("nodes", "edges", "updated_at", "version")}
+        nodes = [self._put(node) for node in data["nodes"].values()]
+        edges = [self._put(edge) for edge in data["edges"]]
+
+        current = self._known(chain.id, chain.version)
+        if current is not None and (current.header, current.nodes, current.edges) == (header, nodes, edges):
+            # Same version rewritten as is (journal compaction, migration)
+            return
+        self._record(chain, kind, header, nodes, edges, self._known(chain.id, chain.version - 1))
+
+    def record_additions(
+        self,
+        chain: HybridThreatChain,
+        nodes: Sequence[HybridNode],
+        edges: Sequence[HybridEdge]
+    ) -> None:
+        """
+        Records `chain.version` as the additions journaled on top of the
+        previous version; `chain` already contains them. Costs O(additions)
+        once the previous version is known to this process.
+        """
+        parent = self._known(chain.id, chain.version - 1)
+        if parent is None:
+            # The chain predates its history: start it with this version
+            self.record_snapshot(chain, kind="append")
+            return
+        self._record(
+            chain,
+            "append",
+            parent.header,
+            parent.nodes + [self._put(node.model_dump(mode='json')) for node in nodes],
+            parent.edges + [self._put(edge.model_dump(mode='json')) for edge in edges],
+            parent
+        )
+
+    def forget(self, chain_id: UUID) -> None:
+        """
+        Drops what this process remembers of a chain's latest version; called
+        when the commit just recorded failed, as its manifest will be replaced.
+        """
+        self._tips.pop(chain_id, None)
+
+    # --- Reading ---
+
+    def _manifest(self, chain_id: UUID, version: int) -> Dict[str, Any]:
+        try:
+            with open(self._manifest_path(chain_id, version), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise HistoryError(f"Chain {chain_id} has no recorded version {version}.")
+        except ValueError as e:
+            raise HistoryError(f"Manifest of chain {chain_id} version {version} is corrupt: {e}")
+
+    def versions(self, chain_id: UUID, upto: Optional[int] = None) -> List[ChainVersion]:
+        """
+        Recorded versions of a chain, oldest first, up to version `upto`.
+        """
+        chain_path = self.path / str(chain_id)
+        if not chain_path.is_dir():
+            return []
+        numbers = sorted(int(p.stem) for p in chain_path.glob("*.json") if p.stem.isdigit())
+        result = []
+        for number in numbers:
+            if upto is not None and number > upto:
+                break
+            manifest = self._manifest(chain_id, number)
+            result.append(ChainVersion(
+                number,
+                datetime.fromisoformat(manifest["updated_at"]),
+                manifest["node_count"],
+                manifest["edge_count"],
+                manifest["kind"]
+            ))
+        return result
+
+    def _resolve(self, chain_id: UUID, version: int) -> _Resolved:
+        """
+        A version's references, following delta manifests back to a full one.
+        """
+        tip = self._tips.get(chain_id)
+        if tip is not None and tip[0] == version:
+            return tip[1]
+
+        manifest = self._manifest(chain_id, version)
+        updated_at = manifest["updated_at"]
+        steps = []
+        while "parent" in manifest:
+            steps.append(manifest)
+            manifest = self._manifest(chain_id, manifest["parent"])
+        nodes = list(manifest["nodes"])
+        edges = list(manifest["edges"])
+        for step in reversed(steps):
+            nodes.extend(step["nodes"])
+            edges.extend(step["edges"])
+        return _Resolved(manifest["chain"], nodes, edges, updated_at, len(steps))
+
+    def load(self, chain_id: UUID, version: int, compact: bool = False) -> HybridThreatChain:
+        resolved = self._resolve(chain_id, version)
+        data = dict(resolved.header, updated_at=resolved.updated_at, version=version)
+        data["nodes"] = {record["id"]: record for record in self.objects.read(resolved.nodes)}
+        data["edges"] = list(self.objects.read(resolved.edges))
+        try:
+            return construct_chain(data, compact)
+        except (KeyError, TypeError, ValueError) as e:
+            raise HistoryError(f"Chain {chain_id} version {version} cannot be rebuilt: {e}")
+
+    def diff(self, chain_id: UUID, old: int, new: int) -> ChainDiff:
+        """
+        Compares two versions by their references, so only the objects that
+        differ are read.
+        """
+        before = self._resolve(chain_id, old)
+        after = self._resolve(chain_id, new)
+
+        old_refs, new_refs = set(before.nodes), set(after.nodes)
+        read = self.objects.read
+        removed = {n.id: n for n in map(construct_node, read(r for r in before.nodes if r not in new_refs))}
+        added = {n.id: n for n in map(construct_node, read(r for r in after.nodes if r not in old_refs))}
+        changed = [(removed.pop(node_id), added.pop(node_id)) for node_id in list(added) if node_id in removed]
+
+        # Edges are a list and may repeat, so compare them as multisets
+        old_counts, new_counts = Counter(before.edges), Counter(after.edges)
+        added_edges = [construct_edge(e) for e in read((new_counts - old_counts).elements())]
+        removed_edges = [construct_edge(e) for e in read((old_counts - new_counts).elements())]
+
+        header = {
+            field: (before.header.get(field), after.header.get(field))
+            for field in sorted(set(before.header) | set(after.header))
+            if before.header.get(field) != after.header.get(field)
+        }
+        return ChainDiff(
+            old, new, list(added.values()), list(removed.values()), changed,
+            added_edges, removed_edges, header
+        )
@@ -0,0 +1,251 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from pydantic import BaseModel, Field, ValidationError
+from chimera_nexus.core.domain import (
+    HybridThreatChain,
+    ThreatDomain,
+    information_asymmetry_pressure
+)
+from chimera_nexus.storage.journal import ChainJournal, journal_path_for
+from chimera_nexus.storage.loader import LoadFailure, LoadResult
+
+class ChainSummary(BaseModel):
+    """
+    Header-level view of a chain: everything the registry listing needs
+    without parsing the full node/edge payload.
+    """
+    id: UUID
+    name: str
+    node_count: int = Field(0, ge=0)
+    edge_count: int = Field(0, ge=0)
+    domain_mix: List[ThreatDomain] = Field(default_factory=list)
+    avg_confidence: float = 0.0
+    coherence_score: float = 0.0
+    updated_at: datetime
+    file_mtime_ns: int = 0
+    file_size: int = 0
+    journal_size: int = 0
+    content_digest: str = ""
+
+    @classmethod
+    def from_chain(
+        cls,
+        chain: HybridThreatChain,
+        stat: os.stat_result,
+        journal_size: int = 0
+    ) -> "ChainSummary":
+        return cls(
+            id=chain.id,
+            name=chain.name,
+            node_count=len(chain.nodes),
+            edge_count=len(chain.edges),
+            domain_mix=chain.domain_mix,
+            avg_confidence=chain.average_confidence,
+            coherence_score=chain.coherence_score,
+            updated_at=chain.updated_at,
+            file_mtime_ns=stat.st_mtime_ns,
+            file_size=stat.st_size,
+            journal_size=journal_size,
+            content_digest=chain.content_digest()
+        )
+
+    def calculate_iap(self, urgency: float) -> float:
+        """
+        Same IAP as HybridThreatChain.calculate_iap, from the stored average.
+        """
+        if self.node_count == 0:
+            return 0.0
+        return information_asymmetry_pressure(urgency, self.avg_confidence)
+
+    def matches(self, stat: os.stat_result, journal_size: int) -> bool:
+        # The journal is append-only between compactions, so its size identifies its state
+        return (
+            self.file_mtime_ns == stat.st_mtime_ns
+            and self.file_size == stat.st_size
+            and self.journal_size == journal_size
+        )
+
+class IndexLog:
+    """
+    Append-only NDJSON companion to a JSON index file. Point updates are
+    appended as one line each instead of rewriting the index, and folded in
+    when it is next read. Once the log outgrows the index it amends, the
+    owner rewrites the index and discards the log, so the rewrites cost
+    amortized O(1) per update. A torn final line is skipped.
+    """
+    MIN_COMPACT_BYTES = 64 * 1024
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._size = 0
+
+    def read(self) -> List[Any]:
+        records = []
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            raw = b""
+        self._size = len(raw)
+        for line in raw.splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+    def append(self, record: Any) -> bool:
+        try:
+            with open(self.path, 'ab') as f:
+                f.write(json.dumps(record, separators=(',', ':')).encode('utf-8') + b"\n")
+                self._size = f.tell()
+            return True
+        except OSError:
+            return False
+
+    @property
+    def pending(self) -> bool:
+        return self._size > 0
+
+    def outgrows(self, index_bytes: int) -> bool:
+        return self._size > max(self.MIN_COMPACT_BYTES, index_bytes)
+
+    def discard(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self._size = 0
+
+class RegistryIndex:
+    """
+    Persisted manifest of ChainSummary entries, one per chain file.
+    The chain files remain the source of truth: the manifest is only trusted
+    for chains whose snapshot and journal are unchanged since they were indexed.
+
+    Single-chain updates (every save and journaled append) go to
+    `registry.log` rather than rewriting the whole manifest; a stale or lost
+    log line only costs a re-derivation, since each summary carries the file
+    signature it was built from.
+    """
+    FILENAME = "registry.json"
+    LOG_FILENAME = "registry.log"
+
+    def __init__(self, base_path: Path):
+        self.path = base_path / self.FILENAME
+        self.log = IndexLog(base_path / self.LOG_FILENAME)
+        self._entries: Optional[Dict[str, ChainSummary]] = None
+        self._persisted_bytes = 0
+
+    def _load(self) -> Dict[str, ChainSummary]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: Dict[str, ChainSummary] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    raw = json.load(f)
+                for key, value in raw.get("chains", {}).items():
+                    entries[key] = ChainSummary.model_validate(value)
+                self._persisted_bytes = self.path.stat().st_size
+            except (OSError, ValueError, ValidationError):
+                # A damaged manifest is only a cache miss: it is rebuilt from the chain files
+                entries = {}
+        for record in self.log.read():
+            try:
+                summary = ChainSummary.model_validate(record)
+            except ValidationError:
+                continue
+            entries[str(summary.id)] = summary
+        self._entries = entries
+        return entries
+
+    def _persist(self) -> None:
+        entries = self._load()
+        temp_path = self.path.with_suffix('.tmp')
+        payload = {
+            "chains": {key: s.model_dump(mode='json') for key, s in entries.items()}
+        }
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'))
+            temp_path.replace(self.path)
+            self._persisted_bytes = self.path.stat().st_size
+            # Everything the log held is in the manifest now
+            self.log.discard()
+        except OSError:
+            # Index persistence is best-effort; the next refresh re-derives it
+            if temp_path.exists():
+                os.remove(temp_path)
+
+    def update(self, summary: ChainSummary) -> None:
+        """
+        Records one chain's summary by appending to the log: O(1), not O(chains).
+        """
+        self._load()[str(summary.id)] = summary
+        if not self.log.append(summary.model_dump(mode='json')) or self.log.outgrows(self._persisted_bytes):
+            self._persist()
+
+    def get(self, chain_id: UUID) -> Optional[ChainSummary]:
+        return self._load().get(str(chain_id))
+
+    def remove(self, chain_id: UUID) -> None:
+        if self._load().pop(str(chain_id), None) is not None:
+            self._persist()
+
+    def refresh(
+        self,
+        files: Dict[str, Path],
+        load_many: Callable[[List[Path]], Iterable[LoadResult]],
+        failures: Optional[List[LoadFailure]] = None
+    ) -> List[ChainSummary]:
+        """
+        Brings the manifest in line with the chain files on disk.
+        Only files whose mtime/size changed are passed to `load_many`; `files`
+        maps chain id to path. Malformed files are left out of the listing
+        and reported into `failures` when given.
+        """
+        entries = self._load()
+        dirty = False
+
+        for key in list(entries):
+            if key not in files:
+                del entries[key]
+                dirty = True
+
+        stale: Dict[Path, Tuple[str, os.stat_result, int]] = {}
+        for key, path in files.items():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            journal_size = ChainJournal(journal_path_for(path)).size()
+
+            cached = entries.get(key)
+            # Entries written before digests were recorded are re-derived once
+            if cached is not None and cached.content_digest and cached.matches(stat, journal_size):
+                continue
+            stale[path] = (key, stat, journal_size)
+
+        if stale:
+            for result in load_many(list(stale)):
+                key, stat, journal_size = stale[result.path]
+                if result.chain is None:
+                    if entries.pop(key, None) is not None:
+                        dirty = True
+                    if failures is not None:
+                        failures.append(LoadFailure(result.path, result.error or "unknown error"))
+                    continue
+                entries[key] = ChainSummary.from_chain(result.chain, stat, journal_size)
+                dirty = True
+
+        # A listing is O(chains) anyway, so it also folds in the log
+        if dirty or self.log.pending:
+            self._persist()
+
+        return [entries[key] for key in sorted(entries)]
@@ -0,0 +1,140 @@
+import hashlib
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Type, TypeVar
+from uuid import UUID
+from pydantic import BaseModel
+from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge, ThreatDomain, RelationType
+from chimera_nexus.core.node_store import CompactNodeStore
+
+M = TypeVar("M", bound=BaseModel)
+
+CHECKSUM_SUFFIX = ".sum"
+# Bump whenever model validation rules change, so snapshots sealed under the
+# old rules are fully validated (and can be resealed by `nexus verify`)
+TRUST_SCHEMA = 1
+
+# Checksum states reported by `checksum_state`
+VALID = "valid"
+MISSING = "missing"
+MISMATCH = "mismatch"
+
+class VerifyResult(NamedTuple):
+    """
+    Outcome of fully revalidating one chain file.
+    """
+    path: Path
+    checksum: str
+    error: Optional[str]
+    resealed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def checksum_path_for(snapshot_path: Path) -> Path:
+    # Keeps the codec extension so snapshots of one chain in two formats never share a sidecar
+    return snapshot_path.with_name(snapshot_path.name + CHECKSUM_SUFFIX)
+
+def payload_checksum(raw: bytes) -> str:
+    return f"{TRUST_SCHEMA}:blake2b:{hashlib.blake2b(raw, digest_size=32).hexdigest()}"
+
+def write_checksum(snapshot_path: Path, raw: bytes) -> None:
+    """
+    Seals snapshot bytes this process has just validated. Written after the
+    snapshot itself: a crash in between leaves a stale checksum, which only
+    costs one fully validated load.
+    """
+    with open(checksum_path_for(snapshot_path), 'w', encoding='utf-8') as f:
+        f.write(payload_checksum(raw) + "\n")
+
+def discard_checksum(snapshot_path: Path) -> None:
+    try:
+        os.remove(checksum_path_for(snapshot_path))
+    except FileNotFoundError:
+        pass
+
+def checksum_state(snapshot_path: Path, raw: bytes) -> str:
+    try:
+        with open(checksum_path_for(snapshot_path), 'r', encoding='utf-8') as f:
+            recorded = f.read().strip()
+    except FileNotFoundError:
+        return MISSING
+    return VALID if recorded == payload_checksum(raw) else MISMATCH
+
+# --- Trusted Construction ---
+
+def _construct(cls: Type[M], values: Dict[str, Any]) -> M:
+    # What model_construct does for models without aliases, extras or private
+    # state, minus its per-field default handling (every field is present)
+    model = cls.__new__(cls)
+    object.__setattr__(model, '__dict__', values)
+    object.__setattr__(model, '__pydantic_fields_set__', set(values))
+    object.__setattr__(model, '__pydantic_extra__', None)
+    object.__setattr__(model, '__pydantic_private__', None)
+    return model
+
+def _datetime(text: str) -> datetime:
+    # pydantic writes UTC as 'Z', which fromisoformat only accepts from Python 3.11
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    return datetime.fromisoformat(text)
+
+_DOMAINS: Dict[str, ThreatDomain] = {d.value: d for d in ThreatDomain}
+_RELATIONS: Dict[str, RelationType] = {r.value: r for r in RelationType}
+
+def construct_node(data: Dict[str, Any]) -> HybridNode:
+    return _construct(HybridNode, {
+        "id": UUID(data["id"]),
+        "timestamp": _datetime(data["timestamp"]),
+        "domain": _DOMAINS[data["domain"]],
+        "signal_type": data["signal_type"],
+        "confidence": data["confidence"],
+        "cost_estimate": data["cost_estimate"],
+        "description": data["description"]
+    })
+
+def construct_edge(data: Dict[str, Any], ids: Optional[Dict[str, UUID]] = None) -> HybridEdge:
+    """
+    `ids` maps already-parsed node id strings to their UUIDs; parsing UUIDs
+    in Python is the dominant cost, and every endpoint is a known node.
+    """
+    source, target = data["source_id"], data["target_id"]
+    if ids is not None:
+        source_id, target_id = ids.get(source) or UUID(source), ids.get(target) or UUID(target)
+    else:
+        source_id, target_id = UUID(source), UUID(target)
+    return _construct(HybridEdge, {
+        "source_id": source_id,
+        "target_id": target_id,
+        "relation_type": _RELATIONS[data["relation_type"]],
+        "weight": data["weight"],
+        "justification": data["justification"]
+    })
+
+def construct_chain(data: Dict[str, Any], compact: bool = False) -> HybridThreatChain:
+    """
+    Builds a chain from a JSON-mode dump this repository wrote and validated,
+    converting field types directly instead of re-running validation.
+    Raises KeyError/TypeError/ValueError if the payload is not such a dump.
+    """
+    ids: Dict[str, UUID] = {}
+    nodes = []
+    for record in data["nodes"].values():
+        node = construct_node(record)
+        ids[record["id"]] = node.id
+        nodes.append(node)
+    edges = [construct_edge(edge, ids) for edge in data["edges"]]
+
+    store = CompactNodeStore(nodes) if compact else {node.id: node for node in nodes}
+    # model_construct still runs model_post_init, which builds the indexes
+    return HybridThreatChain.model_construct(
+        id=UUID(data["id"]),
+        name=data["name"],
+        nodes=store,
+        edges=edges,
+        created_at=_datetime(data["created_at"]),
+        updated_at=_datetime(data["updated_at"]),
+        version=data.get("version", 0)
+    )
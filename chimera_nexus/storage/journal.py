@@ -0,0 +1,203 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from pydantic import ValidationError
+from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge
+
+JOURNAL_SUFFIX = ".journal"
+
+def journal_path_for(snapshot_path: Path) -> Path:
+    return snapshot_path.with_suffix(JOURNAL_SUFFIX)
+
+class JournalError(ValueError):
+    """
+    Raised when a journal record cannot be applied to its snapshot.
+    """
+
+class ChainJournal:
+    """
+    Append-only mutation log kept next to a chain snapshot.
+
+    Each record is one JSON line written with a single write + fsync. A torn
+    final line (crash mid-append) carries no newline and is discarded, so a
+    record is either fully present or absent. Edge records carry their list
+    position, which makes replay idempotent if the process dies after a
+    compaction snapshot was written but before the journal was removed.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+
+    def size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def append(
+        self,
+        chain: HybridThreatChain,
+        nodes: Sequence[HybridNode],
+        edges: Sequence[HybridEdge]
+    ) -> None:
+        """
+        Applies the additions to `chain` and logs them. The chain is validated
+        first so an invalid edge never reaches the log.
+        """
+        for node in nodes:
+            chain.add_node(node)
+        for edge in edges:
+            chain.add_edge(edge)
+        self.record(chain, nodes, edges)
+
+    def record(
+        self,
+        chain: HybridThreatChain,
+        nodes: Sequence[HybridNode],
+        edges: Sequence[HybridEdge]
+    ) -> None:
+        """
+        Logs additions already applied to `chain`; `edges` must be its last edges.
+        Every record carries the chain's `version`, which the batch commits.
+        """
+        at = chain.updated_at.isoformat()
+        version = chain.version
+        records: List[Dict[str, Any]] = []
+        for node in nodes:
+            records.append({"op": "node", "at": at, "version": version, "node": node.model_dump(mode='json')})
+        first_position = len(chain.edges) - len(edges)
+        for offset, edge in enumerate(edges):
+            records.append({
+                "op": "edge",
+                "at": at,
+                "version": version,
+                "position": first_position + offset,
+                "edge": edge.model_dump(mode='json')
+            })
+
+        if not records:
+            return
+
+        payload = "".join(json.dumps(r, separators=(',', ':')) + "\n" for r in records)
+        self._discard_torn_tail()
+        with open(self.path, 'ab') as f:
+            f.write(payload.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _discard_torn_tail(self) -> None:
+        size = self.size()
+        if size == 0:
+            return
+        with open(self.path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b"\n":
+                return
+            f.seek(0)
+            content = f.read()
+            f.truncate(content.rfind(b"\n") + 1)
+
+    def _lines(self) -> List[bytes]:
+        try:
+            with open(self.path, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return []
+        return content.split(b"\n")[:-1]
+
+    def replay(self, chain: HybridThreatChain) -> int:
+        """
+        Applies logged records on top of a snapshot. Returns the number applied.
+        """
+        applied = 0
+        for line_no, line in enumerate(self._lines(), start=1):
+            try:
+                record = json.loads(line)
+                if record["op"] == "node":
+                    chain.add_node(HybridNode.model_validate(record["node"]))
+                elif record["op"] == "edge":
+                    position = record["position"]
+                    if position < len(chain.edges):
+                        continue # Already folded into the snapshot
+                    if position > len(chain.edges):
+                        raise JournalError(f"edge position {position} skips ahead of {len(chain.edges)}")
+                    chain.add_edge(HybridEdge.model_validate(record["edge"]))
+                else:
+                    raise JournalError(f"unknown operation '{record['op']}'")
+                chain.updated_at = datetime.fromisoformat(record["at"])
+                # Records written before chains were versioned carry none
+                chain.version = record.get("version", chain.version)
+                applied += 1
+            except (KeyError, TypeError, ValueError, ValidationError) as e:
+                raise JournalError(f"{self.path.name} line {line_no}: {e}")
+        return applied
+
+    def replay_payload(self, data: Dict[str, Any]) -> int:
+        """
+        replay() for a chain still in its JSON-mode dump form, for readers
+        that never build the chain. Records are validated just the same.
+        """
+        nodes, edges = data["nodes"], data["edges"]
+        applied = 0
+        for line_no, line in enumerate(self._lines(), start=1):
+            try:
+                record = json.loads(line)
+                if record["op"] == "node":
+                    node = HybridNode.model_validate(record["node"])
+                    nodes[str(node.id)] = node.model_dump(mode='json')
+                elif record["op"] == "edge":
+                    position = record["position"]
+                    if position < len(edges):
+                        continue # Already folded into the snapshot
+                    if position > len(edges):
+                        raise JournalError(f"edge position {position} skips ahead of {len(edges)}")
+                    edge = HybridEdge.model_validate(record["edge"])
+                    if str(edge.source_id) not in nodes or str(edge.target_id) not in nodes:
+                        raise JournalError("edge references non-existent nodes in this chain")
+                    edges.append(edge.model_dump(mode='json'))
+                else:
+                    raise JournalError(f"unknown operation '{record['op']}'")
+                data["updated_at"] = record["at"]
+                data["version"] = record.get("version", data.get("version", 0))
+                applied += 1
+            except (KeyError, TypeError, ValueError, ValidationError) as e:
+                raise JournalError(f"{self.path.name} line {line_no}: {e}")
+        return applied
+
+    def last_version(self) -> Optional[int]:
+        """
+        Version committed by the last complete record, read from the end of
+        the file; None if the journal is empty or predates versioning.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                end = f.seek(0, os.SEEK_END)
+                window = 4096
+                # Grow the window backwards until it holds a whole final record
+                while True:
+                    start = max(0, end - window)
+                    f.seek(start)
+                    tail = f.read(end - start)
+                    newline = tail.rfind(b"\n") # Anything after it is a torn line
+                    if newline >= 0 and (start == 0 or b"\n" in tail[:newline]):
+                        break
+                    if start == 0:
+                        return None
+                    window *= 2
+        except FileNotFoundError:
+            return None
+        body = tail[:newline]
+        last = body[body.rfind(b"\n") + 1:]
+        if not last:
+            return None
+        try:
+            return json.loads(last).get("version")
+        except ValueError:
+            return None
+
+    def discard(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            return
@@ -0,0 +1,172 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+from chimera_nexus.core.domain import HybridThreatChain
+from chimera_nexus.core.instrumentation import span
+from chimera_nexus.storage.codecs import CodecError, codec_for_path
+from chimera_nexus.storage.integrity import VALID, checksum_state, construct_chain
+from chimera_nexus.storage.journal import ChainJournal, journal_path_for
+
+T = TypeVar("T")
+
+# (path, func(chain) or None, error message or None)
+MapResult = Tuple[Path, Optional[T], Optional[str]]
+
+class LoadResult(NamedTuple):
+    """
+    Outcome of loading one chain file: either `chain` or `error` is set.
+    """
+    path: Path
+    chain: Optional[HybridThreatChain]
+    error: Optional[str]
+
+class LoadFailure(NamedTuple):
+    path: Path
+    error: str
+
+def read_chain_file(path: Path, compact: bool = False, trust: bool = True) -> HybridThreatChain:
+    """
+    Reads a snapshot and replays its journal on top.
+    Module-level so worker processes can run it without a repository instance.
+    With `compact`, signals are validated one at a time straight into a
+    CompactNodeStore instead of a dict of HybridNode objects.
+
+    If `trust` is set and the snapshot bytes match the checksum recorded when
+    this repository saved them, the models are built without re-validation.
+    Any other snapshot (hand-edited, foreign, unsealed) is fully validated;
+    journal records always are.
+    """
+    raw, data = _read_snapshot(path)
+    chain = None
+    with span("checksum.verify"):
+        trusted = trust and checksum_state(path, raw) == VALID
+    if trusted:
+        with span("model.construct"):
+            try:
+                chain = construct_chain(data, compact)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                chain = None # Sealed but not in the expected shape: fall back to validation
+    if chain is None:
+        chain = _validate_chain(data, compact)
+    with span("journal.replay"):
+        ChainJournal(journal_path_for(path)).replay(chain)
+    return chain
+
+def read_chain_payload(path: Path, trust: bool = True) -> Dict[str, Any]:
+    """
+    A chain file, journal included, as the JSON-mode dict HybridThreatChain
+    dumps to, for readers that only scan fields (registry analytics) and
+    should not pay for building every model. Same trust rules as
+    read_chain_file: a snapshot that does not match its checksum is
+    validated (and dumped back), and journal records always are.
+    """
+    raw, data = _read_snapshot(path)
+    with span("checksum.verify"):
+        trusted = trust and checksum_state(path, raw) == VALID
+    if not trusted:
+        data = _validate_chain(data, False).model_dump(mode='json')
+    with span("journal.replay"):
+        ChainJournal(journal_path_for(path)).replay_payload(data)
+    return data
+
+def _read_snapshot(path: Path) -> Tuple[bytes, Dict[str, Any]]:
+    codec = codec_for_path(path)
+    if codec is None:
+        raise CodecError(f"Unrecognized chain file format: {path.name}")
+    with span("file.read", path=path.name) as s:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        s.set(bytes=len(raw))
+    with span(f"codec.{codec.name}.decode"):
+        data = codec.decode(raw)
+    return raw, data
+
+def _validate_chain(data: dict, compact: bool) -> HybridThreatChain:
+    with span("model.validate"):
+        if compact:
+            records = (data.pop("nodes", None) or {}).values()
+            chain = HybridThreatChain.model_validate(data)
+            chain.use_compact_nodes(records)
+        else:
+            chain = HybridThreatChain.model_validate(data)
+    return chain
+
+def _identity(chain: HybridThreatChain) -> HybridThreatChain:
+    return chain
+
+def _apply_chunk(
+    func: Callable[..., T],
+    trust: bool,
+    compact: bool,
+    payload: bool,
+    paths: List[Path]
+) -> List[MapResult]:
+    results: List[MapResult] = []
+    for path in paths:
+        try:
+            if payload:
+                loaded = read_chain_payload(path, trust=trust)
+            else:
+                loaded = read_chain_file(path, compact=compact, trust=trust)
+            results.append((path, func(loaded), None))
+        except Exception as e:
+            results.append((path, None, f"{type(e).__name__}: {e}"))
+    return results
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    None means one worker per core.
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+def map_paths(
+    paths: Sequence[Path],
+    func: Callable[..., T],
+    workers: Optional[int] = 1,
+    chunk_size: Optional[int] = None,
+    trust: bool = True,
+    compact: bool = False,
+    payload: bool = False
+) -> Iterator[MapResult]:
+    """
+    Loads each chain file and applies `func` to it, fanning the work out to a
+    process pool when more than one worker is requested. `func` must be a
+    module-level callable so it can be sent to workers. Results stream back
+    in the order of `paths` regardless of which worker finishes first.
+    `trust=False` forces full validation of checksummed snapshots and
+    `compact` loads column-backed signals (see read_chain_file). With
+    `payload`, `func` gets the chain's dict (read_chain_payload) instead.
+    """
+    paths = list(paths)
+    worker_count = min(resolve_workers(workers), len(paths))
+
+    if worker_count <= 1:
+        for path in paths:
+            yield from _apply_chunk(func, trust, compact, payload, [path])
+        return
+
+    # A few chunks per worker balances uneven file sizes against IPC overhead
+    if chunk_size is None:
+        chunk_size = max(1, len(paths) // (worker_count * 4))
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=worker_count) as pool:
+        for results in pool.map(partial(_apply_chunk, func, trust, compact, payload), chunks):
+            yield from results
+
+def load_paths(
+    paths: Sequence[Path],
+    workers: Optional[int] = 1,
+    chunk_size: Optional[int] = None,
+    trust: bool = True,
+    compact: bool = False
+) -> Iterator[LoadResult]:
+    """
+    Loads chain files, in parallel when more than one worker is requested.
+    """
+    for path, chain, error in map_paths(paths, _identity, workers, chunk_size, trust, compact):
+        yield LoadResult(path, chain, error)
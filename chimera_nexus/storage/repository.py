@@ -1,25 +1,89 @@
-import yaml
+import json
 import os
+from datetime import datetime, timedelta
 from uuid import UUID
 from pathlib import Path
-from typing import List, Type, TypeVar
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
 from pydantic import BaseModel, ValidationError
-from chimera_nexus.core.domain import HybridThreatChain
+from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge, ThreatDomain
+from chimera_nexus.core.instrumentation import span, traced
+from chimera_nexus.storage.cache import CacheStats, ChainCache, FileSignature
+from chimera_nexus.storage.codecs import (
+    CODECS,
+    ChainCodec,
+    CodecError,
+    codec_for_path,
+    get_codec
+)
+from chimera_nexus.storage.history import ChainDiff, ChainHistory, ChainVersion, HistoryError
+from chimera_nexus.storage.index import ChainSummary, RegistryIndex
+from chimera_nexus.storage.integrity import VALID, VerifyResult, checksum_state, discard_checksum, write_checksum
+from chimera_nexus.storage.journal import ChainJournal, JournalError, journal_path_for
+from chimera_nexus.storage.locking import file_lock
+from chimera_nexus.storage.loader import LoadFailure, MapResult, load_paths, map_paths, read_chain_file
+from chimera_nexus.storage.search import SignalHit, SignalIndex, WindowCount
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
 
 class StorageError(Exception):
     pass
 
+class ConflictError(StorageError):
+    """
+    Raised by save_chain when the chain was committed by another writer
+    since the caller's copy was loaded.
+    """
+
 class NexusRepository:
     """
     Manages filesystem persistence for CHIMERA entities.
     Enforces atomic writes to prevent data corruption.
+
+    Small additions go to an append-only journal next to the snapshot
+    (`append_mutations`) and are folded into a fresh snapshot once the
+    journal grows past `journal_threshold` bytes.
+
+    The on-disk format is chosen per repository (`format`, else the stored
+    preference, else YAML) and detected per file on load, so a registry can
+    hold a mix of formats while it is being migrated.
+
+    Writers may share a registry across processes: every commit happens
+    under an advisory per-chain lock and bumps the chain's `version`.
+    save_chain is a compare-and-swap on that version; append_mutations
+    merges with whatever was committed in between, since additions commute.
+
+    Every committed version is kept in a ChainHistory, which stores each
+    node and edge once however many versions contain it (`history`,
+    `load_version`, `diff_versions`).
     """
-    def __init__(self, data_dir: str = "./nexus_data"):
+    SETTINGS_FILE = "repository.json"
+    DEFAULT_JOURNAL_THRESHOLD = 256 * 1024
+
+    def __init__(
+        self,
+        data_dir: str = "./nexus_data",
+        format: Optional[str] = None,
+        journal_threshold: int = DEFAULT_JOURNAL_THRESHOLD,
+        cache_bytes: int = 0,
+        compact_nodes: bool = False,
+        trust_checksums: bool = True
+    ):
         self.base_path = Path(data_dir)
+        # Load chains with column-backed signals (see HybridThreatChain.use_compact_nodes)
+        self.compact_nodes = compact_nodes
+        # Skip re-validating snapshots whose bytes match the checksum recorded at save
+        self.trust_checksums = trust_checksums
+        self.journal_threshold = journal_threshold
+        self.cache: Optional[ChainCache] = ChainCache(cache_bytes) if cache_bytes > 0 else None
         self.chains_path = self.base_path / "chains"
         self._initialize_storage()
+        self.index = RegistryIndex(self.base_path)
+        # chain id -> (file signature, committed version) for files this process read or wrote
+        self._versions: Dict[UUID, Tuple[FileSignature, int]] = {}
+        self.search_index = SignalIndex(self.base_path)
+        self.chain_history = ChainHistory(self.base_path)
+        self.codec = self._resolve_codec(format)
 
     def _initialize_storage(self):
         try:
@@ -27,53 +91,586 @@ class NexusRepository:
         except OSError as e:
             raise StorageError(f"Critical: Cannot create storage directory. {e}")
 
-    def _get_file_path(self, obj_id: UUID) -> Path:
-        return self.chains_path / f"{obj_id}.yaml"
+    def _settings_path(self) -> Path:
+        return self.base_path / self.SETTINGS_FILE
+
+    def _resolve_codec(self, format: Optional[str]) -> ChainCodec:
+        try:
+            if format is not None:
+                return get_codec(format)
+            settings_path = self._settings_path()
+            if settings_path.exists():
+                with open(settings_path, 'r', encoding='utf-8') as f:
+                    return get_codec(json.load(f).get("format", "yaml"))
+            return get_codec("yaml")
+        except (OSError, ValueError) as e:
+            raise StorageError(f"Invalid storage format configuration: {e}")
+
+    def _store_format_preference(self, codec: ChainCodec) -> None:
+        settings_path = self._settings_path()
+        temp_path = settings_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"format": codec.name}, f)
+            temp_path.replace(settings_path)
+        except OSError as e:
+            if temp_path.exists():
+                os.remove(temp_path)
+            raise StorageError(f"Failed to record storage format: {e}")
+
+    def _get_file_path(self, obj_id: UUID, codec: Optional[ChainCodec] = None) -> Path:
+        return self.chains_path / f"{obj_id}{(codec or self.codec).extension}"
+
+    def _find_chain_file(self, obj_id: UUID) -> Optional[Path]:
+        """
+        Locates a chain in any known format, preferring the repository's own.
+        """
+        preferred = self._get_file_path(obj_id)
+        if preferred.exists():
+            return preferred
+        for codec in CODECS.values():
+            candidate = self._get_file_path(obj_id, codec)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _file_signature(self, snapshot_path: Path) -> FileSignature:
+        stat = snapshot_path.stat()
+        journal_size = ChainJournal(journal_path_for(snapshot_path)).size()
+        return (stat.st_mtime_ns, stat.st_size, journal_size)
+
+    def chain_signature(self, chain_id: UUID) -> Optional[FileSignature]:
+        """
+        Identifies the persisted state of a chain (snapshot and journal);
+        it changes whenever the chain is written. None if it does not exist.
+        """
+        path = self._find_chain_file(chain_id)
+        if path is None:
+            return None
+        try:
+            return self._file_signature(path)
+        except FileNotFoundError:
+            return None
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        return self.cache.stats() if self.cache is not None else None
+
+    def _remove_stale_formats(self, obj_id: UUID, keep: Path) -> None:
+        for codec in CODECS.values():
+            candidate = self._get_file_path(obj_id, codec)
+            if candidate != keep and candidate.exists():
+                os.remove(candidate)
+                discard_checksum(candidate)
+
+    def _lock(self, chain_id: UUID, shared: bool = False):
+        # One lock file per chain, whatever format its snapshot is in
+        return file_lock(self.chains_path / f"{chain_id}.lock", shared=shared)
+
+    def _remember_version(self, chain: HybridThreatChain, snapshot_path: Path) -> None:
+        try:
+            self._versions[chain.id] = (self._file_signature(snapshot_path), chain.version)
+        except OSError:
+            self._versions.pop(chain.id, None)
 
-    def save_chain(self, chain: HybridThreatChain) -> Path:
+    def _committed_version(self, chain_id: UUID) -> Optional[int]:
         """
-        Atomically saves a HybridThreatChain to disk.
+        Version of the chain on disk (None if it does not exist). Call with
+        the chain's lock held. Reads the journal's last record, or the
+        snapshot only when this process has not seen its current state.
         """
-        target_path = self._get_file_path(chain.id)
+        path = self._find_chain_file(chain_id)
+        if path is None:
+            return None
+        version = ChainJournal(journal_path_for(path)).last_version()
+        if version is not None:
+            return version
+
+        known = self._versions.get(chain_id)
+        if known is not None and known[0] == self._file_signature(path):
+            return known[1]
+        try:
+            return read_chain_file(path).version
+        except (ValidationError, CodecError, JournalError) as e:
+            raise StorageError(f"Corrupt data in {path}: {e}")
+
+    def _load_committed(self, chain_id: UUID) -> HybridThreatChain:
+        path = self._find_chain_file(chain_id)
+        try:
+            chain = read_chain_file(path, compact=self.compact_nodes, trust=self.trust_checksums)
+        except (ValidationError, CodecError, JournalError) as e:
+            raise StorageError(f"Corrupt data in {path}: {e}")
+        self._remember_version(chain, path)
+        return chain
+
+    @traced("repository.save_chain")
+    def save_chain(self, chain: HybridThreatChain, merge: bool = False, force: bool = False) -> Path:
+        """
+        Atomically saves a HybridThreatChain to disk, provided nobody else
+        committed it since `chain` was loaded (its `version` is still the
+        committed one); otherwise raises ConflictError. With `merge`, the
+        other writers' nodes and links are folded into `chain` instead and
+        the union is saved; with `force`, `chain` replaces them (the
+        replaced version stays in the history). Bumps `chain.version` on success.
+        """
+        with self._lock(chain.id):
+            committed = self._committed_version(chain.id)
+            if committed is not None and committed != chain.version:
+                if force:
+                    chain.version = committed
+                elif merge:
+                    self._merge_committed(chain)
+                else:
+                    raise ConflictError(
+                        f"Chain {chain.id} is at version {committed} on disk but this copy "
+                        f"is version {chain.version}; reload it or save with merge."
+                    )
+            return self._commit_snapshot(chain, self.codec)
+
+    def _merge_committed(self, chain: HybridThreatChain) -> None:
+        committed = self._load_committed(chain.id)
+        for node_id, node in committed.nodes.items():
+            if node_id not in chain.nodes:
+                chain.add_node(node)
+        for edge in committed.edges:
+            if not chain.has_edge(edge.source_id, edge.target_id, edge.relation_type):
+                chain.add_edge(edge)
+        chain.version = committed.version
+
+    def _commit_snapshot(self, chain: HybridThreatChain, codec: ChainCodec) -> Path:
+        chain.version += 1
+        try:
+            target_path, raw = self._write_snapshot(chain, codec)
+        except StorageError:
+            # Nothing was committed
+            chain.version -= 1
+            raise
+        # Committed from here on: `chain` keeps its new version even if the bookkeeping fails
+        self._index_snapshot(chain, target_path, raw)
+        return target_path
+
+    def _write_chain(self, chain: HybridThreatChain, codec: ChainCodec) -> Path:
+        """
+        Writes `chain` as it is; callers hold its lock.
+        """
+        target_path, raw = self._write_snapshot(chain, codec)
+        self._index_snapshot(chain, target_path, raw)
+        return target_path
+
+    def _write_snapshot(self, chain: HybridThreatChain, codec: ChainCodec) -> Tuple[Path, bytes]:
+        """
+        Commits the snapshot with an atomic rename and returns its path and
+        bytes; a StorageError means the file on disk is unchanged.
+        """
+        target_path = self._get_file_path(chain.id, codec)
         temp_path = target_path.with_suffix('.tmp')
 
         try:
             # Dump to dictionary using Pydantic JSON logic (handles UUID/Datetime)
-            data = chain.model_dump(mode='json')
+            with span("model.dump"):
+                data = chain.model_dump(mode='json')
+            with span(f"codec.{codec.name}.encode"):
+                raw = codec.encode(data)
+            # Recorded first: a manifest for a version that failed to commit is harmless
+            with span("history.record"):
+                self.chain_history.record_snapshot(chain, data)
             
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, sort_keys=False, allow_unicode=True)
+            with span("file.write", path=target_path.name, bytes=len(raw)):
+                with open(temp_path, 'wb') as f:
+                    f.write(raw)
             
             # Atomic rename
             temp_path.replace(target_path)
-            return target_path
-            
         except (IOError, OSError) as e:
             if temp_path.exists():
                 os.remove(temp_path)
+            self.chain_history.forget(chain.id)
             raise StorageError(f"Failed to persist chain {chain.id}: {e}")
+        return target_path, raw
+
+    def _index_snapshot(self, chain: HybridThreatChain, target_path: Path, raw: bytes) -> None:
+        """
+        Bookkeeping after a snapshot is committed: checksum, journal, indexes.
+        """
+        try:
+            # `raw` came from a validated model, so later loads may skip validation
+            write_checksum(target_path, raw)
+            self._remove_stale_formats(chain.id, keep=target_path)
+            # The snapshot now holds everything the journal recorded
+            ChainJournal(journal_path_for(target_path)).discard()
+            with span("index.update"):
+                self.index.update(ChainSummary.from_chain(chain, target_path.stat()))
+            signature = self._file_signature(target_path)
+            self._versions[chain.id] = (signature, chain.version)
+            with span("search.update"):
+                self.search_index.update(chain, signature)
+            if self.cache is not None:
+                self.cache.put(chain, signature)
+        except (IOError, OSError) as e:
+            # The snapshot itself is committed; stale indexes re-derive from its signature
+            self._versions.pop(chain.id, None)
+            raise StorageError(
+                f"Chain {chain.id} was saved as version {chain.version}, "
+                f"but updating its indexes failed: {e}"
+            )
 
-    def load_chain(self, chain_id: UUID) -> HybridThreatChain:
-        target_path = self._get_file_path(chain_id)
+    @traced("repository.load_chain")
+    def load_chain(self, chain_id: UUID, validate: bool = False) -> HybridThreatChain:
+        """
+        `validate` forces full model validation even for a checksummed snapshot
+        (and bypasses the cache).
+        """
+        target_path = self._find_chain_file(chain_id)
         
-        if not target_path.exists():
+        if target_path is None:
             raise StorageError(f"Chain {chain_id} not found.")
 
+        signature = None
+        if self.cache is not None and not validate:
+            signature = self._file_signature(target_path)
+            cached = self.cache.get(chain_id, signature)
+            if cached is not None:
+                return cached
+
         try:
-            with open(target_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            return HybridThreatChain.model_validate(data)
-        except (ValidationError, yaml.YAMLError) as e:
+            # Shared: never observe a snapshot and journal from different commits
+            with self._lock(chain_id, shared=True):
+                chain = read_chain_file(
+                    target_path,
+                    compact=self.compact_nodes,
+                    trust=self.trust_checksums and not validate
+                )
+                self._remember_version(chain, target_path)
+        except (ValidationError, CodecError, JournalError) as e:
             raise StorageError(f"Corrupt data in {target_path}: {e}")
+        except FileNotFoundError:
+            # Replaced by a migration to another format between lookup and lock
+            return self.load_chain(chain_id, validate)
+
+        if self.cache is not None and signature is not None:
+            self.cache.put(chain, signature)
+        return chain
+
+    @traced("repository.append_mutations")
+    def append_mutations(
+        self,
+        chain: HybridThreatChain,
+        nodes: Sequence[HybridNode] = (),
+        edges: Sequence[HybridEdge] = (),
+        applied: bool = False
+    ) -> Path:
+        """
+        Adds nodes/edges to `chain` and persists only the additions.
+        Costs O(additions) instead of rewriting the whole chain, including
+        the registry and search index updates, which are appended to their
+        logs; compacts into a new snapshot when the journal passes the size
+        threshold.
+        With `applied`, the additions are already in `chain` (as its last
+        edges) and are only persisted.
 
-    def list_chains(self) -> List[HybridThreatChain]:
-        chains = []
-        for f in self.chains_path.glob("*.yaml"):
+        If another writer committed the chain since `chain` was loaded, the
+        additions are applied on top of the committed state instead, and
+        `chain` is updated in place to that merged result.
+        """
+        with self._lock(chain.id):
+            snapshot_path = self._find_chain_file(chain.id)
+            if snapshot_path is None:
+                if not applied:
+                    for node in nodes:
+                        chain.add_node(node)
+                    for edge in edges:
+                        chain.add_edge(edge)
+                return self._commit_snapshot(chain, self.codec)
+
+            target = chain
+            if self._committed_version(chain.id) != chain.version:
+                target = self._load_committed(chain.id)
+                applied = False
+            if not applied:
+                self._seed_content_digest(target, snapshot_path)
+                for node in nodes:
+                    target.add_node(node)
+                for edge in edges:
+                    target.add_edge(edge)
+            if target is not chain:
+                chain.adopt(target)
+
+            journal = ChainJournal(journal_path_for(snapshot_path))
+            if not nodes and not edges:
+                return journal.path
+            previous = self._file_signature(snapshot_path)
+            chain.version += 1
             try:
-                # Optimized: We load fully here, but in high-scale we would parse header only
-                with open(f, 'r', encoding='utf-8') as file_handle:
-                    data = yaml.safe_load(file_handle)
-                    chains.append(HybridThreatChain.model_validate(data))
-            except Exception:
-                continue # Skip malformed files in listing
-        return chains
\ No newline at end of file
+                self.chain_history.record_additions(chain, nodes, edges)
+                journal.record(chain, nodes, edges)
+            except (IOError, OSError) as e:
+                chain.version -= 1
+                self.chain_history.forget(chain.id)
+                raise StorageError(f"Failed to journal changes to chain {chain.id}: {e}")
+
+            journal_size = journal.size()
+            if journal_size >= self.journal_threshold:
+                return self._write_chain(chain, self.codec)
+
+            self.index.update(ChainSummary.from_chain(chain, snapshot_path.stat(), journal_size))
+            signature = self._file_signature(snapshot_path)
+            self.search_index.add_nodes(chain, nodes, previous, signature)
+            if self.cache is not None:
+                self.cache.put(chain, signature)
+            return journal.path
+
+    def _seed_content_digest(self, chain: HybridThreatChain, snapshot_path: Path) -> None:
+        """
+        Takes a freshly loaded chain's content digest from its registry entry
+        when the entry describes the file as it is, so the summary written
+        after an append does not hash every node and edge.
+        """
+        summary = self.index.get(chain.id)
+        if summary is None or not summary.content_digest:
+            return
+        try:
+            stat = snapshot_path.stat()
+        except OSError:
+            return
+        if summary.matches(stat, ChainJournal(journal_path_for(snapshot_path)).size()):
+            chain.seed_content_digest(summary.content_digest)
+
+    def _chain_files(self) -> Dict[str, Path]:
+        """
+        Maps chain id to its file. If a chain exists in several formats
+        (an interrupted migration), the repository's own format wins.
+        """
+        files: Dict[str, Path] = {}
+        for f in sorted(self.chains_path.iterdir()):
+            codec = codec_for_path(f)
+            if codec is None:
+                continue
+            if f.stem not in files or codec is self.codec:
+                files[f.stem] = f
+        return files
+
+    def iter_chains(
+        self,
+        workers: Optional[int] = 1,
+        chunk_size: Optional[int] = None,
+        failures: Optional[List[LoadFailure]] = None
+    ) -> Iterator[HybridThreatChain]:
+        """
+        Streams every chain in chain-id order.
+        With workers > 1 (or None for one per core) parsing runs in a process pool.
+        Malformed files are skipped and, if `failures` is given, reported into it.
+        """
+        paths = list(self._chain_files().values())
+        for result in load_paths(paths, workers, chunk_size, self.trust_checksums, self.compact_nodes):
+            if result.chain is not None:
+                yield result.chain
+            elif failures is not None:
+                failures.append(LoadFailure(result.path, result.error or "unknown error"))
+
+    def map_chains(
+        self,
+        func: Callable[[HybridThreatChain], R],
+        chain_ids: Optional[Iterable[UUID]] = None,
+        workers: Optional[int] = 1,
+        payload: bool = False
+    ) -> Iterator[MapResult]:
+        """
+        Loads chains (all, or just `chain_ids`) and applies a module-level
+        `func` to each inside the worker processes, so only its result
+        crosses the process boundary. Yields (path, result, error) in order.
+        With `payload`, `func` gets each chain as its JSON-mode dict and no
+        models are built (see read_chain_payload).
+        """
+        files = self._chain_files()
+        if chain_ids is None:
+            paths = list(files.values())
+        else:
+            paths = [files[str(c)] for c in chain_ids if str(c) in files]
+        return map_paths(
+            paths, func, workers, trust=self.trust_checksums, compact=self.compact_nodes, payload=payload
+        )
+
+    @traced("repository.list_chains")
+    def list_chains(
+        self,
+        workers: Optional[int] = 1,
+        failures: Optional[List[LoadFailure]] = None
+    ) -> List[HybridThreatChain]:
+        return list(self.iter_chains(workers=workers, failures=failures))
+
+    @traced("repository.list_summaries")
+    def list_summaries(
+        self,
+        workers: Optional[int] = 1,
+        failures: Optional[List[LoadFailure]] = None
+    ) -> List[ChainSummary]:
+        """
+        Lists the registry from the header index.
+        Only chain files changed since the last listing are parsed.
+        """
+        return self.index.refresh(
+            self._chain_files(),
+            lambda paths: load_paths(paths, workers, trust=self.trust_checksums, compact=self.compact_nodes),
+            failures
+        )
+
+    @traced("repository.search_signals")
+    def search_signals(
+        self,
+        query: str = "",
+        prefix: bool = False,
+        domains: Optional[Iterable[ThreatDomain]] = None,
+        limit: Optional[int] = None,
+        workers: Optional[int] = 1,
+        failures: Optional[List[LoadFailure]] = None
+    ) -> List[SignalHit]:
+        """
+        Searches signal types and descriptions across the registry (see
+        SignalIndex.search). Only chains changed outside this repository
+        since they were indexed are parsed, in parallel with workers > 1.
+        """
+        self._refresh_signal_index(workers, failures)
+        with span("search.query"):
+            return self.search_index.search(query, prefix=prefix, domains=domains, limit=limit)
+
+    def signals_between(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        domains: Optional[Iterable[ThreatDomain]] = None,
+        workers: Optional[int] = 1,
+        failures: Optional[List[LoadFailure]] = None
+    ) -> Iterator[SignalHit]:
+        """
+        Streams every signal in `[since, until)` across the registry, oldest
+        first, from the signal index rather than the chain files.
+        """
+        self._refresh_signal_index(workers, failures)
+        return self.search_index.between(since, until, domains)
+
+    def signal_window_counts(
+        self,
+        width: timedelta,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        step: Optional[timedelta] = None,
+        workers: Optional[int] = 1,
+        failures: Optional[List[LoadFailure]] = None
+    ) -> List[WindowCount]:
+        """
+        Per-domain signal counts over sliding windows (see SignalIndex.window_counts).
+        """
+        self._refresh_signal_index(workers, failures)
+        return self.search_index.window_counts(width, since, until, step)
+
+    def _refresh_signal_index(self, workers: Optional[int], failures: Optional[List[LoadFailure]]) -> None:
+        with span("search.refresh"):
+            self.search_index.refresh(
+                self._chain_files(),
+                self._file_signature,
+                lambda paths: load_paths(paths, workers, trust=self.trust_checksums, compact=self.compact_nodes),
+                failures
+            )
+
+    def history(self, chain_id: UUID) -> List[ChainVersion]:
+        """
+        Committed versions of a chain, oldest first. Versions saved before
+        history was recorded (or by another backend) are not listed.
+        """
+        if self._find_chain_file(chain_id) is None:
+            raise StorageError(f"Chain {chain_id} not found.")
+        with self._lock(chain_id, shared=True):
+            committed = self._committed_version(chain_id)
+            if committed is None:
+                raise StorageError(f"Chain {chain_id} not found.")
+            try:
+                return self.chain_history.versions(chain_id, upto=committed)
+            except HistoryError as e:
+                raise StorageError(str(e))
+
+    def load_version(self, chain_id: UUID, version: int) -> HybridThreatChain:
+        """
+        Rebuilds a chain as it was committed at `version`.
+        """
+        try:
+            return self.chain_history.load(chain_id, version, compact=self.compact_nodes)
+        except HistoryError as e:
+            raise StorageError(str(e))
+
+    def diff_versions(self, chain_id: UUID, old: int, new: int) -> ChainDiff:
+        """
+        What changed in a chain from version `old` to `new`, reading only
+        the nodes and edges that differ.
+        """
+        try:
+            return self.chain_history.diff(chain_id, old, new)
+        except HistoryError as e:
+            raise StorageError(str(e))
+
+    def migrate(self, format: str) -> int:
+        """
+        Rewrites every chain in the given format and makes it the repository default.
+        Each chain is converted atomically; returns the number of chains converted.
+        """
+        try:
+            target = get_codec(format)
+        except CodecError as e:
+            raise StorageError(str(e))
+
+        converted = 0
+        for path in self._chain_files().values():
+            if codec_for_path(path) is target:
+                continue
+            with self._lock(UUID(path.stem)):
+                try:
+                    chain = read_chain_file(path)
+                except (ValidationError, CodecError, JournalError) as e:
+                    raise StorageError(f"Corrupt data in {path}: {e}")
+                # Same content in a new format: the version is unchanged
+                self._write_chain(chain, target)
+            converted += 1
+
+        self.codec = target
+        self._store_format_preference(target)
+        return converted
+
+    def verify(self, workers: Optional[int] = 1, reseal: bool = False) -> List[VerifyResult]:
+        """
+        Fully revalidates every chain file (snapshot and journal), ignoring
+        checksums, and reports each file's checksum state. With `reseal`,
+        files that validate but are unsealed or were edited by hand get a
+        fresh checksum, so they use the fast load path from then on.
+        """
+        files = list(self._chain_files().values())
+        signatures = {}
+        for path in files:
+            try:
+                signatures[path] = path.stat()
+            except OSError:
+                continue
+
+        results: List[VerifyResult] = []
+        for path, _, error in map_paths(files, _node_count, workers, trust=False):
+            try:
+                raw = path.read_bytes()
+            except OSError as e:
+                results.append(VerifyResult(path, "unreadable", error or str(e)))
+                continue
+            state = checksum_state(path, raw)
+            resealed = False
+            if error is None and reseal and state != VALID:
+                stat = path.stat()
+                before = signatures.get(path)
+                # Only seal the bytes that were actually validated
+                if before is not None and (stat.st_mtime_ns, stat.st_size) == (before.st_mtime_ns, before.st_size):
+                    try:
+                        write_checksum(path, raw)
+                        resealed = True
+                    except OSError as e:
+                        raise StorageError(f"Failed to reseal {path.name}: {e}")
+            results.append(VerifyResult(path, state, error, resealed))
+        return results
+
+def _node_count(chain: HybridThreatChain) -> int:
+    # Module-level so verification workers can return it instead of the chain
+    return len(chain.nodes)
+
@@ -0,0 +1,442 @@
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+from uuid import UUID
+from chimera_nexus.core.domain import HybridNode, HybridThreatChain, ThreatDomain, epoch_seconds
+from chimera_nexus.storage.cache import FileSignature
+from chimera_nexus.storage.loader import LoadFailure, LoadResult
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased alphanumeric runs; 'DDoS probe, bank-run' -> ['ddos', 'probe', 'bank', 'run'].
+    """
+    return _TOKEN.findall(text.lower())
+
+def node_terms(signal_type: str, description: str) -> Set[str]:
+    # The whole signal type is a term too, so 'ddos_probe' matches exactly
+    terms = set(tokenize(signal_type))
+    terms.update(tokenize(description))
+    terms.add(signal_type.lower())
+    return terms
+
+class SignalHit(NamedTuple):
+    chain_id: UUID
+    node_id: UUID
+    domain: ThreatDomain
+    signal_type: str
+    confidence: float
+    description: str
+    timestamp: datetime
+
+class WindowCount(NamedTuple):
+    """
+    Signals per domain with `start <= timestamp < end` (both UTC).
+    """
+    start: datetime
+    end: datetime
+    counts: Dict[ThreatDomain, int]
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS chains (
+        id TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        journal_size INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS signals (
+        row INTEGER PRIMARY KEY,
+        chain_id TEXT NOT NULL,
+        id TEXT NOT NULL,
+        domain TEXT NOT NULL,
+        signal_type TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        description TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        epoch REAL NOT NULL,
+        UNIQUE (chain_id, id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS terms (
+        term TEXT NOT NULL,
+        row INTEGER NOT NULL,
+        PRIMARY KEY (term, row)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_terms_row ON terms(row)",
+    # The persisted time-sorted column behind window queries; ties keep chain then insertion order
+    "CREATE INDEX IF NOT EXISTS idx_signals_time ON signals(epoch, chain_id)"
+)
+
+_TABLES = ("chains", "signals", "terms")
+
+_HIT_COLUMNS = "chain_id, id, domain, signal_type, confidence, description, timestamp"
+
+def _hit(row: Tuple[Any, ...]) -> SignalHit:
+    return SignalHit(
+        chain_id=UUID(row[0]),
+        node_id=UUID(row[1]),
+        domain=ThreatDomain(row[2]),
+        signal_type=row[3],
+        confidence=row[4],
+        description=row[5],
+        timestamp=datetime.fromisoformat(row[6])
+    )
+
+def _successor(term: str) -> str:
+    # Smallest string above every extension of `term`, bounding a prefix range scan
+    return term[:-1] + chr(ord(term[-1]) + 1)
+
+class SignalIndex:
+    """
+    Persisted inverted index over the signals of every chain, answering
+    term, prefix and domain-filtered searches without loading chains.
+
+    Signals and their postings live in `search/signals.db` (SQLite), so a
+    query is an indexed lookup whatever the registry size, and a process
+    builds nothing in memory first. Saving a chain replaces its rows and a
+    journaled append inserts only the additions, each in one transaction.
+    The `chains` table records the chain file signature the rows were
+    built from; like RegistryIndex, they are only trusted while the chain's
+    snapshot and journal are unchanged. An index on the signals' epoch
+    seconds serves the registry-wide time-window queries the same way.
+    """
+    DIRNAME = "search"
+    FILENAME = "signals.db"
+    # Bump when the schema changes; an older index is dropped and rebuilt
+    FORMAT_VERSION = 4
+
+    def __init__(self, base_path: Path):
+        self.directory = base_path / self.DIRNAME
+        self.path = self.directory / self.FILENAME
+        # Opened on first use, so constructing a repository touches no files
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # --- Persistence ---
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            self._conn = self._open()
+        except sqlite3.DatabaseError:
+            # A damaged index is only a cache miss: it is rebuilt from the chain files
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(f"{self.path}{suffix}")
+                except FileNotFoundError:
+                    pass
+            self._conn = self._open()
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        # Autocommit mode: writes take the lock up front through BEGIN IMMEDIATE.
+        # Callers serialize their own access (the daemon holds its repository lock).
+        conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.FORMAT_VERSION:
+                for table in _TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {self.FORMAT_VERSION}")
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _remove_chain(conn: sqlite3.Connection, key: str) -> None:
+        conn.execute("DELETE FROM terms WHERE row IN (SELECT row FROM signals WHERE chain_id = ?)", (key,))
+        conn.execute("DELETE FROM signals WHERE chain_id = ?", (key,))
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, key: str, nodes: Iterable[HybridNode]) -> None:
+        # Row ids are assigned here so signals and their postings go in as two batches
+        first = conn.execute("SELECT COALESCE(MAX(row), 0) + 1 FROM signals").fetchone()[0]
+        signals = []
+        postings = []
+        for row, node in enumerate(nodes, first):
+            signals.append((
+                row, key, str(node.id), node.domain.value, node.signal_type, node.confidence,
+                node.description, node.timestamp.isoformat(), epoch_seconds(node.timestamp)
+            ))
+            postings.extend((term, row) for term in node_terms(node.signal_type, node.description))
+        conn.executemany("INSERT INTO signals VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", signals)
+        conn.executemany("INSERT INTO terms VALUES (?, ?)", postings)
+
+    @staticmethod
+    def _stamp(conn: sqlite3.Connection, key: str, signature: FileSignature) -> None:
+        conn.execute("INSERT OR REPLACE INTO chains VALUES (?, ?, ?, ?)", (key, *signature))
+
+    def _signatures(self) -> Dict[str, FileSignature]:
+        return {
+            row[0]: tuple(row[1:])
+            for row in self._connect().execute("SELECT id, mtime_ns, size, journal_size FROM chains")
+        }
+
+    # --- Incremental Maintenance ---
+
+    def update(self, chain: HybridThreatChain, signature: FileSignature) -> None:
+        """
+        Re-indexes every signal of a freshly written chain snapshot.
+        """
+        key = str(chain.id)
+        try:
+            with self._transaction() as conn:
+                self._remove_chain(conn, key)
+                self._insert(conn, key, chain.nodes.values())
+                self._stamp(conn, key, signature)
+        except sqlite3.Error:
+            # Index maintenance is best-effort: the old signature makes the next refresh re-index
+            pass
+
+    def add_nodes(
+        self,
+        chain: HybridThreatChain,
+        nodes: Sequence[HybridNode],
+        previous: FileSignature,
+        signature: FileSignature
+    ) -> None:
+        """
+        Indexes signals appended to a chain's journal in O(additions);
+        `previous` is the chain file's signature before the append. Falls
+        back to a full re-index when the rows were not built from that state
+        (e.g. the file was edited outside the repository).
+        """
+        key = str(chain.id)
+        try:
+            with self._transaction() as conn:
+                row = conn.execute("SELECT mtime_ns, size, journal_size FROM chains WHERE id = ?", (key,)).fetchone()
+                if row is None or tuple(row) != tuple(previous):
+                    self._remove_chain(conn, key)
+                    self._insert(conn, key, chain.nodes.values())
+                else:
+                    # A re-added node id replaces the earlier signal
+                    added = {str(node.id): node for node in nodes}
+                    ids = [(key, node_id) for node_id in added]
+                    conn.executemany(
+                        "DELETE FROM terms WHERE row IN (SELECT row FROM signals WHERE chain_id = ? AND id = ?)", ids
+                    )
+                    conn.executemany("DELETE FROM signals WHERE chain_id = ? AND id = ?", ids)
+                    self._insert(conn, key, added.values())
+                self._stamp(conn, key, signature)
+        except sqlite3.Error:
+            pass
+
+    def _forget(self, key: str) -> None:
+        try:
+            with self._transaction() as conn:
+                self._remove_chain(conn, key)
+                conn.execute("DELETE FROM chains WHERE id = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def refresh(
+        self,
+        files: Dict[str, Path],
+        signature_of: Callable[[Path], FileSignature],
+        load_many: Callable[[List[Path]], Iterable[LoadResult]],
+        failures: Optional[List[LoadFailure]] = None
+    ) -> None:
+        """
+        Brings the index in line with the chain files on disk, re-indexing
+        only chains whose snapshot or journal changed. `files` maps chain id
+        to path. Malformed files drop out of the index and are reported
+        into `failures` when given.
+        """
+        signatures = self._signatures()
+
+        for key in signatures:
+            if key not in files:
+                self._forget(key)
+
+        stale: Dict[Path, Tuple[str, FileSignature]] = {}
+        for key, path in files.items():
+            try:
+                signature = signature_of(path)
+            except OSError:
+                continue
+            if signatures.get(key) != signature:
+                stale[path] = (key, signature)
+
+        if stale:
+            for result in load_many(list(stale)):
+                key, signature = stale[result.path]
+                if result.chain is None:
+                    self._forget(key)
+                    if failures is not None:
+                        failures.append(LoadFailure(result.path, result.error or "unknown error"))
+                    continue
+                self.update(result.chain, signature)
+
+    # --- Queries ---
+
+    def search(
+        self,
+        query: str = "",
+        prefix: bool = False,
+        domains: Optional[Iterable[ThreatDomain]] = None,
+        limit: Optional[int] = None
+    ) -> List[SignalHit]:
+        """
+        Signals matching every term of `query` (terms are tokenized like
+        descriptions; a full signal type such as 'ddos_probe' also matches),
+        optionally restricted to `domains`, ranked by confidence.
+        With `prefix`, each term also matches longer terms ('bank' -> 'banking').
+        An empty query returns every signal in the selected domains.
+        """
+        conn = self._connect()
+        terms = set(tokenize(query))
+        if query.strip() and not terms:
+            return []
+        whole = query.strip().lower()
+        if whole and whole not in terms and conn.execute(
+            "SELECT 1 FROM terms WHERE term = ? LIMIT 1", (whole,)
+        ).fetchone():
+            # An unsplit signal type ('ddos_probe') is a term of its own
+            terms = {whole}
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        if terms:
+            lookups = []
+            for term in sorted(terms):
+                if prefix:
+                    # Terms sort contiguously, so every extension of `term` is one range of the key
+                    lookups.append("SELECT row FROM terms WHERE term >= ? AND term < ?")
+                    params += [term, _successor(term)]
+                else:
+                    lookups.append("SELECT row FROM terms WHERE term = ?")
+                    params.append(term)
+            clauses.append(f"row IN ({' INTERSECT '.join(lookups)})")
+        if domains is not None:
+            allowed = sorted({domain.value for domain in domains})
+            if not allowed:
+                return []
+            clauses.append(f"domain IN ({', '.join('?' * len(allowed))})")
+            params += allowed
+
+        sql = f"SELECT {_HIT_COLUMNS} FROM signals"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY confidence DESC, chain_id, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_hit(row) for row in conn.execute(sql, params)]
+
+    def between(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        domains: Optional[Iterable[ThreatDomain]] = None
+    ) -> Iterator[SignalHit]:
+        """
+        Signals with `since <= timestamp < until`, oldest first, across every
+        chain. Naive datetimes are taken as UTC. A range scan of the time
+        index, so the cost is proportional to the hits.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            clauses.append("epoch >= ?")
+            params.append(epoch_seconds(since))
+        if until is not None:
+            clauses.append("epoch < ?")
+            params.append(epoch_seconds(until))
+        if domains is not None:
+            allowed = sorted({domain.value for domain in domains})
+            clauses.append(f"domain IN ({', '.join('?' * len(allowed))})")
+            params += allowed
+        sql = f"SELECT {_HIT_COLUMNS} FROM signals"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY epoch, chain_id, row"
+        for row in self._connect().execute(sql, params):
+            yield _hit(row)
+
+    def window_counts(
+        self,
+        width: timedelta,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        step: Optional[timedelta] = None
+    ) -> List[WindowCount]:
+        """
+        Per-domain signal counts in windows of `width`, starting at `since`
+        and advancing by `step` (default `width`, i.e. non-overlapping) while
+        the window starts before `until`. Bounds default to the oldest and
+        newest indexed signal; only signals some window reaches are read,
+        in order, off the time index. Overlapping windows share one pass:
+        each signal is added when the window's end passes it and removed
+        when its start does.
+        """
+        if width.total_seconds() <= 0 or (step is not None and step.total_seconds() <= 0):
+            raise ValueError("Window width and step must be positive.")
+        conn = self._connect()
+        oldest, newest = conn.execute("SELECT MIN(epoch), MAX(epoch) FROM signals").fetchone()
+        if oldest is None and (since is None or until is None):
+            return []
+        low = epoch_seconds(since) if since is not None else oldest
+        high = epoch_seconds(until) if until is not None else newest + 1e-6
+        size, stride = width.total_seconds(), (step or width).total_seconds()
+
+        # Only signals some window can reach: the last one ends before high + size
+        rows = conn.execute(
+            "SELECT epoch, domain FROM signals WHERE epoch >= ? AND epoch < ? ORDER BY epoch",
+            (low, high + size)
+        ).fetchall()
+        times = [row[0] for row in rows]
+        signal_domains = [ThreatDomain(row[1]) for row in rows]
+
+        windows: List[WindowCount] = []
+        counts: Dict[ThreatDomain, int] = {}
+        head = tail = 0
+        index = 0
+        start = low
+        while start < high:
+            end = start + size
+            while head < len(times) and times[head] < end:
+                domain = signal_domains[head]
+                counts[domain] = counts.get(domain, 0) + 1
+                head += 1
+            while tail < head and times[tail] < start:
+                domain = signal_domains[tail]
+                counts[domain] -= 1
+                if not counts[domain]:
+                    del counts[domain]
+                tail += 1
+            windows.append(WindowCount(
+                datetime.fromtimestamp(start, timezone.utc),
+                datetime.fromtimestamp(end, timezone.utc),
+                dict(counts)
+            ))
+            index += 1
+            # Multiplying rather than accumulating keeps boundaries free of float drift
+            start = low + index * stride
+        return windows
@@ -0,0 +1,262 @@
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from chimera_nexus.core.domain import (
+    HybridThreatChain,
+    HybridNode,
+    ThreatDomain,
+    chain_coherence
+)
+from chimera_nexus.storage.index import ChainSummary
+from chimera_nexus.storage.repository import NexusRepository, StorageError
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chains (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    chain_id TEXT NOT NULL REFERENCES chains(id) ON DELETE CASCADE,
+    id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    signal_type TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    cost_estimate REAL NOT NULL,
+    description TEXT NOT NULL,
+    PRIMARY KEY (chain_id, id)
+);
+CREATE TABLE IF NOT EXISTS edges (
+    chain_id TEXT NOT NULL REFERENCES chains(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    source_id TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    relation_type TEXT NOT NULL,
+    weight REAL NOT NULL,
+    justification TEXT NOT NULL,
+    PRIMARY KEY (chain_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_domain ON nodes(domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_signal_type ON nodes(signal_type);
+CREATE INDEX IF NOT EXISTS idx_nodes_timestamp ON nodes(timestamp);
+"""
+
+def _iso(value: datetime) -> str:
+    # Fixed precision keeps lexical order equal to chronological order in the index
+    return value.isoformat(timespec='microseconds')
+
+class SQLiteNexusRepository:
+    """
+    Single-file SQLite alternative to NexusRepository.
+    Chains, nodes and edges live in normalized, indexed tables so cross-chain
+    queries do not need a directory scan. Every save is one transaction.
+    """
+    def __init__(self, db_path: str = "./nexus_data/nexus.db"):
+        self.db_path = Path(db_path)
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            raise StorageError(f"Critical: Cannot open SQLite storage. {e}")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def save_chain(self, chain: HybridThreatChain) -> Path:
+        """
+        Transactionally replaces the stored chain with the given state.
+        """
+        chain_id = str(chain.id)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO chains (id, name, created_at, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET name = excluded.name, "
+                    "created_at = excluded.created_at, updated_at = excluded.updated_at",
+                    (chain_id, chain.name, _iso(chain.created_at), _iso(chain.updated_at))
+                )
+                self._conn.execute("DELETE FROM nodes WHERE chain_id = ?", (chain_id,))
+                self._conn.execute("DELETE FROM edges WHERE chain_id = ?", (chain_id,))
+                self._conn.executemany(
+                    "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (chain_id, str(n.id), pos, _iso(n.timestamp), n.domain.value,
+                         n.signal_type, n.confidence, n.cost_estimate, n.description)
+                        for pos, n in enumerate(chain.nodes.values())
+                    )
+                )
+                self._conn.executemany(
+                    "INSERT INTO edges VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (chain_id, pos, str(e.source_id), str(e.target_id),
+                         e.relation_type.value, e.weight, e.justification)
+                        for pos, e in enumerate(chain.edges)
+                    )
+                )
+            return self.db_path
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to persist chain {chain.id}: {e}")
+
+    def load_chain(self, chain_id: UUID) -> HybridThreatChain:
+        try:
+            row = self._conn.execute(
+                "SELECT id, name, created_at, updated_at FROM chains WHERE id = ?",
+                (str(chain_id),)
+            ).fetchone()
+            if row is None:
+                raise StorageError(f"Chain {chain_id} not found.")
+            return self._assemble(row)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to read chain {chain_id}: {e}")
+        except ValidationError as e:
+            raise StorageError(f"Corrupt data for chain {chain_id}: {e}")
+
+    def _assemble(self, row: Tuple[str, str, str, str]) -> HybridThreatChain:
+        chain_id = row[0]
+        nodes = {
+            n[0]: {
+                "id": n[0], "timestamp": n[1], "domain": n[2], "signal_type": n[3],
+                "confidence": n[4], "cost_estimate": n[5], "description": n[6]
+            }
+            for n in self._conn.execute(
+                "SELECT id, timestamp, domain, signal_type, confidence, cost_estimate, description "
+                "FROM nodes WHERE chain_id = ? ORDER BY position",
+                (chain_id,)
+            )
+        }
+        edges = [
+            {
+                "source_id": e[0], "target_id": e[1], "relation_type": e[2],
+                "weight": e[3], "justification": e[4]
+            }
+            for e in self._conn.execute(
+                "SELECT source_id, target_id, relation_type, weight, justification "
+                "FROM edges WHERE chain_id = ? ORDER BY position",
+                (chain_id,)
+            )
+        ]
+        return HybridThreatChain.model_validate({
+            "id": chain_id,
+            "name": row[1],
+            "nodes": nodes,
+            "edges": edges,
+            "created_at": row[2],
+            "updated_at": row[3]
+        })
+
+    def list_chains(self) -> List[HybridThreatChain]:
+        chains = []
+        rows = self._conn.execute(
+            "SELECT id, name, created_at, updated_at FROM chains ORDER BY id"
+        ).fetchall()
+        for row in rows:
+            try:
+                chains.append(self._assemble(row))
+            except ValidationError:
+                continue # Skip malformed chains in listing
+        return chains
+
+    def list_summaries(self) -> List[ChainSummary]:
+        """
+        Registry listing computed with SQL aggregates; no chain is materialized.
+        """
+        node_stats: Dict[str, Tuple[int, float]] = {
+            r[0]: (r[1], r[2]) for r in self._conn.execute(
+                "SELECT chain_id, COUNT(*), AVG(confidence) FROM nodes GROUP BY chain_id"
+            )
+        }
+        edge_stats: Dict[str, Tuple[int, float]] = {
+            r[0]: (r[1], r[2]) for r in self._conn.execute(
+                "SELECT chain_id, COUNT(*), SUM(weight) FROM edges GROUP BY chain_id"
+            )
+        }
+        domains: Dict[str, List[ThreatDomain]] = {}
+        for chain_id, domain in self._conn.execute("SELECT DISTINCT chain_id, domain FROM nodes"):
+            domains.setdefault(chain_id, []).append(ThreatDomain(domain))
+
+        summaries = []
+        for chain_id, name, updated_at in self._conn.execute(
+            "SELECT id, name, updated_at FROM chains ORDER BY id"
+        ):
+            node_count, avg_conf = node_stats.get(chain_id, (0, 0.0))
+            edge_count, weight_sum = edge_stats.get(chain_id, (0, 0.0))
+            summaries.append(ChainSummary(
+                id=chain_id,
+                name=name,
+                node_count=node_count,
+                edge_count=edge_count,
+                domain_mix=domains.get(chain_id, []),
+                avg_confidence=avg_conf,
+                coherence_score=chain_coherence(node_count, edge_count, weight_sum),
+                updated_at=updated_at
+            ))
+        return summaries
+
+    def find_nodes(
+        self,
+        domain: Optional[ThreatDomain] = None,
+        signal_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Tuple[UUID, HybridNode]]:
+        """
+        Cross-chain signal lookup served by the column indexes.
+        Returns (chain id, node) pairs in chronological order.
+        """
+        clauses, params = [], []
+        if domain is not None:
+            clauses.append("domain = ?")
+            params.append(domain.value)
+        if signal_type is not None:
+            clauses.append("signal_type = ?")
+            params.append(signal_type)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_iso(since))
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(_iso(until))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            "SELECT chain_id, id, timestamp, domain, signal_type, confidence, cost_estimate, description "
+            f"FROM nodes {where} ORDER BY timestamp",
+            params
+        )
+        return [
+            (UUID(r[0]), HybridNode(
+                id=r[1], timestamp=r[2], domain=r[3], signal_type=r[4],
+                confidence=r[5], cost_estimate=r[6], description=r[7]
+            ))
+            for r in rows
+        ]
+
+    def import_from(self, source: NexusRepository) -> int:
+        """
+        Copies every chain from a file-based repository. Returns the count imported.
+        """
+        chains = source.list_chains()
+        for chain in chains:
+            self.save_chain(chain)
+        return len(chains)
+
+    def export_to(self, target: NexusRepository) -> int:
+        """
+        Writes every chain to a file-based repository, keeping the
+        human-readable layout available offline. Returns the count exported.
+        Chains already in the registry are replaced; their previous state
+        remains in its history.
+        """
+        chains = self.list_chains()
+        for chain in chains:
+            target.save_chain(chain, force=True)
+        return len(chains)
@@ -1,8 +1,21 @@
+import io
+import json
 import pytest
 import uuid
 from pathlib import Path
-from chimera_nexus.core.domain import HybridThreatChain, HybridNode, ThreatDomain, RelationType
-from chimera_nexus.storage.repository import NexusRepository
+from chimera_nexus.core.domain import HybridThreatChain, HybridNode, HybridEdge, ThreatDomain, RelationType
+from chimera_nexus.storage.repository import NexusRepository, StorageError
+from chimera_nexus.storage.sqlite import SQLiteNexusRepository
+from chimera_nexus.storage import loader
+from chimera_nexus.storage.history import ChainHistory
+from chimera_nexus.analysis import columnar
+from chimera_nexus.analysis.auditor import AuditFinding, AuditRule, BiasType, CognitiveAuditor, EchoChamberRule
+from chimera_nexus.analysis.audit_cache import AuditCache, audit_with_digest
+from chimera_nexus.analysis.graph import ChainGraph
+from chimera_nexus.core import instrumentation
+from chimera_nexus.core.node_store import CompactNodeStore
+from chimera_nexus.ingestion.stream import SignalIngestor, iter_records
+from chimera_nexus.reporting.engine import ReportEngine, DotOptions
 
 # --- Fixtures (Setup) ---
 
@@ -71,4 +84,1357 @@ def test_list_functionality(temp_repo, sample_chain):
     temp_repo.save_chain(sample_chain)
     chains = temp_repo.list_chains()
     assert len(chains) == 1
-    assert chains[0].id == sample_chain.id
\ No newline at end of file
+    assert chains[0].id == sample_chain.id
+
+# --- Registry Index Tests ---
+
+def test_summary_listing_matches_chain(temp_repo, sample_chain):
+    """The header index reports the same figures as the full chain."""
+    temp_repo.save_chain(sample_chain)
+    summaries = temp_repo.list_summaries()
+    assert len(summaries) == 1
+
+    summary = summaries[0]
+    assert summary.id == sample_chain.id
+    assert summary.node_count == 1
+    assert summary.domain_mix == [ThreatDomain.CYBER]
+    assert summary.calculate_iap(urgency=5.0) == sample_chain.calculate_iap(urgency=5.0)
+
+def test_summary_index_only_reparses_changed_files(temp_repo, sample_chain, monkeypatch):
+    """Unchanged files are served from the manifest without being parsed."""
+    temp_repo.save_chain(sample_chain)
+    other = HybridThreatChain(name="Second Operation")
+    temp_repo.save_chain(other)
+
+    # A fresh repository instance must rely on the persisted manifest
+    reopened = NexusRepository(data_dir=str(temp_repo.base_path))
+    parsed = []
+    original = loader.read_chain_file
+    monkeypatch.setattr(loader, "read_chain_file", lambda p, **kw: parsed.append(p) or original(p, **kw))
+
+    assert len(reopened.list_summaries()) == 2
+    assert parsed == []
+
+    # Simulate an out-of-band edit of one chain file
+    path = temp_repo._get_file_path(other.id)
+    path.write_text(path.read_text(encoding="utf-8").replace("Second Operation", "Renamed Operation"), encoding="utf-8")
+    names = {s.name for s in reopened.list_summaries()}
+    assert names == {"Test Operation", "Renamed Operation"}
+    assert parsed == [path]
+
+
+# --- Serialization Codec Tests ---
+
+@pytest.mark.parametrize("fmt", ["yaml", "json", "binary"])
+def test_codec_round_trip(tmp_path, sample_chain, fmt):
+    """Every codec must preserve the chain exactly."""
+    repo = NexusRepository(data_dir=str(tmp_path), format=fmt)
+    path = repo.save_chain(sample_chain)
+    assert path.suffix == repo.codec.extension
+
+    loaded = repo.load_chain(sample_chain.id)
+    assert loaded.model_dump() == sample_chain.model_dump()
+
+def test_migrate_converts_registry_and_detects_per_file(temp_repo, sample_chain):
+    """Migration rewrites every chain and later repositories pick up the new format."""
+    temp_repo.save_chain(sample_chain)
+    assert temp_repo.migrate("binary") == 1
+
+    files = list(temp_repo.chains_path.iterdir())
+    assert sorted(f.name[len(str(sample_chain.id)):] for f in files) == [".lock", ".nxb", ".nxb.sum"]
+
+    # A YAML-configured repository still finds the binary file by detection
+    yaml_repo = NexusRepository(data_dir=str(temp_repo.base_path), format="yaml")
+    assert yaml_repo.load_chain(sample_chain.id).name == "Test Operation"
+    assert NexusRepository(data_dir=str(temp_repo.base_path)).codec.name == "binary"
+
+def test_truncated_binary_file_is_reported(tmp_path, sample_chain):
+    repo = NexusRepository(data_dir=str(tmp_path), format="binary")
+    path = repo.save_chain(sample_chain)
+    path.write_bytes(path.read_bytes()[:-5])
+
+    with pytest.raises(StorageError, match="truncated"):
+        repo.load_chain(sample_chain.id)
+
+
+# --- SQLite Engine Tests ---
+
+@pytest.fixture
+def sqlite_repo(tmp_path):
+    db = SQLiteNexusRepository(str(tmp_path / "nexus.db"))
+    yield db
+    db.close()
+
+def test_sqlite_round_trip_and_summary(sqlite_repo, sample_chain):
+    """The SQLite engine preserves chains and reports the same summary figures."""
+    second = HybridNode(
+        domain=ThreatDomain.ECONOMIC,
+        signal_type="stock_dip",
+        confidence=0.4,
+        description="Unusual sell-off"
+    )
+    sample_chain.add_node(second)
+    first_id = next(iter(sample_chain.nodes))
+    sample_chain.add_edge(HybridEdge(
+        source_id=first_id,
+        target_id=second.id,
+        relation_type=RelationType.TRIGGERING,
+        weight=0.7,
+        justification="Breach preceded sell-off"
+    ))
+    sqlite_repo.save_chain(sample_chain)
+    sqlite_repo.save_chain(sample_chain)  # Re-saving replaces rather than duplicates
+
+    loaded = sqlite_repo.load_chain(sample_chain.id)
+    assert loaded.model_dump() == sample_chain.model_dump()
+
+    [summary] = sqlite_repo.list_summaries()
+    assert summary.node_count == 2
+    assert summary.coherence_score == sample_chain.coherence_score
+    assert summary.calculate_iap(5.0) == sample_chain.calculate_iap(5.0)
+
+    hits = sqlite_repo.find_nodes(domain=ThreatDomain.ECONOMIC)
+    assert [(c, n.id) for c, n in hits] == [(sample_chain.id, second.id)]
+
+def test_sqlite_yaml_import_export(sqlite_repo, temp_repo, sample_chain, tmp_path):
+    temp_repo.save_chain(sample_chain)
+    assert sqlite_repo.import_from(temp_repo) == 1
+
+    restored = NexusRepository(data_dir=str(tmp_path / "restored"))
+    assert sqlite_repo.export_to(restored) == 1
+    assert restored.load_chain(sample_chain.id).model_dump() == sample_chain.model_dump()
+
+
+# --- Journal Tests ---
+
+def _make_node(signal_type="ddos_probe", domain=ThreatDomain.CYBER, confidence=0.5):
+    return HybridNode(domain=domain, signal_type=signal_type, confidence=confidence, description="Journal test")
+
+def test_journal_appends_without_rewriting_snapshot(temp_repo, sample_chain):
+    snapshot = temp_repo.save_chain(sample_chain)
+    before = snapshot.read_bytes()
+
+    node = _make_node()
+    journal = temp_repo.append_mutations(sample_chain, nodes=[node])
+    first_id = next(iter(sample_chain.nodes))
+    temp_repo.append_mutations(sample_chain, edges=[HybridEdge(
+        source_id=first_id, target_id=node.id,
+        relation_type=RelationType.ENABLEMENT, justification="Access enabled probing"
+    )])
+
+    assert journal.suffix == ".journal"
+    assert snapshot.read_bytes() == before
+
+    loaded = temp_repo.load_chain(sample_chain.id)
+    assert loaded.model_dump() == sample_chain.model_dump()
+    assert temp_repo.list_summaries()[0].node_count == 2
+
+def test_journal_appends_amend_indexes_through_their_logs(temp_repo, sample_chain, monkeypatch):
+    temp_repo.save_chain(sample_chain)
+    temp_repo.list_summaries()
+    registry = (temp_repo.base_path / "registry.json").read_bytes()
+
+    for i in range(5):
+        temp_repo.append_mutations(sample_chain, nodes=[_make_node(signal_type=f"probe_{i}")])
+    assert (temp_repo.base_path / "registry.json").read_bytes() == registry
+
+    reopened = NexusRepository(data_dir=str(temp_repo.base_path))
+    parsed = []
+    original = loader.read_chain_file
+    monkeypatch.setattr(loader, "read_chain_file", lambda p, **kw: parsed.append(p) or original(p, **kw))
+    [summary] = reopened.list_summaries()
+    assert summary.node_count == 6
+    assert len(reopened.search_signals("probe", prefix=True)) == 5
+    assert parsed == []
+
+def test_append_carries_registry_digest_forward(temp_repo, sample_chain, monkeypatch):
+    from chimera_nexus.core import domain
+    for i in range(20):
+        sample_chain.add_node(_make_node(signal_type=f"bulk_{i}"))
+    temp_repo.save_chain(sample_chain)
+
+    reopened = NexusRepository(data_dir=str(temp_repo.base_path))
+    chain = reopened.load_chain(sample_chain.id)
+    hashed = []
+    original = domain._item_digest
+    monkeypatch.setattr(domain, "_item_digest", lambda tag, item: hashed.append(tag) or original(tag, item))
+    reopened.append_mutations(chain, nodes=[_make_node(signal_type="late_probe")])
+    assert hashed == [b"N"]  # Only the addition, not the 21 nodes already indexed
+
+    monkeypatch.setattr(domain, "_item_digest", original)
+    fresh = NexusRepository(data_dir=str(temp_repo.base_path))
+    [summary] = fresh.list_summaries()
+    assert summary.content_digest == fresh.load_chain(sample_chain.id).content_digest()
+
+def test_journal_compacts_past_threshold(tmp_path, sample_chain):
+    repo = NexusRepository(data_dir=str(tmp_path), journal_threshold=1)
+    snapshot = repo.save_chain(sample_chain)
+
+    result = repo.append_mutations(sample_chain, nodes=[_make_node()])
+    assert result == snapshot
+    assert not snapshot.with_suffix(".journal").exists()
+    assert len(repo.load_chain(sample_chain.id).nodes) == 2
+
+def test_journal_ignores_torn_tail_and_replays_idempotently(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    node = _make_node()
+    journal = temp_repo.append_mutations(sample_chain, nodes=[node])
+    first_id = next(iter(sample_chain.nodes))
+    temp_repo.append_mutations(sample_chain, edges=[HybridEdge(
+        source_id=first_id, target_id=node.id,
+        relation_type=RelationType.ENABLEMENT, justification="Access enabled probing"
+    )])
+    logged = journal.read_bytes()
+
+    # Crash mid-append: a partial record without its newline
+    with open(journal, "ab") as f:
+        f.write(b'{"op":"node","at"')
+    assert len(temp_repo.load_chain(sample_chain.id).nodes) == 2
+
+    # Crash after compaction but before the journal was removed
+    temp_repo.save_chain(sample_chain)
+    journal.write_bytes(logged)
+    loaded = temp_repo.load_chain(sample_chain.id)
+    assert len(loaded.nodes) == 2
+    assert len(loaded.edges) == 1
+
+
+# --- Parallel Loading Tests ---
+
+def test_parallel_loading_is_ordered_and_reports_malformed(temp_repo):
+    chains = [HybridThreatChain(name=f"Operation {i}") for i in range(6)]
+    for chain in chains:
+        temp_repo.save_chain(chain)
+    (temp_repo.chains_path / f"{uuid.uuid4()}.yaml").write_text("name: [unclosed", encoding="utf-8")
+
+    sequential_failures, parallel_failures = [], []
+    sequential = temp_repo.list_chains(workers=1, failures=sequential_failures)
+    parallel = list(temp_repo.iter_chains(workers=3, chunk_size=2, failures=parallel_failures))
+
+    expected = sorted(str(c.id) for c in chains)
+    assert [str(c.id) for c in sequential] == expected
+    assert [str(c.id) for c in parallel] == expected
+    assert len(sequential_failures) == len(parallel_failures) == 1
+    assert parallel_failures[0].path.suffix == ".yaml"
+
+
+# --- Chain Cache Tests ---
+
+def test_cache_serves_repeat_loads_and_tracks_writes(tmp_path, sample_chain):
+    repo = NexusRepository(data_dir=str(tmp_path), cache_bytes=1_000_000)
+    repo.save_chain(sample_chain)
+
+    first = repo.load_chain(sample_chain.id)
+    first.add_node(_make_node())  # Unsaved mutation must not leak into the cache
+    second = repo.load_chain(sample_chain.id)
+    assert len(second.nodes) == 1
+    assert repo.cache_stats().hits == 2
+
+    repo.append_mutations(second, nodes=[_make_node()])
+    assert len(repo.load_chain(sample_chain.id).nodes) == 2
+    assert repo.cache_stats().misses == 0
+
+def test_cache_detects_external_edits_and_evicts_by_budget(tmp_path):
+    chains = [HybridThreatChain(name=f"Operation {i}") for i in range(3)]
+    for chain in chains:
+        chain.add_node(_make_node())
+
+    repo = NexusRepository(data_dir=str(tmp_path), cache_bytes=6_000)
+    for chain in chains:
+        repo.save_chain(chain)
+    stats = repo.cache_stats()
+    assert stats.current_bytes <= stats.max_bytes
+    assert stats.evictions >= 1
+
+    # Another process rewrites a chain behind the cache's back
+    other = NexusRepository(data_dir=str(tmp_path))
+    renamed = chains[-1].model_copy(update={"name": "Renamed Operation"})
+    other.save_chain(renamed)
+    assert repo.load_chain(chains[-1].id).name == "Renamed Operation"
+
+
+# --- Adjacency Index Tests ---
+
+def test_adjacency_queries_and_duplicate_rejection(temp_repo):
+    chain = HybridThreatChain(name="Adjacency Test")
+    a, b, c = _make_node("alpha"), _make_node("bravo"), _make_node("charlie")
+    for node in (a, b, c):
+        chain.add_node(node)
+    chain.add_edge(HybridEdge(source_id=a.id, target_id=b.id, relation_type=RelationType.TRIGGERING, justification="a->b"))
+    chain.add_edge(HybridEdge(source_id=a.id, target_id=c.id, relation_type=RelationType.MASKING, justification="a->c"))
+
+    assert chain.successors(a.id) == [b.id, c.id]
+    assert chain.predecessors(c.id) == [a.id]
+    assert chain.has_edge(a.id, b.id, RelationType.TRIGGERING)
+    assert not chain.has_edge(a.id, b.id, RelationType.MASKING)
+    assert not chain.has_edge(b.id, a.id)
+
+    duplicate = HybridEdge(source_id=a.id, target_id=b.id, relation_type=RelationType.TRIGGERING, justification="again")
+    with pytest.raises(ValueError, match="already exists"):
+        chain.add_edge(duplicate, reject_duplicates=True)
+
+    # Indexes are rebuilt on load and independent between copies
+    temp_repo.save_chain(chain)
+    loaded = temp_repo.load_chain(chain.id)
+    assert loaded.successors(a.id) == [b.id, c.id]
+    copy = loaded.detached_copy()
+    copy.add_edge(HybridEdge(source_id=b.id, target_id=c.id, relation_type=RelationType.ENABLEMENT, justification="b->c"))
+    assert loaded.successors(b.id) == []
+    assert copy.successors(b.id) == [c.id]
+
+
+# --- Incremental Metrics Tests ---
+
+def test_incremental_metrics_match_full_recompute(temp_repo):
+    chain = HybridThreatChain(name="Metrics Test")
+    nodes = [
+        _make_node("alpha", ThreatDomain.CYBER, 0.3),
+        _make_node("bravo", ThreatDomain.SOCIAL, 0.9),
+        _make_node("charlie", ThreatDomain.CYBER, 0.6),
+    ]
+    for node in nodes:
+        chain.add_node(node)
+    chain.add_edge(HybridEdge(source_id=nodes[0].id, target_id=nodes[1].id,
+                              relation_type=RelationType.AMPLIFICATION, weight=0.5, justification="a->b"))
+
+    # Re-adding a node id replaces it; aggregates must follow
+    replacement = nodes[2].model_copy(update={"domain": ThreatDomain.ECONOMIC, "confidence": 0.1})
+    chain.add_node(replacement)
+
+    chain.verify_metrics()
+    assert chain.domain_counts == {ThreatDomain.CYBER: 1, ThreatDomain.SOCIAL: 1, ThreatDomain.ECONOMIC: 1}
+    assert chain.calculate_iap(urgency=5.0) == round(5.0 / ((0.3 + 0.9 + 0.1) / 3), 2)
+    assert chain.coherence_score == round(0.5 * (1 / 2), 2)
+
+    temp_repo.save_chain(chain)
+    loaded = temp_repo.load_chain(chain.id)
+    loaded.verify_metrics()
+    assert loaded.coherence_score == chain.coherence_score
+    assert loaded.calculate_iap(urgency=5.0) == chain.calculate_iap(urgency=5.0)
+
+def test_metric_drift_is_detected(sample_chain):
+    sample_chain.nodes[next(iter(sample_chain.nodes))] = _make_node(confidence=0.1)  # Bypasses add_node
+    with pytest.raises(ValueError, match="drifted"):
+        sample_chain.verify_metrics()
+
+
+# --- Columnar Analytics Tests ---
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_registry_snapshot_matches_per_chain_metrics(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "np", None)
+
+    chains = [HybridThreatChain(name="Empty Operation")]
+    for i in range(3):
+        chain = HybridThreatChain(name=f"Operation {i}")
+        nodes = [_make_node(f"sig_{j}", list(ThreatDomain)[j % 3], 0.1 + 0.2 * j) for j in range(i + 2)]
+        for node in nodes:
+            chain.add_node(node)
+        for src, dst in zip(nodes, nodes[1:]):
+            chain.add_edge(HybridEdge(source_id=src.id, target_id=dst.id,
+                                      relation_type=RelationType.ENABLEMENT, weight=0.4, justification="seq"))
+        chains.append(chain)
+
+    snapshot = columnar.RegistrySnapshot.from_chains(chains)
+    grid = snapshot.iap_grid([2.0, 8.0])
+    coherence = snapshot.coherence()
+    for row, chain in enumerate(chains):
+        assert [round(v, 2) for v in grid[row]] == [chain.calculate_iap(2.0), chain.calculate_iap(8.0)]
+        assert round(coherence[row], 2) == chain.coherence_score
+
+    cyber = next(d for d in snapshot.domain_distributions() if d.domain == ThreatDomain.CYBER)
+    cyber_conf = [n.confidence for c in chains for n in c.nodes.values() if n.domain == ThreatDomain.CYBER]
+    assert cyber.count == len(cyber_conf) == sum(cyber.histogram)
+    assert cyber.mean_confidence == pytest.approx(sum(cyber_conf) / len(cyber_conf))
+    assert cyber.max_confidence == max(cyber_conf)
+
+
+def test_snapshot_columns_come_from_payloads_without_models(temp_repo, sample_chain, monkeypatch):
+    other = HybridThreatChain(name="Second Operation")
+    temp_repo.save_chain(sample_chain)
+    temp_repo.save_chain(other)
+    node = _make_node(signal_type="journaled_probe", domain=ThreatDomain.SOCIAL, confidence=0.3)
+    temp_repo.append_mutations(sample_chain, nodes=[node], edges=[HybridEdge(
+        source_id=next(iter(sample_chain.nodes)), target_id=node.id,
+        relation_type=RelationType.TRIGGERING, weight=0.6, justification="Journaled"
+    )])
+    expected = columnar.RegistrySnapshot.from_chains(temp_repo.list_chains())
+
+    def no_models(*args, **kwargs):
+        raise AssertionError("chain models were built")
+    monkeypatch.setattr(loader, "read_chain_file", no_models)
+    monkeypatch.setattr(loader, "construct_chain", no_models)
+    results = list(temp_repo.map_chains(columnar.chain_columns, payload=True))
+    assert [error for _, _, error in results] == [None, None]
+    snapshot = columnar.RegistrySnapshot.from_columns(columns for _, columns, _ in results)
+
+    assert snapshot.chain_ids == expected.chain_ids and snapshot.chain_names == expected.chain_names
+    assert snapshot.iap_grid([5.0]) == expected.iap_grid([5.0])
+    assert snapshot.coherence() == expected.coherence()
+    assert snapshot.domain_distributions() == expected.domain_distributions()
+
+# --- Bulk Ingestion Tests ---
+
+def test_ingest_ndjson_batches_and_reports_rejects(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    first_id = next(iter(sample_chain.nodes))
+    node_id = uuid.uuid4()
+    lines = [
+        json.dumps({"id": str(node_id), "domain": "social", "signal_type": "protest", "confidence": 0.4, "description": "Crowd forming"}),
+        "{not json",
+        json.dumps({"domain": "cyber", "signal_type": "x", "confidence": 0.4, "description": "Too short type"}),
+        "",
+        json.dumps({"kind": "edge", "source_id": str(first_id), "target_id": str(node_id),
+                    "relation_type": "triggering", "justification": "Breach news spread"}),
+        json.dumps({"source_id": str(uuid.uuid4()), "target_id": str(node_id),
+                    "relation_type": "masking", "justification": "Dangling"}),
+        json.dumps({"domain": "economic", "signal_type": "bank_run", "confidence": 0.7, "description": "Withdrawals"}),
+    ]
+    ingestor = SignalIngestor(temp_repo, batch_size=2)
+    report = ingestor.ingest(sample_chain, iter_records(io.StringIO("\n".join(lines)), "ndjson"))
+
+    assert (report.nodes_added, report.edges_added) == (2, 1)
+    assert [r.line for r in report.rejects] == [2, 3, 6]
+    loaded = temp_repo.load_chain(sample_chain.id)
+    assert len(loaded.nodes) == 3
+    assert loaded.has_edge(first_id, node_id, RelationType.TRIGGERING)
+
+def test_ingest_csv_uses_defaults_for_empty_cells(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    csv_text = (
+        "kind,domain,signal_type,confidence,cost_estimate,description\n"
+        "node,information,leak,0.5,,Documents posted\n"
+        "node,unknown_domain,leak,0.5,,Bad domain\n"
+    )
+    report = SignalIngestor(temp_repo).ingest(sample_chain, iter_records(io.StringIO(csv_text), "csv"))
+    assert report.nodes_added == 1
+    assert [r.line for r in report.rejects] == [3]
+    assert len(temp_repo.load_chain(sample_chain.id).nodes) == 2
+
+
+# --- Audit Cache Tests ---
+
+def test_content_digest_is_incremental_and_ignores_metadata(sample_chain):
+    digest = sample_chain.content_digest()
+    sample_chain.name = "Renamed Operation"
+    assert sample_chain.content_digest() == digest
+
+    sample_chain.add_node(_make_node())
+    incremental = sample_chain.content_digest()
+    assert incremental != digest
+    assert HybridThreatChain.model_validate(sample_chain.model_dump()).content_digest() == incremental
+
+def test_audit_cache_reuses_findings_until_content_or_rules_change(temp_repo, tmp_path, monkeypatch):
+    chain = HybridThreatChain(name="Cache Test")
+    for i in range(4):
+        chain.add_node(_make_node(f"signal_{i}"))
+    temp_repo.save_chain(chain)
+
+    calls = []
+    original = CognitiveAuditor.audit
+    monkeypatch.setattr(CognitiveAuditor, "audit", lambda self, c: calls.append(c.id) or original(self, c))
+
+    cache = AuditCache(tmp_path / "audit_cache")
+    first = cache.audit(chain)
+    assert first and cache.audit(temp_repo.load_chain(chain.id)) == first
+    assert len(calls) == 1
+
+    chain.add_node(_make_node("signal_new", ThreatDomain.SOCIAL))
+    cache.audit(chain)
+    assert len(calls) == 2
+
+    bumped = AuditCache(tmp_path / "audit_cache", ruleset_version="next")
+    assert bumped.get(chain.id, chain.content_digest()) is None
+
+def test_map_chains_runs_in_workers(temp_repo):
+    chains = [HybridThreatChain(name=f"Operation {i}") for i in range(3)]
+    for chain in chains:
+        chain.add_node(_make_node())
+        temp_repo.save_chain(chain)
+
+    wanted = [chains[2].id, chains[0].id]
+    results = list(temp_repo.map_chains(audit_with_digest, wanted, workers=2))
+    assert {r[0].stem for r in results} == {str(c) for c in wanted}
+    for path, (digest, findings), error in results:
+        assert error is None
+        assert digest == temp_repo.load_chain(uuid.UUID(path.stem)).content_digest()
+
+
+# --- Audit Rule Engine Tests ---
+
+def _chain_with(domains, confidence=0.5, edges=0, cost=0.0):
+    chain = HybridThreatChain(name="Rule Test")
+    nodes = []
+    for i, domain in enumerate(domains):
+        node = HybridNode(domain=domain, signal_type=f"signal_{i}", confidence=confidence,
+                          cost_estimate=cost, description="Rule engine test")
+        chain.add_node(node)
+        nodes.append(node)
+    for src, dst in list(zip(nodes, nodes[1:]))[:edges]:
+        chain.add_edge(HybridEdge(source_id=src.id, target_id=dst.id,
+                                  relation_type=RelationType.CORRELATION, justification="seq"))
+    return chain
+
+def test_default_rules_keep_existing_findings():
+    auditor = CognitiveAuditor()
+
+    skewed = auditor.audit(_chain_with([ThreatDomain.CYBER] * 5, edges=4))
+    assert [f.bias_type for f in skewed] == [BiasType.MONO_DOMAIN_FIXATION]
+    assert skewed[0].severity == pytest.approx(0.8)
+    assert "100%" in skewed[0].description and "CYBER" in skewed[0].description
+
+    sparse = auditor.audit(_chain_with([ThreatDomain.CYBER, ThreatDomain.SOCIAL, ThreatDomain.ECONOMIC], confidence=0.9))
+    assert [f.bias_type for f in sparse] == [BiasType.PREMATURE_CLOSURE, BiasType.DISCONNECTED_NARRATIVE]
+
+    assert auditor.audit(HybridThreatChain(name="Empty Chain")) == []
+    assert set(auditor.timings) == {"statistics", "mono_domain_fixation", "premature_closure", "disconnected_narrative"}
+    assert auditor.timings["statistics"].calls == 3
+
+def test_custom_rules_can_be_registered():
+    class LargeChainRule(AuditRule):
+        name = "large_chain"
+
+        def evaluate(self, stats, chain):
+            if stats.node_count > 4:
+                return AuditFinding(bias_type=BiasType.PREMATURE_CLOSURE, severity=0.1,
+                                    description="Large", remediation_hint="None")
+            return None
+
+    auditor = CognitiveAuditor()
+    baseline_version = auditor.ruleset_version
+    auditor.register(LargeChainRule())
+    auditor.register(EchoChamberRule())
+    assert auditor.ruleset_version != baseline_version
+    with pytest.raises(ValueError, match="already registered"):
+        auditor.register(EchoChamberRule())
+
+    domains = [ThreatDomain.CYBER, ThreatDomain.SOCIAL, ThreatDomain.ECONOMIC, ThreatDomain.POLITICAL, ThreatDomain.INFORMATION]
+    findings = auditor.audit(_chain_with(domains, confidence=0.9, edges=4, cost=0.1))
+    assert [f.bias_type for f in findings] == [BiasType.PREMATURE_CLOSURE, BiasType.ECHO_CHAMBER]
+
+    # Costly corroboration clears the echo chamber finding
+    assert [f.bias_type for f in auditor.audit(_chain_with(domains, confidence=0.9, edges=4, cost=0.9))] == [BiasType.PREMATURE_CLOSURE]
+
+# --- Graph Analytics Tests ---
+
+def _graph(node_count, links):
+    ids = [uuid.uuid4() for _ in range(node_count)]
+    return ids, ChainGraph(ids, [s for s, _, _ in links], [t for _, t, _ in links], [w for _, _, w in links])
+
+def test_graph_components_cycles_and_reachability():
+    # 0 -> 1 -> 2 -> 0 loop feeding 3, plus a separate pair 4 -> 5 and an isolated 6
+    ids, graph = _graph(7, [(0, 1, 0.5), (1, 2, 0.5), (2, 0, 0.5), (2, 3, 0.5), (4, 5, 0.5)])
+
+    assert graph.weak_component_count() == 3
+    assert [len(c) for c in graph.weak_components()] == [4, 2, 1]
+    assert sorted(map(len, graph.strong_components()), reverse=True) == [3, 1, 1, 1, 1]
+    assert [set(loop) for loop in graph.feedback_loops()] == [{ids[0], ids[1], ids[2]}]
+    assert graph.has_cycle()
+
+    assert set(graph.reachable_from(ids[1])) == {ids[2], ids[0], ids[3]}
+    assert graph.reachable_from(ids[5], reverse=True) == [ids[4]]
+    assert graph.reachable_from(ids[6]) == []
+
+def test_longest_causal_path_skips_feedback_loops():
+    ids, graph = _graph(5, [(0, 1, 0.9), (1, 2, 0.9), (0, 3, 0.2), (3, 2, 0.2), (2, 4, 0.5), (4, 2, 0.5)])
+    path = graph.longest_causal_path()
+    assert path.nodes == [ids[0], ids[1], ids[2]]
+    assert path.total_weight == pytest.approx(1.8)
+    assert not _graph(3, [(0, 1, 0.5)])[1].has_cycle()
+    assert _graph(3, [])[1].longest_causal_path() is None
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pagerank_favours_link_targets(monkeypatch, use_numpy):
+    from chimera_nexus.analysis import graph as graph_module
+    if use_numpy and graph_module.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(graph_module, "np", None)
+
+    ids, graph = _graph(4, [(0, 3, 1.0), (1, 3, 1.0), (2, 3, 0.5), (3, 0, 0.1)])
+    ranks = graph.pagerank()
+    assert sum(ranks.values()) == pytest.approx(1.0)
+    assert max(ranks, key=ranks.get) == ids[3]
+    assert graph.degree_centrality()[ids[3]] == pytest.approx(4 / 3)
+
+def test_fragmented_chain_is_reported_despite_edge_count():
+    chain = _chain_with([ThreatDomain.CYBER, ThreatDomain.SOCIAL, ThreatDomain.ECONOMIC, ThreatDomain.POLITICAL], edges=2)
+    findings = CognitiveAuditor().audit(chain)
+    assert [f.bias_type for f in findings] == [BiasType.DISCONNECTED_NARRATIVE]
+    assert "2 disconnected fragments" in findings[0].description
+
+def test_graph_tolerates_dangling_edges_and_counts_each_loop_once():
+    # Self-loop on 0 inside the 0 -> 1 -> 0 cycle, plus a lone self-loop on 2
+    ids, graph = _graph(3, [(0, 0, 0.5), (0, 1, 0.5), (1, 0, 0.5), (2, 2, 0.5)])
+    assert sorted(map(set, graph.feedback_loops()), key=len) == [{ids[2]}, {ids[0], ids[1]}]
+
+    # Unvalidated files can carry edges to signals that are not in the chain
+    chain = _chain_with([ThreatDomain.CYBER, ThreatDomain.SOCIAL, ThreatDomain.ECONOMIC, ThreatDomain.POLITICAL], edges=3)
+    source = next(iter(chain.nodes))
+    chain.edges.append(HybridEdge(source_id=source, target_id=uuid.uuid4(),
+                                  relation_type=RelationType.CORRELATION, justification="dangling"))
+    assert ChainGraph.from_chain(chain).edge_count == 3
+    assert CognitiveAuditor().audit(chain) == []
+
+# --- Streaming Report Tests ---
+
+def test_streamed_reports_match_generated_strings(sample_chain):
+    from datetime import datetime
+    sample_chain.add_node(_make_node("botnet_recruitment", confidence=0.95))
+    nodes = list(sample_chain.nodes.values())
+    sample_chain.add_edge(HybridEdge(source_id=nodes[0].id, target_id=nodes[1].id,
+                                     relation_type=RelationType.CORRELATION, weight=0.9, justification="test"))
+    findings = CognitiveAuditor().audit(sample_chain)
+    engine = ReportEngine()
+    stamp = datetime(2024, 1, 1, 12, 0)
+
+    dot = io.StringIO()
+    engine.write_graphviz_dot(sample_chain, dot)
+    assert dot.getvalue() == engine.generate_graphviz_dot(sample_chain)
+    assert dot.getvalue().startswith("digraph HybridThreatChain {\n") and dot.getvalue().endswith("\n}")
+
+    md = io.StringIO()
+    engine.write_markdown_report(sample_chain, findings, md, generated_at=stamp)
+    assert md.getvalue() == engine.generate_markdown_report(sample_chain, findings, generated_at=stamp)
+    assert "**Date:** 2024-01-01 12:00:00" in md.getvalue()
+    assert md.getvalue().endswith("*Generated by CHIMERA Nexus Protocol*")
+
+def test_dot_options_cluster_aggregate_and_prune():
+    chain = _chain_with([ThreatDomain.CYBER, ThreatDomain.CYBER, ThreatDomain.SOCIAL], edges=2)
+    nodes = list(chain.nodes.values())
+    nodes[2] = nodes[2].model_copy(update={"confidence": 0.1})
+    chain.add_node(nodes[2])
+    for weight in (0.4, 0.5):
+        chain.add_edge(HybridEdge(source_id=nodes[0].id, target_id=nodes[1].id,
+                                  relation_type=RelationType.CORRELATION, weight=weight, justification="dup"))
+    engine = ReportEngine()
+
+    assert engine.generate_graphviz_dot(chain, DotOptions()) == engine.generate_graphviz_dot(chain)
+
+    clustered = engine.generate_graphviz_dot(chain, DotOptions(cluster_domains=True, aggregate_edges=True))
+    assert clustered.count("subgraph cluster_") == 2 and "subgraph cluster_cyber {" in clustered
+    assert clustered.count(f'"{nodes[0].id}" -> "{nodes[1].id}"') == 1
+    assert "(x3, sum 1.90)" in clustered
+
+    pruned = engine.generate_graphviz_dot(chain, DotOptions(min_confidence=0.3, min_weight=0.45))
+    assert str(nodes[2].id) not in pruned
+    assert pruned.count(" -> ") == 2
+    assert "Showing 2 of 3 signals and 2 of 4 links" in pruned
+
+    top = engine.generate_graphviz_dot(chain, DotOptions(top_k=1))
+    assert top.count("[label=<") == 1
+
+# --- CLI Startup Tests ---
+
+def test_cli_import_defers_heavy_modules():
+    import subprocess, sys
+    probe = (
+        "import sys, chimera_nexus.cli.main; "
+        "print(sorted(m for m in ('pydantic', 'rich.console', 'chimera_nexus.storage', 'chimera_nexus.core.domain') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+def test_cli_repository_honours_data_dir(tmp_path, monkeypatch, sample_chain):
+    from typer.testing import CliRunner
+    from chimera_nexus.cli import main as cli
+
+    NexusRepository(data_dir=str(tmp_path / "a")).save_chain(sample_chain)
+    runner = CliRunner()
+    monkeypatch.setenv(cli.DATA_DIR_ENV, str(tmp_path / "b"))
+    assert "No active chains" in runner.invoke(cli.app, ["list"]).output
+    assert str(tmp_path / "b") in str(cli.get_repo().base_path)
+
+    result = runner.invoke(cli.app, ["--data-dir", str(tmp_path / "a"), "list"])
+    assert sample_chain.name in result.output
+
+# --- Instrumentation Tests ---
+
+def test_spans_record_nested_phases_only_when_enabled(temp_repo, sample_chain, tmp_path):
+    temp_repo.save_chain(sample_chain)
+    assert instrumentation.records() == []
+
+    instrumentation.enable()
+    try:
+        chain = temp_repo.load_chain(sample_chain.id)
+        CognitiveAuditor().audit(chain)
+    finally:
+        instrumentation.disable()
+
+    spans = {r.name: r for r in instrumentation.records()}
+    assert {"repository.load_chain", "file.read", "codec.yaml.decode", "model.construct", "audit", "audit.statistics"} <= set(spans)
+    load = spans["repository.load_chain"]
+    assert load.depth == 0 and spans["model.construct"].depth == 1
+    assert load.self_seconds <= load.duration
+    assert spans["file.read"].attrs["bytes"] > 0
+
+    phases = {p.name: p for p in instrumentation.summarize()}
+    assert phases["audit.rule.mono_domain_fixation"].calls == 1
+
+    out = tmp_path / "spans.jsonl"
+    assert instrumentation.write_jsonl(str(out)) == len(spans)
+    assert json.loads(out.read_text().splitlines()[0])["name"] == "file.read"
+
+    # Disabled again: nothing new is recorded
+    instrumentation.reset()
+    temp_repo.load_chain(sample_chain.id)
+    assert instrumentation.records() == []
+
+# --- Benchmark Script Tests ---
+
+@pytest.fixture
+def bench(monkeypatch):
+    """
+    Imports a module from benchmarks/, which run as scripts rather than a package.
+    """
+    import importlib
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "benchmarks"))
+    return importlib.import_module
+
+def test_synthetic_chains_are_seeded_and_density_sets_links(bench):
+    synthetic = bench("synthetic")
+
+    def shape(chain):
+        index = {node_id: i for i, node_id in enumerate(chain.nodes)}
+        nodes = [(n.domain, n.signal_type, n.confidence) for n in chain.nodes.values()]
+        return nodes, sorted((index[e.source_id], index[e.target_id], e.relation_type) for e in chain.edges)
+
+    assert shape(synthetic.generate_chain(200, seed=5)) == shape(synthetic.generate_chain(200, seed=5))
+    assert shape(synthetic.generate_chain(200, seed=5)) != shape(synthetic.generate_chain(200, seed=6))
+    assert len(synthetic.generate_chain(200, edge_density=0.0).edges) == 0
+    assert len(synthetic.generate_chain(200, edge_density=1.0).edges) == 199
+    dense = synthetic.generate_chain(200, edge_density=2.0)
+    assert 199 < len(dense.edges) <= 400
+    _, edges = shape(dense)
+    assert all(source < target for source, target, _ in edges)
+
+    weighted = synthetic.generate_chain(100, domain_weights={ThreatDomain.CYBER: 1.0})
+    assert {n.domain for n in weighted.nodes.values()} == {ThreatDomain.CYBER}
+
+def test_run_suite_scale_reports_every_operation(bench):
+    run_suite = bench("run_suite")
+    emitted = {}
+    run_suite.run_scale(50, None, 1.0, 7, 2, lambda name, entry: emitted.update({name: entry}))
+
+    assert set(emitted) == set(run_suite.OPERATIONS) | {"_chain"}
+    assert emitted["_chain"] == {"nodes": 50, "edges": 49}
+    assert all(emitted[name]["seconds"] >= 0 for name in run_suite.OPERATIONS)
+
+def test_run_suite_flags_regressions_and_tolerates_missing_rss(bench, monkeypatch, capsys):
+    run_suite = bench("run_suite")
+    monkeypatch.setattr(run_suite, "resource", None)
+    assert run_suite.peak_rss_mib() is None
+
+    def result(seconds):
+        return {"seconds": seconds, "peak_rss_mib": run_suite.peak_rss_mib()}
+    suite = {"max_regression": 0.25, "results": {"100": {
+        "_chain": {"nodes": 100, "edges": 99},
+        "save_chain": result(0.1), "audit": result(0.02), "dot": result(0.004)
+    }}}
+    baseline = {"results": {"100": {"save_chain": result(0.05), "audit": result(0.019), "dot": result(0.001)}}}
+
+    # The 4x slower "dot" is under the noise floor
+    assert run_suite.print_results(suite, baseline) == [("100", "save_chain", 2.0)]
+    out = capsys.readouterr().out
+    assert "REGRESSION" in out and "n/a" in out
+    assert run_suite.parse_scales("100,1e4") == [100, 10_000]
+
+def test_synthetic_compact_chain_matches_dict_layout(bench):
+    synthetic = bench("synthetic")
+    compact = synthetic.generate_chain(300, seed=3, edge_density=1.5, compact=True)
+    plain = synthetic.generate_chain(300, seed=3, edge_density=1.5)
+
+    assert compact.is_compact and not plain.is_compact
+    assert [(n.domain, n.signal_type, n.confidence) for n in compact.nodes.values()] == \
+        [(n.domain, n.signal_type, n.confidence) for n in plain.nodes.values()]
+    assert len(compact.edges) == len(plain.edges)
+
+def test_bench_memory_measures_both_layouts(bench):
+    bench_memory = bench("bench_memory")
+    if not bench_memory.STATM_PATH.exists():
+        pytest.skip("RSS is read from /proc")
+    results = [bench_memory.measure(200, 0.0, compact) for compact in (False, True)]
+
+    assert [r["layout"] for r in results] == ["dict", "compact"]
+    assert all(r["nodes"] == 200 and r["edges"] == 0 for r in results)
+    assert results[0]["json_bytes"] == results[1]["json_bytes"]
+    assert bench_memory.current_rss_mib() > 0
+
+def test_bench_memory_fails_clearly_off_linux(bench, monkeypatch, tmp_path, capsys):
+    import sys
+    bench_memory = bench("bench_memory")
+    monkeypatch.setattr(bench_memory, "STATM_PATH", tmp_path / "statm")
+
+    with pytest.raises(RuntimeError, match="needs Linux"):
+        bench_memory.current_rss_mib()
+    monkeypatch.setattr(sys, "argv", ["bench_memory.py", "--nodes", "10"])
+    with pytest.raises(SystemExit):
+        bench_memory.main()
+    assert "only runs on Linux" in capsys.readouterr().err
+
+# --- Compact Node Store Tests ---
+
+def _mixed_chain():
+    chain = HybridThreatChain(name="Compact Parity")
+    for i, domain in enumerate([ThreatDomain.SOCIAL, ThreatDomain.CYBER, ThreatDomain.SOCIAL, ThreatDomain.ECONOMIC]):
+        chain.add_node(HybridNode(
+            domain=domain, signal_type="shared_type", confidence=0.1 * (i + 2),
+            cost_estimate=0.5 * i, description=f"Observation {i}"
+        ))
+    ids = list(chain.nodes)
+    for source, target in zip(ids, ids[1:]):
+        chain.add_edge(HybridEdge(source_id=source, target_id=target, relation_type=RelationType.ENABLEMENT, justification="seq"))
+    return chain
+
+def test_compact_nodes_keep_api_metrics_and_serialization():
+    chain = _mixed_chain()
+    compact = chain.detached_copy()
+    compact.use_compact_nodes()
+
+    assert isinstance(compact.nodes, CompactNodeStore) and compact.is_compact
+    assert compact.model_dump() == chain.model_dump()
+    assert compact.model_dump_json() == chain.model_dump_json()
+    assert compact.content_digest() == chain.content_digest()
+    assert compact.domain_counts == chain.domain_counts
+    assert compact.average_confidence == pytest.approx(chain.average_confidence)
+    compact.verify_metrics()
+
+    node_id = list(chain.nodes)[1]
+    assert compact.nodes[node_id] == chain.nodes[node_id]
+    assert list(compact.nodes) == list(chain.nodes)
+
+    # Replacing a node overwrites its row; deleting skips it everywhere
+    updated = chain.nodes[node_id].model_copy(update={"confidence": 0.95})
+    compact.add_node(updated)
+    assert compact.nodes[node_id].confidence == 0.95 and len(compact.nodes) == 4
+    compact.verify_metrics()
+    del compact.nodes[node_id]
+    assert node_id not in compact.nodes and len(compact.model_dump()["nodes"]) == 3
+    with pytest.raises(ValueError):
+        compact.nodes[uuid.uuid4()] = updated
+
+    # Strings are interned: one entry for the shared signal type
+    assert len(compact.nodes._strings) == 1 + 4
+
+def test_compact_chains_work_with_analytics_and_exports():
+    chain = _mixed_chain()
+    compact = chain.detached_copy()
+    compact.use_compact_nodes()
+
+    values = compact.nodes.values()
+    assert len(values) == 4 and list(values) == list(values) == list(chain.nodes.values())
+    assert len(compact.nodes.items()) == 4 and dict(compact.nodes.items()) == dict(chain.nodes.items())
+
+    snapshot = columnar.RegistrySnapshot.from_chains([compact])
+    assert snapshot.iap_grid([5.0]) == columnar.RegistrySnapshot.from_chains([chain]).iap_grid([5.0])
+    assert CognitiveAuditor().audit(compact) == CognitiveAuditor().audit(chain)
+    engine = ReportEngine()
+    assert engine.generate_graphviz_dot(compact) == engine.generate_graphviz_dot(chain)
+
+def test_compact_store_preserves_aware_timestamps():
+    from datetime import datetime, timedelta, timezone
+    chain = HybridThreatChain(name="Timezones")
+    for tz in (timezone.utc, timezone(timedelta(hours=2))):
+        chain.add_node(HybridNode(
+            domain=ThreatDomain.CYBER, signal_type="breach", confidence=0.5,
+            description="tz", timestamp=datetime(2024, 3, 1, 12, 30, tzinfo=tz)
+        ))
+    compact = chain.detached_copy()
+    compact.use_compact_nodes()
+    assert compact.model_dump_json() == chain.model_dump_json()
+    assert [n.timestamp for n in compact.nodes.values()] == [n.timestamp for n in chain.nodes.values()]
+
+def _is_compact(chain):
+    return chain.is_compact
+
+def test_repository_loads_compact_chains(tmp_path):
+    chain = _mixed_chain()
+    NexusRepository(data_dir=str(tmp_path)).save_chain(chain)
+    repo = NexusRepository(data_dir=str(tmp_path), compact_nodes=True)
+
+    extra = HybridNode(domain=ThreatDomain.POLITICAL, signal_type="statement", confidence=0.3, description="Journaled")
+    repo.append_mutations(repo.load_chain(chain.id), nodes=[extra])
+
+    loaded = repo.load_chain(chain.id)
+    assert loaded.is_compact and len(loaded.nodes) == 5
+    assert loaded.nodes[extra.id] == extra
+    chain.add_node(extra)
+    assert loaded.model_dump()["nodes"] == chain.model_dump()["nodes"]
+
+    # Registry-wide loads honour the setting too
+    assert [c.is_compact for c in repo.list_chains()] == [True]
+    assert [compact for _, compact, _ in repo.map_chains(_is_compact)] == [True]
+    assert [c.is_compact for c in NexusRepository(data_dir=str(tmp_path)).list_chains()] == [False]
+
+# --- Trusted Load Tests ---
+
+def test_sealed_snapshots_load_without_validation(temp_repo, monkeypatch):
+    chain = _mixed_chain()
+    path = temp_repo.save_chain(chain)
+    assert (path.parent / (path.name + ".sum")).exists()
+
+    validated = []
+    original = HybridThreatChain.model_validate
+    monkeypatch.setattr(HybridThreatChain, "model_validate", lambda data: validated.append(1) or original(data))
+
+    loaded = temp_repo.load_chain(chain.id)
+    assert validated == []
+    assert loaded.model_dump() == chain.model_dump()
+    assert loaded.coherence_score == chain.coherence_score and loaded.domain_counts == chain.domain_counts
+    loaded.verify_metrics()
+
+    # On request, or once the bytes no longer match, full validation runs
+    temp_repo.load_chain(chain.id, validate=True)
+    assert validated == [1]
+    path.write_text(path.read_text(encoding="utf-8").replace("Observation 0", "Edited 0"), encoding="utf-8")
+    assert "Edited 0" in {n.description for n in temp_repo.load_chain(chain.id).nodes.values()}
+    assert validated == [1, 1]
+
+def test_edited_snapshot_cannot_bypass_validation(temp_repo, sample_chain):
+    path = temp_repo.save_chain(sample_chain)
+    path.write_text(path.read_text(encoding="utf-8").replace("confidence: 0.9", "confidence: 9.0"), encoding="utf-8")
+    with pytest.raises(StorageError, match="Corrupt data"):
+        temp_repo.load_chain(sample_chain.id)
+
+def test_verify_reports_and_reseals(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    broken = HybridThreatChain(name="Broken Operation")
+    broken_path = temp_repo.save_chain(broken)
+    assert [(r.checksum, r.ok) for r in temp_repo.verify()] == [("valid", True)] * 2
+
+    # A valid hand edit is resealed; an invalid one is reported
+    path = temp_repo._get_file_path(sample_chain.id)
+    path.write_text(path.read_text(encoding="utf-8").replace("Test Operation", "Edited Operation"), encoding="utf-8")
+    broken_path.write_text("name: X\n", encoding="utf-8")
+    results = {r.path: r for r in temp_repo.verify(reseal=True)}
+    assert results[path].ok and results[path].checksum == "mismatch" and results[path].resealed
+    assert not results[broken_path].ok and not results[broken_path].resealed
+    assert {r.path: r.checksum for r in temp_repo.verify()}[path] == "valid"
+
+
+# --- Signal Search Tests ---
+
+def test_search_finds_terms_prefixes_and_domains(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    other = HybridThreatChain(name="Bank Run")
+    other.add_node(HybridNode(domain=ThreatDomain.ECONOMIC, signal_type="bank_run", confidence=0.4, description="Queues outside a banking branch"))
+    temp_repo.save_chain(other)
+    probe = _make_node(confidence=0.8)
+    temp_repo.append_mutations(other, nodes=[probe])
+
+    hits = temp_repo.search_signals("ddos_probe")
+    assert [(h.chain_id, h.node_id) for h in hits] == [(other.id, probe.id)]
+    assert temp_repo.search_signals("branc") == []
+    branch = temp_repo.search_signals("branc", prefix=True)
+    assert [h.signal_type for h in branch] == ["bank_run"]
+    ranked = temp_repo.search_signals("", domains=[ThreatDomain.CYBER, ThreatDomain.ECONOMIC])
+    assert [h.confidence for h in ranked] == [0.9, 0.8, 0.4]
+    assert [h.chain_id for h in temp_repo.search_signals("unauthorized access")] == [sample_chain.id]
+    assert temp_repo.search_signals("unauthorized probe") == []
+
+def test_search_index_is_incremental_and_tracks_external_changes(temp_repo, sample_chain, monkeypatch):
+    path = temp_repo.save_chain(sample_chain)
+    parsed = []
+    original = loader.read_chain_file
+    monkeypatch.setattr(loader, "read_chain_file", lambda p, **kw: parsed.append(p) or original(p, **kw))
+
+    reopened = NexusRepository(data_dir=str(temp_repo.base_path))
+    assert len(reopened.search_signals("breach")) == 1
+    assert parsed == []
+
+    # Edited or deleted outside the repository: re-indexed on the next search
+    path.write_text(path.read_text(encoding="utf-8").replace("unauthorized", "suspicious"), encoding="utf-8")
+    assert len(reopened.search_signals("suspicious")) == 1 and parsed == [path]
+    path.unlink()
+    assert reopened.search_signals("suspicious") == []
+    assert reopened.search_signals("") == []
+
+def test_search_postings_persist_across_processes(temp_repo, sample_chain):
+    from chimera_nexus.storage.search import SignalIndex
+    temp_repo.save_chain(sample_chain)
+    temp_repo.append_mutations(sample_chain, nodes=[HybridNode(
+        domain=ThreatDomain.ECONOMIC, signal_type="bank_run", confidence=0.4, description="Queues outside a banking branch"
+    )])
+
+    # A fresh index answers from disk: no refresh, no chain files, nothing rebuilt
+    index = SignalIndex(temp_repo.base_path)
+    assert [h.signal_type for h in index.search("bank", prefix=True)] == ["bank_run"]
+    assert [h.signal_type for h in index.search("unauthorized")] == ["server_breach"]
+    plan = " ".join(str(row) for row in index._connect().execute(
+        "EXPLAIN QUERY PLAN SELECT row FROM terms WHERE term >= ? AND term < ?", ("bank", "banl")
+    ))
+    assert "SEARCH terms USING" in plan
+
+def test_append_reindexes_a_chain_edited_outside_the_repository(temp_repo, sample_chain):
+    path = temp_repo.save_chain(sample_chain)
+    temp_repo.search_signals("breach")
+    path.write_text(path.read_text(encoding="utf-8").replace("unauthorized", "suspicious"), encoding="utf-8")
+
+    chain = temp_repo.load_chain(sample_chain.id)
+    temp_repo.append_mutations(chain, nodes=[_make_node(signal_type="late_probe")])
+    assert len(temp_repo.search_signals("suspicious")) == 1
+    assert temp_repo.search_signals("unauthorized") == []
+    assert len(temp_repo.search_signals("late_probe")) == 1
+
+# --- Time Index Tests ---
+
+def _signal_at(hour, domain=ThreatDomain.CYBER):
+    from datetime import datetime
+    return HybridNode(domain=domain, timestamp=datetime(2026, 1, 1, hour), signal_type="timed_signal", confidence=0.5, description=f"At {hour}h")
+
+def test_chronological_nodes_are_maintained_incrementally():
+    chain = HybridThreatChain(name="Timeline")
+    late, early = _signal_at(9), _signal_at(3)
+    chain.add_node(late)
+    chain.add_node(early)
+    assert [n.id for n in chain.chronological_nodes()] == [early.id, late.id]
+
+    middle = _signal_at(5)
+    chain.add_node(middle)
+    moved = late.model_copy(update={"timestamp": _signal_at(1).timestamp})
+    chain.add_node(moved)
+    assert [n.id for n in chain.chronological_nodes()] == [late.id, early.id, middle.id]
+    chain.verify_metrics()
+    assert [n.id for n in chain.detached_copy().chronological_nodes()] == [late.id, early.id, middle.id]
+
+def test_chronology_orders_naive_and_aware_timestamps_together():
+    from datetime import datetime, timedelta, timezone
+    chain = HybridThreatChain(name="Mixed Clocks")
+    naive = _signal_at(4)
+    chain.add_node(naive)
+    chain.chronological_nodes()
+    # 05:00 at UTC+3 is 02:00 UTC, before the naive (UTC) 04:00 signal
+    aware = naive.model_copy(update={"id": uuid.uuid4(), "timestamp": datetime(2026, 1, 1, 5, tzinfo=timezone(timedelta(hours=3)))})
+    chain.add_node(aware)
+    assert [n.id for n in chain.chronological_nodes()] == [aware.id, naive.id]
+    chain.verify_metrics()
+
+def test_time_window_queries_span_chains(temp_repo):
+    from datetime import datetime, timedelta, timezone
+    first, second = HybridThreatChain(name="First"), HybridThreatChain(name="Second")
+    for hour in (1, 4, 7):
+        first.add_node(_signal_at(hour))
+    for hour in (2, 5):
+        second.add_node(_signal_at(hour, ThreatDomain.ECONOMIC))
+    temp_repo.save_chain(first)
+    temp_repo.save_chain(second)
+    temp_repo.append_mutations(second, nodes=[_signal_at(6, ThreatDomain.ECONOMIC)])
+
+    hits = list(temp_repo.signals_between(datetime(2026, 1, 1, 2), datetime(2026, 1, 1, 7)))
+    assert [h.timestamp.hour for h in hits] == [2, 4, 5, 6]
+    assert [h.chain_id for h in hits] == [second.id, first.id, second.id, second.id]
+    aware = datetime(2026, 1, 1, 5, tzinfo=timezone(timedelta(hours=1)))
+    assert [h.timestamp.hour for h in temp_repo.signals_between(since=aware, domains=[ThreatDomain.CYBER])] == [4, 7]
+
+    windows = temp_repo.signal_window_counts(timedelta(hours=3), since=datetime(2026, 1, 1), until=datetime(2026, 1, 1, 6), step=timedelta(hours=2))
+    assert [w.start.hour for w in windows] == [0, 2, 4]
+    assert [w.counts for w in windows] == [
+        {ThreatDomain.CYBER: 1, ThreatDomain.ECONOMIC: 1},
+        {ThreatDomain.CYBER: 1, ThreatDomain.ECONOMIC: 1},
+        {ThreatDomain.CYBER: 1, ThreatDomain.ECONOMIC: 2}
+    ]
+
+    # Served by the persisted time index: no scan of the registry, no sort per query
+    plan = " ".join(str(row) for row in temp_repo.search_index._connect().execute(
+        "EXPLAIN QUERY PLAN SELECT row FROM signals WHERE epoch >= ? AND epoch < ? ORDER BY epoch, chain_id, row", (0.0, 1.0)
+    ))
+    assert "idx_signals_time" in plan and "TEMP B-TREE" not in plan
+
+# --- Daemon Tests ---
+
+@pytest.fixture
+def running_daemon(temp_repo):
+    import threading
+    from chimera_nexus.service.daemon import NexusDaemon
+
+    daemon = NexusDaemon(temp_repo, flush_interval=0.01)
+    daemon.start(port=0)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon._server.shutdown()
+    thread.join()
+    daemon.close()
+
+def test_daemon_serves_writes_and_flushes_to_journal(running_daemon, temp_repo, sample_chain):
+    import threading
+    from chimera_nexus.service import DaemonError, NexusClient
+
+    temp_repo.save_chain(sample_chain)
+    chain_id = str(sample_chain.id)
+    client = NexusClient.discover(temp_repo.base_path)
+    assert client is not None and client.address == running_daemon.address
+
+    def add(worker):
+        with NexusClient(running_daemon.address, token=running_daemon.token) as c:
+            for i in range(10):
+                c.call("add_signal", chain_id=chain_id, node=_make_node(signal_type=f"probe_{worker}_{i}").model_dump(mode='json'))
+    threads = [threading.Thread(target=add, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert client.call("describe", chain_id=chain_id)["node_count"] == 41
+    first = next(iter(sample_chain.nodes))
+    added = uuid.UUID(client.call("add_signal", chain_id=chain_id, node=_make_node().model_dump(mode='json'))["node_id"])
+    edge = HybridEdge(source_id=first, target_id=added, relation_type=RelationType.ENABLEMENT, justification="Daemon link")
+    client.call("link", chain_id=chain_id, edge=edge.model_dump(mode='json'))
+    with pytest.raises(DaemonError, match="already exists"):
+        client.call("link", chain_id=chain_id, edge=edge.model_dump(mode='json'))
+    with pytest.raises(DaemonError, match="Invalid data"):
+        client.call("add_signal", chain_id=chain_id, node={"domain": "cyber"})
+    assert "probe_3_9" in client.call("export", chain_id=chain_id, format="md")["content"]
+    assert client.call("list")["chains"][0]["node_count"] == 42
+
+    client.call("flush")
+    on_disk = NexusRepository(data_dir=str(temp_repo.base_path)).load_chain(sample_chain.id)
+    assert len(on_disk.nodes) == 42 and on_disk.has_edge(first, added, RelationType.ENABLEMENT)
+    assert temp_repo._find_chain_file(sample_chain.id).with_suffix(".journal").exists()
+    client.close()
+
+def test_daemon_reloads_chains_changed_on_disk(running_daemon, temp_repo, sample_chain):
+    from chimera_nexus.service import NexusClient
+
+    temp_repo.save_chain(sample_chain)
+    with NexusClient(running_daemon.address, token=running_daemon.token) as client:
+        assert client.call("describe", chain_id=str(sample_chain.id))["node_count"] == 1
+        sample_chain.add_node(_make_node())
+        NexusRepository(data_dir=str(temp_repo.base_path)).save_chain(sample_chain)
+        assert client.call("describe", chain_id=str(sample_chain.id))["node_count"] == 2
+
+def test_tcp_daemon_requires_its_token(running_daemon, temp_repo):
+    import os
+    import stat
+    from chimera_nexus.service import DaemonError, NexusClient
+    from chimera_nexus.service.client import daemon_file_for
+
+    daemon_file = daemon_file_for(temp_repo.base_path)
+    if os.name == "posix":
+        assert stat.S_IMODE(daemon_file.stat().st_mode) == 0o600
+    assert json.loads(daemon_file.read_text())["token"] == running_daemon.token
+
+    for token in (None, "guess"):
+        with NexusClient(running_daemon.address, token=token) as client:
+            with pytest.raises(DaemonError, match="daemon token"):
+                client.call("ping")
+    with NexusClient.discover(temp_repo.base_path) as client:
+        assert client.call("ping")["pid"] == os.getpid()
+
+def test_unix_daemon_socket_is_owner_only(temp_repo):
+    import os
+    import socket
+    import stat
+    from chimera_nexus.service.daemon import NexusDaemon
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix sockets unavailable")
+    daemon = NexusDaemon(temp_repo)
+    address = daemon.start()
+    try:
+        assert daemon.token is None
+        assert stat.S_IMODE(os.stat(address[len("unix:"):]).st_mode) == 0o600
+    finally:
+        daemon.close()
+
+def test_daemon_drops_idle_chains_beyond_its_budget(temp_repo):
+    from chimera_nexus.service.daemon import NexusDaemon
+    from chimera_nexus.storage.cache import estimate_chain_bytes, estimate_node_bytes
+
+    chains = []
+    for i in range(4):
+        chain = HybridThreatChain(name=f"Hot {i}")
+        chain.add_node(_make_node())
+        temp_repo.save_chain(chain)
+        chains.append(chain)
+    added = _make_node()
+    # Room for two chains at a time, one of them with the added signal
+    daemon = NexusDaemon(temp_repo, max_bytes=2 * estimate_chain_bytes(chains[0]) + estimate_node_bytes(added) + 100)
+    daemon.handle({"op": "add_signal", "args": {"chain_id": str(chains[0].id), "node": added.model_dump(mode='json')}})
+    for chain in chains[1:]:
+        assert daemon.handle({"op": "describe", "args": {"chain_id": str(chain.id)}})["ok"]
+
+    # The unflushed chain stays, the least recently used idle ones go
+    assert list(daemon._hot) == [chains[0].id, chains[3].id]
+    daemon.flush()
+    assert daemon.handle({"op": "describe", "args": {"chain_id": str(chains[1].id)}})["result"]["node_count"] == 1
+    assert list(daemon._hot) == [chains[3].id, chains[1].id]
+    assert daemon.handle({"op": "describe", "args": {"chain_id": str(chains[0].id)}})["result"]["node_count"] == 2
+
+# --- Concurrent Writer Tests ---
+
+def test_save_chain_compare_and_swap(temp_repo, sample_chain):
+    from chimera_nexus.storage.repository import ConflictError
+
+    temp_repo.save_chain(sample_chain)
+    assert sample_chain.version == 1
+    mine = temp_repo.load_chain(sample_chain.id)
+    theirs = NexusRepository(data_dir=str(temp_repo.base_path)).load_chain(sample_chain.id)
+
+    theirs.add_node(_make_node(signal_type="their_signal"))
+    NexusRepository(data_dir=str(temp_repo.base_path)).save_chain(theirs)
+    mine.add_node(_make_node(signal_type="my_signal"))
+    with pytest.raises(ConflictError, match="version 2 on disk"):
+        temp_repo.save_chain(mine)
+
+    temp_repo.save_chain(mine, merge=True)
+    assert mine.version == 3
+    saved = temp_repo.load_chain(sample_chain.id)
+    assert {n.signal_type for n in saved.nodes.values()} == {"server_breach", "their_signal", "my_signal"}
+    assert saved.version == 3
+
+def test_failed_bookkeeping_keeps_the_committed_version(temp_repo, sample_chain, monkeypatch):
+    import chimera_nexus.storage.repository as repository_module
+
+    temp_repo.save_chain(sample_chain)
+    sample_chain.add_node(_make_node(signal_type="after_rename"))
+
+    def failing_checksum(path, raw):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(repository_module, "write_checksum", failing_checksum)
+        with pytest.raises(StorageError, match="saved as version 2"):
+            temp_repo.save_chain(sample_chain)
+    # The rename happened, so the copy in hand is the committed version
+    assert sample_chain.version == 2
+    assert NexusRepository(data_dir=str(temp_repo.base_path)).load_chain(sample_chain.id).version == 2
+
+    sample_chain.add_node(_make_node(signal_type="next_save"))
+    temp_repo.save_chain(sample_chain)
+    assert sample_chain.version == 3
+    assert len(temp_repo.load_chain(sample_chain.id).nodes) == 3
+
+def test_stale_append_merges_instead_of_losing_writes(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    stale = temp_repo.load_chain(sample_chain.id)
+    other = NexusRepository(data_dir=str(temp_repo.base_path))
+    other.append_mutations(other.load_chain(sample_chain.id), nodes=[_make_node(signal_type="first_writer")])
+
+    first = next(iter(stale.nodes))
+    added = _make_node(signal_type="second_writer")
+    temp_repo.append_mutations(stale, nodes=[added], edges=[HybridEdge(source_id=first, target_id=added.id, relation_type=RelationType.TRIGGERING, justification="Merged")])
+    assert {n.signal_type for n in stale.nodes.values()} == {"server_breach", "first_writer", "second_writer"}
+    assert stale.version == 3
+
+    reloaded = NexusRepository(data_dir=str(temp_repo.base_path)).load_chain(sample_chain.id)
+    assert reloaded.model_dump() == stale.model_dump()
+
+def _hammer_chain(data_dir, chain_id, worker, count, threshold):
+    repo = NexusRepository(data_dir=data_dir, journal_threshold=threshold)
+    # Loaded once and kept: every append after another process's commit is a conflict
+    chain = repo.load_chain(uuid.UUID(chain_id))
+    anchor = next(iter(chain.nodes))
+    for i in range(count):
+        node = _make_node(signal_type=f"worker_{worker}_{i}")
+        edge = HybridEdge(source_id=anchor, target_id=node.id, relation_type=RelationType.CORRELATION, justification=f"{worker}/{i}")
+        repo.append_mutations(chain, nodes=[node], edges=[edge])
+
+def test_concurrent_writers_lose_no_additions(temp_repo, sample_chain):
+    import multiprocessing
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs fork to run test-module workers")
+    context = multiprocessing.get_context("fork")
+
+    temp_repo.save_chain(sample_chain)
+    workers, count = 6, 15
+    processes = [
+        context.Process(target=_hammer_chain, args=(str(temp_repo.base_path), str(sample_chain.id), w, count, 4096 if w % 2 else 1 << 20))
+        for w in range(workers)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join(60)
+        assert p.exitcode == 0
+
+    chain = NexusRepository(data_dir=str(temp_repo.base_path)).load_chain(sample_chain.id)
+    expected = {f"worker_{w}_{i}" for w in range(workers) for i in range(count)}
+    assert {n.signal_type for n in chain.nodes.values()} == expected | {"server_breach"}
+    assert sorted(e.justification for e in chain.edges) == sorted(f"{w}/{i}" for w in range(workers) for i in range(count))
+    assert chain.version == 1 + workers * count
+
+# --- Chain History Tests ---
+
+def _history_objects(repo):
+    # A fresh store reads the persisted object index
+    return len(ChainHistory(repo.base_path).objects)
+
+def test_history_stores_each_node_once_and_rebuilds_versions(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    v1 = sample_chain.model_dump()
+    temp_repo.save_chain(sample_chain)  # Unchanged re-save: a new version, no new objects
+    assert _history_objects(temp_repo) == 1
+
+    node = _make_node(signal_type="followup_probe")
+    first = next(iter(sample_chain.nodes))
+    temp_repo.append_mutations(sample_chain, nodes=[node], edges=[HybridEdge(
+        source_id=first, target_id=node.id, relation_type=RelationType.ENABLEMENT, justification="Access enabled probing"
+    )])
+    sample_chain.name = "Renamed Operation"
+    temp_repo.save_chain(sample_chain)
+    assert _history_objects(temp_repo) == 3  # Two nodes and one edge, however many versions
+    # Objects live in one pack; only the version manifests are separate files
+    assert sorted(p.name for p in (temp_repo.base_path / "history").iterdir() if p.is_file()) == [
+        "objects.idx", "objects.lock", "objects.pack"
+    ]
+
+    versions = NexusRepository(data_dir=str(temp_repo.base_path)).history(sample_chain.id)
+    assert [(v.version, v.node_count, v.edge_count, v.kind) for v in versions] == [
+        (1, 1, 0, "save"), (2, 1, 0, "save"), (3, 2, 1, "append"), (4, 2, 1, "save")
+    ]
+    manifests = [json.loads((temp_repo.base_path / "history" / str(sample_chain.id) / f"{v}.json").read_text()) for v in range(1, 5)]
+    # Saves that only extend the previous version are stored as deltas; a rename is not
+    assert ["parent" in m for m in manifests] == [False, True, True, False]
+    assert temp_repo.load_version(sample_chain.id, 1).model_dump() == v1
+    rebuilt = temp_repo.load_version(sample_chain.id, 3)
+    assert rebuilt.name == "Test Operation" and rebuilt.edges == sample_chain.edges
+    assert temp_repo.load_version(sample_chain.id, 4).model_dump() == sample_chain.model_dump()
+
+    changes = temp_repo.diff_versions(sample_chain.id, 1, 4)
+    assert [n.signal_type for n in changes.added_nodes] == ["followup_probe"]
+    assert changes.added_edges == sample_chain.edges and not changes.removed_nodes
+    assert changes.header == {"name": ("Test Operation", "Renamed Operation")}
+    assert temp_repo.diff_versions(sample_chain.id, 1, 2).empty
+    with pytest.raises(StorageError, match="no recorded version 9"):
+        temp_repo.load_version(sample_chain.id, 9)
+
+def test_history_pack_survives_torn_index_and_other_writers(temp_repo, sample_chain):
+    temp_repo.save_chain(sample_chain)
+    # Simulate a writer that crashed part-way through an index entry
+    with open(temp_repo.base_path / "history" / "objects.idx", "ab") as f:
+        f.write(b"torn")
+    other = NexusRepository(data_dir=str(temp_repo.base_path))
+    chain = other.load_chain(sample_chain.id)
+    other.append_mutations(chain, nodes=[_make_node(signal_type="late_probe")])
+
+    # The first process learns of the other's objects from the index it appended to
+    assert [n.signal_type for n in temp_repo.diff_versions(sample_chain.id, 1, 2).added_nodes] == ["late_probe"]
+    assert temp_repo.load_version(sample_chain.id, 2).model_dump() == chain.model_dump()
+    assert _history_objects(temp_repo) == 2
+
+def test_history_cli_and_forced_restore(temp_repo, sample_chain, tmp_path):
+    from typer.testing import CliRunner
+    import chimera_nexus.cli.main as cli
+
+    temp_repo.save_chain(sample_chain)
+    sqlite = SQLiteNexusRepository(str(tmp_path / "backup.db"))
+    sqlite.import_from(temp_repo)
+    temp_repo.append_mutations(temp_repo.load_chain(sample_chain.id), nodes=[_make_node(signal_type="later_signal")])
+    # Restoring the backup replaces the newer state, which the history keeps
+    assert sqlite.export_to(temp_repo) == 1
+    sqlite.close()
+    assert len(temp_repo.load_chain(sample_chain.id).nodes) == 1
+
+    runner = CliRunner()
+    args = ["--data-dir", str(tmp_path), "--no-daemon"]
+    listing = runner.invoke(cli.app, args + ["history", str(sample_chain.id)])
+    assert listing.exit_code == 0
+    assert "append" in listing.output and "save" in listing.output
+    result = runner.invoke(cli.app, args + ["diff", str(sample_chain.id), "2"])
+    assert result.exit_code == 0
+    assert "version 2 → 3" in result.output and "later_signal" in result.output
+    assert "0 signal(s) added, 1 removed" in result.output